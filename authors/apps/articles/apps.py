@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+
+class ArticlesConfig(AppConfig):
+    name = 'authors.apps.articles'
+    verbose_name = 'Articles'
+
+    def ready(self):
+        from . import signals
@@ -0,0 +1,52 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from authors.apps.articles.utils.bulk_import import (IMPORT_CHUNK_SIZE,
+                                                     ArticleImport)
+from authors.apps.profiles.models import Profile
+
+
+class Command(BaseCommand):
+    """
+    Loads articles in bulk from an NDJSON file, one JSON object per line
+    with a title, description, body and optionally a tag_list and the
+    username of its author. Articles are inserted in chunks instead of
+    being saved one by one, so no notifications go out unless --notify is
+    given, and then as a single job once everything is in.
+    """
+    help = "Bulk import articles from an NDJSON file ('-' for stdin)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('path')
+        parser.add_argument(
+            '--author',
+            help="username credited with records that do not name one")
+        parser.add_argument('--chunk-size', type=int,
+                            default=IMPORT_CHUNK_SIZE)
+        parser.add_argument(
+            '--notify', action='store_true',
+            help="announce the imported articles to the authors' followers")
+
+    def handle(self, *args, **options):
+        default_author = None
+        if options['author']:
+            try:
+                default_author = Profile.objects.get(
+                    username=options['author'])
+            except Profile.DoesNotExist:
+                raise CommandError(
+                    f"No author is called {options['author']}")
+        article_import = ArticleImport(default_author=default_author,
+                                       chunk_size=options['chunk_size'],
+                                       notify=options['notify'])
+        if options['path'] == '-':
+            article_import.run(sys.stdin)
+        else:
+            with open(options['path'], encoding='utf-8') as lines:
+                article_import.run(lines)
+        for error in article_import.errors:
+            self.stderr.write(f"line {error['line']}: {error['errors']}")
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {article_import.imported} article(s), skipped "
+            f"{len(article_import.errors)} line(s)"))
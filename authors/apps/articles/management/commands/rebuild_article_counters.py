@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from authors.apps.articles.models import Article
+
+
+class Command(BaseCommand):
+    """
+    Recomputes the like, dislike, favorite, read and rating counters stored
+    on every article from the tables they summarise. Useful after loading
+    data behind the application's back or to repair drifted counters.
+    """
+    help = "Rebuild the engagement counters stored on articles"
+
+    def handle(self, *args, **options):
+        updated = Article.objects.rebuild_counters()
+        self.stdout.write(self.style.SUCCESS(
+            f"Rebuilt counters for {updated} article(s)"))
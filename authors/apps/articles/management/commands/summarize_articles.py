@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from authors.apps.articles.models import Article
+
+
+class Command(BaseCommand):
+    """
+    Recomputes the read time, word count and excerpt stored on every
+    article. Articles keep them current as they are saved; this fills them
+    in for rows written before they existed or behind the application's
+    back.
+    """
+    help = "Recompute the read time, word count and excerpt of articles"
+
+    def handle(self, *args, **options):
+        updated = Article.objects.summarize_bodies()
+        self.stdout.write(self.style.SUCCESS(
+            f"Summarized {updated} article(s)"))
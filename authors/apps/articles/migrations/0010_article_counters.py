@@ -0,0 +1,63 @@
+# Generated by Django 2.1.5 on 2026-10-18 13:24
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+
+def populate_counters(apps, schema_editor):
+    """fill the new counters in from the tables they summarise"""
+    Article = apps.get_model('articles', 'Article')
+    ReadStats = apps.get_model('articles', 'ReadStats')
+    Rating = apps.get_model('articles', 'Rating')
+
+    def total(model, aggregate=None):
+        return Coalesce(Subquery(
+            model.objects.filter(article=OuterRef('pk')).order_by()
+            .values('article').annotate(total=aggregate or Count('pk'))
+            .values('total'),
+            output_field=models.IntegerField()), 0)
+
+    Article.objects.update(
+        like_count=total(Article.liked_by.through),
+        dislike_count=total(Article.disliked_by.through),
+        favoritesCount=total(Article.favorited_by.through),
+        read_count=total(ReadStats),
+        rating_count=total(Rating),
+        rating_sum=total(Rating, Sum('rate_score')))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0009_merge_20190221_1542'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='dislike_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='like_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='rating_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='rating_sum',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='read_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
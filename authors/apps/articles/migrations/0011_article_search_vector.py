@@ -0,0 +1,65 @@
+# Generated by Django 2.1.5 on 2026-10-18 13:30
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+# weighted document: title (A) ranks above description (B) above body (C)
+SEARCH_VECTOR_SQL = """
+    setweight(to_tsvector('pg_catalog.english',
+                          coalesce({row}title, '')), 'A') ||
+    setweight(to_tsvector('pg_catalog.english',
+                          coalesce({row}description, '')), 'B') ||
+    setweight(to_tsvector('pg_catalog.english',
+                          coalesce({row}body, '')), 'C')
+"""
+
+CREATE_TRIGGER_SQL = """
+CREATE FUNCTION articles_article_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector := {vector};
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER articles_article_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF title, description, body
+    ON articles_article
+    FOR EACH ROW EXECUTE PROCEDURE articles_article_search_vector_update();
+
+UPDATE articles_article SET search_vector = {backfill};
+""".format(vector=SEARCH_VECTOR_SQL.format(row='NEW.'),
+           backfill=SEARCH_VECTOR_SQL.format(row=''))
+
+DROP_TRIGGER_SQL = """
+DROP TRIGGER IF EXISTS articles_article_search_vector_trigger
+    ON articles_article;
+DROP FUNCTION IF EXISTS articles_article_search_vector_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0010_article_counters'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name='article',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='articles_ar_search__95c6c6_gin'),
+        ),
+        migrations.RunSQL(CREATE_TRIGGER_SQL, DROP_TRIGGER_SQL),
+        # serves the trigram fallback on titles (the % operator)
+        migrations.RunSQL(
+            'CREATE INDEX articles_article_title_trgm '
+            'ON articles_article USING gin (title gin_trgm_ops);',
+            'DROP INDEX IF EXISTS articles_article_title_trgm;'),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 2.1.5 on 2026-10-18 13:32
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0011_article_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='article',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['tag_list'], name='articles_ar_tag_lis_10af86_gin'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 2.1.5 on 2026-10-18 13:37
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0012_article_tag_list_index'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='article',
+            options={'ordering': ['-created_at', '-id']},
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 2.1.5 on 2026-10-18 13:45
+
+from django.db import migrations, models
+
+from authors.apps.articles.utils import utils
+
+
+def summarize_bodies(apps, schema_editor):
+    """fill the new columns in for the articles already written"""
+    Article = apps.get_model('articles', 'Article')
+    for article in Article.objects.only('pk', 'body').iterator():
+        Article.objects.filter(pk=article.pk).update(
+            read_time=utils.get_article_read_time(article.body),
+            word_count=utils.get_article_word_count(article.body),
+            excerpt=utils.get_article_excerpt(article.body))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0013_article_ordering_id'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='excerpt',
+            field=models.TextField(blank=True, default=''),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='read_time',
+            field=models.CharField(default='0 min read', max_length=30),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='word_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(summarize_bodies, migrations.RunPython.noop),
+    ]
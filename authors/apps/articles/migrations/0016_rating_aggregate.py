@@ -0,0 +1,107 @@
+# Generated by Django 2.1.5 on 2026-10-18 14:16
+
+import authors.apps.articles.models
+from django.conf import settings
+import django.contrib.postgres.fields
+from django.db import migrations, models
+import django.db.models.deletion
+
+# keeps the latest rating where a user rated an article more than once
+DEDUPLICATE_RATINGS_SQL = """
+DELETE FROM articles_rating older USING articles_rating newer
+WHERE older.user_id = newer.user_id AND older.article_id = newer.article_id
+    AND older.id < newer.id;
+"""
+
+# moves the aggregate row of OLD's article out of OLD's score and into NEW's
+CREATE_TRIGGER_SQL = """
+CREATE FUNCTION articles_rating_aggregate_update() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.article_id IS NOT NULL
+            AND OLD.rate_score BETWEEN 1 AND 5 THEN
+        UPDATE articles_ratingaggregate
+        SET count = count - 1,
+            total = total - OLD.rate_score,
+            histogram[OLD.rate_score] = histogram[OLD.rate_score] - 1
+        WHERE article_id = OLD.article_id;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.article_id IS NOT NULL
+            AND NEW.rate_score BETWEEN 1 AND 5 THEN
+        INSERT INTO articles_ratingaggregate
+            (article_id, count, total, histogram)
+        VALUES (NEW.article_id, 0, 0, '{0,0,0,0,0}')
+        ON CONFLICT (article_id) DO NOTHING;
+        UPDATE articles_ratingaggregate
+        SET count = count + 1,
+            total = total + NEW.rate_score,
+            histogram[NEW.rate_score] = histogram[NEW.rate_score] + 1
+        WHERE article_id = NEW.article_id;
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER articles_rating_aggregate_trigger
+    AFTER INSERT OR UPDATE OF article_id, rate_score OR DELETE
+    ON articles_rating
+    FOR EACH ROW EXECUTE PROCEDURE articles_rating_aggregate_update();
+
+INSERT INTO articles_ratingaggregate (article_id, count, total, histogram)
+SELECT article_id, count(*), sum(rate_score),
+       ARRAY[count(*) FILTER (WHERE rate_score = 1),
+             count(*) FILTER (WHERE rate_score = 2),
+             count(*) FILTER (WHERE rate_score = 3),
+             count(*) FILTER (WHERE rate_score = 4),
+             count(*) FILTER (WHERE rate_score = 5)]
+FROM articles_rating
+WHERE article_id IS NOT NULL AND rate_score BETWEEN 1 AND 5
+GROUP BY article_id;
+"""
+
+DROP_TRIGGER_SQL = """
+DROP TRIGGER IF EXISTS articles_rating_aggregate_trigger ON articles_rating;
+DROP FUNCTION IF EXISTS articles_rating_aggregate_update();
+"""
+
+# on the way back, refills the article counters the aggregate replaced
+RESTORE_COUNTERS_SQL = """
+UPDATE articles_article article
+SET rating_count = aggregate.count, rating_sum = aggregate.total
+FROM articles_ratingaggregate aggregate
+WHERE aggregate.article_id = article.id;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('articles', '0015_remove_article_liked_by_disliked_by'),
+    ]
+
+    operations = [
+        migrations.RunSQL(DEDUPLICATE_RATINGS_SQL, migrations.RunSQL.noop),
+        migrations.AlterUniqueTogether(
+            name='rating',
+            unique_together={('user', 'article')},
+        ),
+        migrations.CreateModel(
+            name='RatingAggregate',
+            fields=[
+                ('article', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='rating_aggregate', serialize=False, to='articles.Article')),
+                ('count', models.IntegerField(default=0)),
+                ('total', models.IntegerField(default=0)),
+                ('histogram', django.contrib.postgres.fields.ArrayField(base_field=models.IntegerField(), default=authors.apps.articles.models.empty_histogram, size=5)),
+            ],
+        ),
+        migrations.RunSQL(CREATE_TRIGGER_SQL, DROP_TRIGGER_SQL),
+        migrations.RunSQL(migrations.RunSQL.noop, RESTORE_COUNTERS_SQL),
+        migrations.RemoveField(
+            model_name='article',
+            name='rating_count',
+        ),
+        migrations.RemoveField(
+            model_name='article',
+            name='rating_sum',
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 2.1.5 on 2026-10-18 14:20
+
+from django.conf import settings
+from django.db import migrations, models
+import django.utils.timezone
+
+# folds the repeated reads of an article by a user into their first read row,
+# carrying the latest read date over, then recounts the article readers
+MERGE_REPEATED_READS_SQL = """
+UPDATE articles_readstats reads SET last_read_date = latest.last_read_date
+FROM (SELECT user_id, article_id, max(read_date) AS last_read_date
+      FROM articles_readstats GROUP BY user_id, article_id) latest
+WHERE reads.user_id = latest.user_id AND reads.article_id = latest.article_id;
+
+DELETE FROM articles_readstats later USING articles_readstats earlier
+WHERE later.user_id = earlier.user_id AND later.article_id = earlier.article_id
+    AND later.id > earlier.id;
+
+UPDATE articles_article SET read_count = coalesce(
+    (SELECT count(*) FROM articles_readstats reads
+     WHERE reads.article_id = articles_article.id), 0);
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('articles', '0016_rating_aggregate'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='readstats',
+            name='last_read_date',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AlterField(
+            model_name='readstats',
+            name='read_date',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.RunSQL(MERGE_REPEATED_READS_SQL, migrations.RunSQL.noop),
+        migrations.AlterUniqueTogether(
+            name='readstats',
+            unique_together={('user', 'article')},
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 2.1.5 on 2026-10-18 14:29
+
+from django.conf import settings
+from django.db import migrations, models
+
+# keeps the first bookmark where a user bookmarked an article more than once
+DEDUPLICATE_BOOKMARKS_SQL = """
+DELETE FROM articles_bookmark later USING articles_bookmark earlier
+WHERE later.user_id = earlier.user_id AND later.article_id = earlier.article_id
+    AND later.id > earlier.id;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('articles', '0017_readstats_unique_reader'),
+    ]
+
+    operations = [
+        migrations.RunSQL(DEDUPLICATE_BOOKMARKS_SQL, migrations.RunSQL.noop),
+        migrations.AlterUniqueTogether(
+            name='bookmark',
+            unique_together={('user', 'article')},
+        ),
+        migrations.AddIndex(
+            model_name='bookmark',
+            index=models.Index(fields=['user', 'id'], name='articles_bo_user_id_1fba47_idx'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 2.1.5 on 2026-10-18 14:31
+
+from django.db import migrations
+
+# keeps the first report where a user reported an article more than once
+DEDUPLICATE_REPORTS_SQL = """
+DELETE FROM articles_report later USING articles_report earlier
+WHERE later.reporter_id = earlier.reporter_id
+    AND later.article_id = earlier.article_id AND later.id > earlier.id;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0003_merge_20190214_1334'),
+        ('articles', '0018_bookmark_unique_article'),
+    ]
+
+    operations = [
+        migrations.RunSQL(DEDUPLICATE_REPORTS_SQL, migrations.RunSQL.noop),
+        migrations.AlterUniqueTogether(
+            name='report',
+            unique_together={('reporter', 'article')},
+        ),
+    ]
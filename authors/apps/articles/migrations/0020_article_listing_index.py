@@ -0,0 +1,17 @@
+# Generated by Django 2.1.5 on 2026-10-18 16:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0019_report_unique_reporter'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['-created_at', '-id'], name='articles_ar_created_a3d32e_idx'),
+        ),
+    ]
@@ -1,32 +1,169 @@
 from django.conf import settings
-from django.db import models
-from django.db.models.signals import pre_save
+from django.contrib.contenttypes.fields import GenericRelation
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import connections, models, transaction
+from django.db.models import Count, Max, OuterRef, Prefetch, Subquery
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.utils import timezone
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from psycopg2.extras import execute_values
 from rest_framework.reverse import reverse
 
 from ..profiles import models as ProfileModel
+from ..reactions.models import Reaction
 from .utils import utils
+from .utils.response_cache import (invalidate_all_article_responses,
+                                   invalidate_article_responses)
 
 from ..authentication.models import User
-from .utils.utils import get_average_rate
 
 
 class ArticleManager(models.Manager):
     """
     ArticleManager class is a custom Article model manager
     """
+    # counters only ever shown to the author, cached anonymous responses
+    # do not depend on them
+    private_counters = {'read_count'}
+    # relies on the unique (article_id, profile_id) pair of the M2M table
+    favorite_sql = """
+        INSERT INTO {table} (article_id, profile_id) VALUES (%s, %s)
+        ON CONFLICT (article_id, profile_id) DO NOTHING
+    """
+
+    def adjust_counters(self, article_id, **deltas):
+        """
+        adjust_counters moves the given counter columns of an article by the
+        given amounts in a single UPDATE and returns their new values, or
+        None if there is no such article. The arithmetic happens in the
+        database, so concurrent writers cannot overwrite each other's changes
+        """
+        quote = connections[self.db].ops.quote_name
+        columns = [quote(self.model._meta.get_field(field).column)
+                   for field in deltas]
+        sql = 'UPDATE {table} SET {changes} WHERE {pk} = %s ' \
+            'RETURNING slug, author_id, {columns}'.format(
+                table=quote(self.model._meta.db_table),
+                pk=quote(self.model._meta.pk.column),
+                changes=', '.join(f'{column} = {column} + %s'
+                                  for column in columns),
+                columns=', '.join(columns))
+        with connections[self.db].cursor() as cursor:
+            cursor.execute(sql, [*deltas.values(), article_id])
+            row = cursor.fetchone()
+        if row is None:
+            return None
+        slug, author_id, *values = row
+        if 'like_count' in deltas:
+            # likes on an article count towards its author's profile
+            ProfileModel.ProfileStats.objects.adjust(
+                author_id, likes_received=deltas['like_count'])
+        if set(deltas) - self.private_counters:
+            invalidate_article_responses(slug)
+        return dict(zip(deltas, values))
 
     def toggle_favorite(self, user, article, is_favoriting):
         """
         toggle_favorite method adds user to favorited_by if they favorite an
-        article or removes user from favorited_by if the unfavorite an article
+        article or removes user from favorited_by if the unfavorite an article.
+        The membership row is written with a single conditional INSERT or
+        DELETE, which fires no signals, and the article's favoritesCount is
+        updated in place only when the membership actually changed
+        """
+        through = Article.favorited_by.through
+        with transaction.atomic(using=self.db):
+            if is_favoriting:
+                with connections[self.db].cursor() as cursor:
+                    cursor.execute(
+                        self.favorite_sql.format(
+                            table=through._meta.db_table),
+                        [article.pk, user.pk])
+                    delta = cursor.rowcount
+            else:
+                delta = -through.objects.filter(
+                    article_id=article.pk, profile_id=user.pk).delete()[0]
+            if delta:
+                counters = self.adjust_counters(article.pk,
+                                                favoritesCount=delta)
+                article.favoritesCount = counters['favoritesCount']
+
+    def add_reaction(self, user, article, action):
+        """
+        add_reaction records that a user likes or dislikes an article,
+        replacing their opposite reaction if they had one
+        """
+        return Reaction.objects.react(user, article, Reaction.named(action))
+
+    def remove_reaction(self, user, article, action):
+        """
+        remove_reaction undoes a user's like or dislike of an article
+        """
+        return Reaction.objects.unreact(user, article, Reaction.named(action))
+
+    def rebuild_counters(self):
+        """
+        rebuild_counters recomputes every article's counters from the tables
+        they summarise and returns the number of articles updated
+        """
+        updated = self.get_queryset().update(
+            like_count=Reaction.objects.total_per_target(
+                Article, Reaction.LIKE),
+            dislike_count=Reaction.objects.total_per_target(
+                Article, Reaction.DISLIKE),
+            favoritesCount=_total_per_article(Article.favorited_by.through),
+            read_count=_total_per_article(ReadStats))
+        RatingAggregate.objects.rebuild()
+        invalidate_all_article_responses()
+        return updated
+
+    def summarize_bodies(self):
         """
-        if user not in article.favorited_by.all() and is_favoriting:
-            article.favorited_by.add(user)
-        if user in article.favorited_by.all() and not is_favoriting:
-            article.favorited_by.remove(user)
-        article.favoritesCount = article.favorited_by.all().count()
-        article.save()
+        summarize_bodies recomputes the stored read time, word count and
+        excerpt of every article, one article in memory at a time, and
+        returns the number of articles updated
+        """
+        updated = 0
+        articles = self.get_queryset().only('pk', 'body').order_by()
+        for article in articles.iterator(chunk_size=500):
+            article.summarize_body()
+            self.filter(pk=article.pk).update(
+                read_time=article.read_time, word_count=article.word_count,
+                excerpt=article.excerpt)
+            updated += 1
+        invalidate_all_article_responses()
+        return updated
+
+    def for_display(self):
+        """
+        for_display returns articles with everything the ArticleSerializer
+        renders resolved up front: the author is joined in, and the author
+        summaries and the viewer's relationships are resolved per page by
+        the list serializer. Serializing a page of these costs the same
+        number of queries whatever its size.
+        """
+        return self.get_queryset().select_related(
+            'author', 'rating_aggregate').\
+            prefetch_related(
+                Prefetch('favorited_by',
+                         queryset=ProfileModel.Profile.objects.only('pk')),
+            )
+
+
+def _total_per_article(model):
+    """
+    _total_per_article builds a correlated COUNT of the rows of `model`
+    pointing at the outer article.
+    Separate subqueries keep the totals independent of each other, which
+    joining every relation in one query would not.
+    """
+    return Coalesce(Subquery(
+        model.objects.filter(article=OuterRef('pk')).order_by()
+        .values('article').annotate(total=Count('pk'))
+        .values('total'),
+        output_field=models.IntegerField()), 0)
 
 
 class Article(models.Model):
@@ -39,6 +176,11 @@ class Article(models.Model):
                                           blank=True,
                                           related_name="favorited_by")
     favoritesCount = models.IntegerField(default=0)
+    # engagement counters, kept in step with their source tables by
+    # ArticleManager.adjust_counters and rebuilt by rebuild_counters
+    like_count = models.IntegerField(default=0)
+    dislike_count = models.IntegerField(default=0)
+    read_count = models.IntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True, null=True)
     image = models.ImageField(
@@ -47,28 +189,44 @@ class Article(models.Model):
     author = models.ForeignKey(ProfileModel.Profile,
                                on_delete=models.CASCADE)
     body = models.TextField()
+    # derived from the body whenever the article is saved, see
+    # summarize_body
+    read_time = models.CharField(max_length=30, default='0 min read')
+    word_count = models.IntegerField(default=0)
+    excerpt = models.TextField(blank=True, default='')
     # article tags
     tag_list = ArrayField(
         models.CharField(max_length=200),
         blank=True,
         default=list)
-    # users that liked this article
-    liked_by = models.ManyToManyField(to=settings.AUTH_USER_MODEL,
-                                      related_name='liked_articles',
-                                      related_query_name='liked_article')
-    # users that disliked this article
-    disliked_by = models.ManyToManyField(to=settings.AUTH_USER_MODEL,
-                                         related_name='disliked_articles',
-                                         related_query_name='disliked_article')
+    # likes and dislikes of this article
+    reactions = GenericRelation(Reaction, related_query_name='article')
+    # weighted title, description and body lexemes for full-text search.
+    # A database trigger keeps this up to date on every insert and update
+    search_vector = SearchVectorField(null=True, editable=False)
 
     objects = ArticleManager()
 
     class Meta:
         """Meta class difines extra functions to be ran on the DB
         'ordering = -created_at' ensures that the ordering of articles
-        should in a descending order.
+        should in a descending order, newest id first among equal timestamps.
         """
-        ordering = ['-created_at']
+        ordering = ['-created_at', '-id']
+        indexes = [GinIndex(fields=['search_vector']),
+                   GinIndex(fields=['tag_list']),
+                   # serves every page of the listing in that order
+                   models.Index(fields=['-created_at', '-id'])]
+
+    def summarize_body(self):
+        """
+        summarize_body works out the read time, word count and excerpt of
+        the body so they are stored with the article instead of being
+        recomputed each time it is rendered
+        """
+        self.read_time = utils.get_article_read_time(self.body)
+        self.word_count = utils.get_article_word_count(self.body)
+        self.excerpt = utils.get_article_excerpt(self.body)
 
     def is_liked_by(self, user):
         """
@@ -76,7 +234,7 @@ class Article(models.Model):
         :param user: the user we are checking for
         :return: boolean, indicating whether or not the user liked the article
         """
-        return user.liked_articles.filter(pk=self.pk).exists()
+        return Reaction.objects.reaction_of(user, self) == Reaction.LIKE
 
     def is_disliked_by(self, user):
         """
@@ -84,15 +242,7 @@ class Article(models.Model):
         :param user: the user we are checking for
         :return: boolean: whether or not the user disliked the article
         """
-        return user.disliked_articles.filter(pk=self.pk).exists()
-
-    @property
-    def like_count(self):
-        return self.liked_by.count()
-
-    @property
-    def dislike_count(self):
-        return self.disliked_by.count()
+        return Reaction.objects.reaction_of(user, self) == Reaction.DISLIKE
 
     def __str__(self):
         return self.title
@@ -100,13 +250,13 @@ class Article(models.Model):
     @property
     def average_ratings(self):
         """
-        Calculates average of a reviewed article
+        Reads the average of a reviewed article off its rating aggregate
         Returns: average rate score
         """
-        return get_average_rate(
-            model=Rating,
-            article=self.pk
-        )
+        try:
+            return int(self.rating_aggregate.average)
+        except ObjectDoesNotExist:
+            return 0
 
     @property
     def url(self):
@@ -114,6 +264,60 @@ class Article(models.Model):
                                       kwargs={'slug': self.slug})
 
 
+class ReadStatsManager(models.Manager):
+    """
+    ReadStatsManager class is a custom ReadStats model manager
+    """
+    # records a batch of reads in one statement: new readers are inserted
+    # and counted against their articles, returning readers only move their
+    # last read date. Reads of articles or by users deleted since the read
+    # was buffered are dropped
+    record_sql = """
+        WITH reads (user_id, article_id, read_date, last_read_date) AS (
+            VALUES %s
+        ), recorded AS (
+            INSERT INTO {table} (user_id, article_id, read_date,
+                                 last_read_date)
+            SELECT reads.user_id, reads.article_id, reads.read_date,
+                   reads.last_read_date
+            FROM reads
+            JOIN {articles} article ON article.id = reads.article_id
+            JOIN {users} reader ON reader.id = reads.user_id
+            ON CONFLICT (user_id, article_id) DO UPDATE
+                SET last_read_date = GREATEST({table}.last_read_date,
+                                              EXCLUDED.last_read_date)
+            RETURNING article_id, xmax = 0 AS created
+        )
+        UPDATE {articles} SET read_count = read_count + new_readers.total
+        FROM (SELECT article_id, count(*) AS total FROM recorded
+              WHERE created GROUP BY article_id) new_readers
+        WHERE {articles}.id = new_readers.article_id
+    """
+
+    def record_reads(self, events):
+        """
+        record_reads stores a batch of (user id, article id, read at) events,
+        as collected by the ReadEventBuffer, with a single upsert
+        """
+        reads = {}
+        for user_id, article_id, read_at in events:
+            first, last = reads.get((user_id, article_id), (read_at, read_at))
+            reads[user_id, article_id] = (min(first, read_at),
+                                          max(last, read_at))
+        if not reads:
+            return
+        sql = self.record_sql.format(table=self.model._meta.db_table,
+                                     articles=Article._meta.db_table,
+                                     users=User._meta.db_table)
+        with connections[self.db].cursor() as cursor:
+            execute_values(
+                cursor.cursor, sql,
+                [(user_id, article_id, first, last)
+                 for (user_id, article_id), (first, last) in reads.items()],
+                template='(%s, %s, %s::timestamptz, %s::timestamptz)',
+                page_size=len(reads))
+
+
 class ReadStats(models.Model):
     """
     Class to hold data from the stats of the article
@@ -121,7 +325,28 @@ class ReadStats(models.Model):
     article = models.ForeignKey(Article, on_delete=models.CASCADE,
                                 blank=True)
     user = models.ForeignKey(User, on_delete=models.CASCADE)
-    read_date = models.DateTimeField(auto_now_add=True)
+    # the user's first and latest reads of the article
+    read_date = models.DateTimeField(default=timezone.now)
+    last_read_date = models.DateTimeField(default=timezone.now)
+
+    objects = ReadStatsManager()
+
+    class Meta:
+        unique_together = ('user', 'article')
+
+
+def read_stats_post_save_receiver(sender, instance, created, **kwargs):
+    # counts a new reader against the article
+    if created:
+        Article.objects.adjust_counters(instance.article_id, read_count=1)
+
+
+def read_stats_post_delete_receiver(sender, instance, **kwargs):
+    Article.objects.adjust_counters(instance.article_id, read_count=-1)
+
+
+post_save.connect(read_stats_post_save_receiver, sender=ReadStats)
+post_delete.connect(read_stats_post_delete_receiver, sender=ReadStats)
 
 
 def article_pre_save_receiver(sender, instance, *args, **kwargs):
@@ -129,16 +354,47 @@ def article_pre_save_receiver(sender, instance, *args, **kwargs):
     article_pre_save_reciever generates a unique slug for an article
     create_slug function cretes are slug based on the article title
     unique_random_string function generates a random string
+    It also refreshes the stored read time, word count and excerpt
     """
     slug = utils.create_slug(instance)
     random_string = utils.unique_random_string()
     if not instance.slug:
         instance.slug = f'{slug}-{random_string}'
+    instance.summarize_body()
 
 
 pre_save.connect(article_pre_save_receiver, sender=Article)
 
 
+class RatingManager(models.Manager):
+    """
+    RatingManager class is a custom Rating model manager
+    """
+    # a user's first rating of an article inserts the row, any later one
+    # overwrites its score. xmax is 0 only on rows the statement inserted
+    rate_sql = """
+        INSERT INTO {table} (user_id, article_id, rate_score)
+        VALUES (%s, %s, %s)
+        ON CONFLICT (user_id, article_id) DO UPDATE
+            SET rate_score = EXCLUDED.rate_score
+        RETURNING xmax = 0
+    """
+
+    def rate(self, user, article, rate_score):
+        """
+        rate records a user's score for an article in a single upsert and
+        returns True if it is their first rating of it. The article's
+        RatingAggregate is kept in step by a database trigger
+        """
+        with connections[self.db].cursor() as cursor:
+            cursor.execute(
+                self.rate_sql.format(table=self.model._meta.db_table),
+                [user.pk, article.pk, rate_score])
+            created, = cursor.fetchone()
+        invalidate_article_responses(article.slug)
+        return created
+
+
 class Rating(models.Model):
     """
     Authenticated users can rate an article on a scale of 1 to 5
@@ -150,6 +406,165 @@ class Rating(models.Model):
                                 blank=True, null=True)
     user = models.ForeignKey(User, on_delete=models.CASCADE)
 
+    objects = RatingManager()
+
+    class Meta:
+        unique_together = ('user', 'article')
+
+
+def rating_changed_receiver(sender, instance, **kwargs):
+    # the trigger has already moved the aggregate, cached responses
+    # showing the old average have to go
+    if instance.article_id:
+        slug = Article.objects.filter(pk=instance.article_id).values_list(
+            'slug', flat=True).first()
+        if slug:
+            invalidate_article_responses(slug)
+
+
+post_save.connect(rating_changed_receiver, sender=Rating)
+post_delete.connect(rating_changed_receiver, sender=Rating)
+
+
+class RatingAggregateManager(models.Manager):
+    """
+    RatingAggregateManager class is a custom RatingAggregate model manager
+    """
+    rebuild_sql = """
+        DELETE FROM {aggregate};
+        INSERT INTO {aggregate} (article_id, count, total, histogram)
+        SELECT article_id, count(*), sum(rate_score),
+               ARRAY[count(*) FILTER (WHERE rate_score = 1),
+                     count(*) FILTER (WHERE rate_score = 2),
+                     count(*) FILTER (WHERE rate_score = 3),
+                     count(*) FILTER (WHERE rate_score = 4),
+                     count(*) FILTER (WHERE rate_score = 5)]
+        FROM {rating}
+        WHERE article_id IS NOT NULL AND rate_score BETWEEN 1 AND 5
+        GROUP BY article_id;
+    """
+
+    def rebuild(self):
+        """
+        rebuild recomputes every article's rating aggregate from the ratings
+        """
+        with transaction.atomic(using=self.db), \
+                connections[self.db].cursor() as cursor:
+            cursor.execute(self.rebuild_sql.format(
+                aggregate=self.model._meta.db_table,
+                rating=Rating._meta.db_table))
+
+
+def empty_histogram():
+    return [0] * 5
+
+
+class RatingAggregate(models.Model):
+    """
+    The number, sum and 1 to 5 distribution of an article's ratings. A
+    database trigger on the ratings table keeps it up to date on every
+    insert, update and delete, so averages and distributions are read from
+    this one row however many ratings there are
+    """
+    article = models.OneToOneField(Article, on_delete=models.CASCADE,
+                                   primary_key=True,
+                                   related_name='rating_aggregate')
+    count = models.IntegerField(default=0)
+    total = models.IntegerField(default=0)
+    # histogram[0] holds the number of 1 star ratings, histogram[4] of 5s
+    histogram = ArrayField(models.IntegerField(), size=5,
+                           default=empty_histogram)
+
+    objects = RatingAggregateManager()
+
+    @property
+    def average(self):
+        if not self.count:
+            return 0
+        return self.total / self.count
+
+    def distribution(self):
+        """
+        distribution maps each score from 1 to 5 to its number of ratings
+        """
+        return {score: total
+                for score, total in enumerate(self.histogram, start=1)}
+
+
+class BookmarkManager(models.Manager):
+    """
+    BookmarkManager class is a custom Bookmark model manager
+    """
+    # bookmarks the article unless the user already has; a row comes back
+    # only when the bookmark was made
+    add_sql = """
+        INSERT INTO {table} (user_id, article_id) VALUES (%s, %s)
+        ON CONFLICT (user_id, article_id) DO NOTHING
+        RETURNING id
+    """
+    # bookmarks every existing article among the slugs and returns each of
+    # them with whether it was newly bookmarked
+    add_many_sql = """
+        WITH found AS (
+            SELECT id, slug FROM {articles} WHERE slug = ANY(%s)
+        ), added AS (
+            INSERT INTO {table} (user_id, article_id)
+            SELECT %s, id FROM found
+            ON CONFLICT (user_id, article_id) DO NOTHING
+            RETURNING article_id
+        )
+        SELECT slug, id IN (SELECT article_id FROM added) FROM found
+    """
+    # removes the user's bookmarks of the slugs, returning the slugs removed
+    remove_many_sql = """
+        DELETE FROM {table} bookmark USING {articles} article
+        WHERE bookmark.article_id = article.id AND bookmark.user_id = %s
+            AND article.slug = ANY(%s)
+        RETURNING article.slug
+    """
+
+    def execute(self, sql, params):
+        with connections[self.db].cursor() as cursor:
+            cursor.execute(sql.format(table=self.model._meta.db_table,
+                                      articles=Article._meta.db_table),
+                           params)
+            return cursor.fetchall()
+
+    def add(self, user, article):
+        """
+        add bookmarks an article for a user in a single statement and
+        returns whether it was not bookmarked already
+        """
+        return bool(self.execute(self.add_sql, [user.pk, article.pk]))
+
+    def sync(self, user, add=(), remove=()):
+        """
+        sync bookmarks and unbookmarks many articles, named by slug, for a
+        user in one statement each. It returns the slugs that were added,
+        those that were removed and those naming no article
+        """
+        with transaction.atomic(using=self.db):
+            found = dict(self.execute(self.add_many_sql,
+                                      [list(add), user.pk])) if add else {}
+            removed = [slug for slug, in self.execute(
+                self.remove_many_sql, [user.pk, list(remove)])] \
+                if remove else []
+        return {
+            'added': [slug for slug in add if found.get(slug)],
+            'removed': removed,
+            'not_found': [slug for slug in add if slug not in found],
+        }
+
+    def for_listing(self, user):
+        """
+        for_listing returns a user's bookmarks joined to just the article
+        and author columns a listing shows, in a single query
+        """
+        return self.get_queryset().filter(user=user).select_related(
+            'article__author__user').only(
+                'article__slug', 'article__title', 'article__description',
+                'article__author__user__username', 'user_id')
+
 
 class Bookmark(models.Model):
     """
@@ -159,6 +574,62 @@ class Bookmark(models.Model):
                                 related_name='is_bookmarked')
     user = models.ForeignKey(User, on_delete=models.CASCADE)
 
+    objects = BookmarkManager()
+
+    class Meta:
+        unique_together = ('user', 'article')
+        # serves a user's bookmarks newest first, page by page
+        indexes = [models.Index(fields=['user', 'id'])]
+
+
+class ReportManager(models.Manager):
+    """
+    ReportManager class is a custom Report model manager
+    """
+    # the reasons most often given for each of the articles, compared
+    # regardless of case and surrounding blanks, ties going to the latest
+    top_reasons_sql = """
+        SELECT article_id, reason, total FROM (
+            SELECT article_id, lower(btrim(reason)) AS reason,
+                   count(*) AS total,
+                   row_number() OVER (
+                       PARTITION BY article_id
+                       ORDER BY count(*) DESC, max(created_at) DESC) AS rank
+            FROM {table} WHERE article_id = ANY(%s)
+            GROUP BY article_id, lower(btrim(reason))
+        ) ranked
+        WHERE rank <= %s
+        ORDER BY article_id, rank
+    """
+
+    def moderation_queue(self):
+        """
+        moderation_queue returns the reported articles, each with its
+        report count and latest report time aggregated in SQL, loading only
+        the columns an article summary needs
+        """
+        return Article.objects.filter(report__isnull=False).annotate(
+            report_count=Count('report'),
+            latest_report_at=Max('report__created_at'),
+        ).select_related('author').only(
+            'slug', 'title', 'author__username').order_by()
+
+    def top_reasons(self, article_ids, limit=3):
+        """
+        top_reasons maps each of the articles to its `limit` most given
+        report reasons with how often they were given, in one query
+        """
+        reasons = {article_id: [] for article_id in article_ids}
+        if not reasons:
+            return reasons
+        with connections[self.db].cursor() as cursor:
+            cursor.execute(
+                self.top_reasons_sql.format(table=self.model._meta.db_table),
+                [list(reasons), limit])
+            for article_id, reason, total in cursor.fetchall():
+                reasons[article_id].append({'reason': reason, 'count': total})
+        return reasons
+
 
 class Report(models.Model):
     reporter = models.ForeignKey(ProfileModel.Profile,
@@ -170,5 +641,10 @@ class Report(models.Model):
     reason = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = ReportManager()
+
+    class Meta:
+        unique_together = ('reporter', 'article')
+
     def __str__(self):
         return self.article.title
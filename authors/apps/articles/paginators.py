@@ -1,5 +1,7 @@
 from rest_framework.pagination import LimitOffsetPagination
 
+from ..core.pagination import OptInCursorPagination
+
 
 class ArticleLimitOffsetPagination(LimitOffsetPagination):
     """ Class that will set article endpoint to only
@@ -8,3 +10,44 @@ class ArticleLimitOffsetPagination(LimitOffsetPagination):
 
     default_limit = 10
     offset_query_param = "offset"
+
+    def get_paginated_response(self, data):
+        """
+        reports `count_is_capped` along with the count of a search, whose
+        count stops at SEARCH_RESULT_LIMIT
+        """
+        response = super().get_paginated_response(data)
+        if hasattr(self.request, 'search_count_is_capped'):
+            response.data['count_is_capped'] = \
+                self.request.search_count_is_capped
+        return response
+
+
+class ArticlePagination(OptInCursorPagination):
+    """
+    Pages articles by offset, or by (created_at, id) cursor on request.
+    Search results are paged by cursor in rank order instead, keyed on the
+    `search_position` ArticleSearch annotates them with
+    """
+    fallback_class = ArticleLimitOffsetPagination
+    search_ordering = ('search_position', 'id')
+
+    def get_ordering(self, request, queryset, view):
+        if 'search_position' in queryset.query.annotations:
+            return self.search_ordering
+        return super().get_ordering(request, queryset, view)
+
+
+class BookmarkCursorPagination(OptInCursorPagination):
+    """
+    Bookmarks carry no timestamp; their ids grow in the order they were made
+    """
+    ordering = ('-id',)
+
+
+class ReportPagination(OptInCursorPagination):
+    """
+    Pages an article's reports by offset, or by (created_at, id) cursor on
+    request
+    """
+    fallback_class = ArticleLimitOffsetPagination
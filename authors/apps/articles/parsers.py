@@ -0,0 +1,13 @@
+from rest_framework.parsers import BaseParser
+
+
+class NDJSONParser(BaseParser):
+    """
+    NDJSONParser accepts newline delimited JSON without reading the whole
+    body up front: the parsed data is the request itself, whose lines are
+    decoded one record at a time by whoever iterates it
+    """
+    media_type = 'application/x-ndjson'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        return stream if stream is not None else []
@@ -1,25 +1,64 @@
+from django.db.models import Manager
+from django.urls import reverse
 from rest_framework import serializers
 
 from . import models
 from ..profiles import serializers as ProfileSerializers
-from .utils.utils import (get_article_read_time, get_articles_url,
-                          get_sharing_links)
+from .utils.utils import get_articles_url, get_sharing_links
+from .utils.viewer_state import ArticleViewerState
 from authors.apps.authentication.models import User
 
 
-class ArticleSerializer (serializers.ModelSerializer):
+class ArticleViewerStateListSerializer(
+        ProfileSerializers.AuthorSummaryListSerializer):
+    """
+    ArticleViewerStateListSerializer resolves how the requesting user relates
+    to every article on the page, and to their authors, before serializing
+    the items, so that the per-row viewer fields become lookups
+    """
+
+    def to_representation(self, data):
+        items = list(data.all() if isinstance(data, Manager) else data)
+        self.context['article_viewer_state'] = ArticleViewerState(
+            self.context['request'].user,
+            [self.child.get_article_id(item) for item in items])
+        return super().to_representation(items)
+
+
+class ArticleViewerStateMixin:
+    """
+    ArticleViewerStateMixin gives serializers access to the viewer state of
+    the article behind the object being serialized. Lists resolve it for the
+    whole page up front; single objects resolve it on first use.
+    """
+
+    def get_article_id(self, obj):
+        return obj.pk
+
+    def viewer_has(self, relation, obj):
+        article_id = self.get_article_id(obj)
+        state = self.context.get('article_viewer_state')
+        if state is None or not state.covers(article_id):
+            state = ArticleViewerState(self.context['request'].user,
+                                       [article_id])
+            self.context['article_viewer_state'] = state
+        return state.has(relation, article_id)
+
+
+class ArticleSerializer (ArticleViewerStateMixin,
+                         serializers.ModelSerializer):
     """The ArticleSerializer class is a model serializer class that
     specifies fields to render to the user for reteriving, updating
     or creating an article. It specifies only four read_only fields
     author field, slug field, created_at field and updated_at fields
     as these fields data is auto generated
     """
-    author = ProfileSerializers.ProfileSerializer(read_only=True)
+    author = ProfileSerializers.AuthorSummarySerializer(read_only=True)
     favorited = serializers.SerializerMethodField()
     liked = serializers.SerializerMethodField()
     disliked = serializers.SerializerMethodField()
-    average_ratings = serializers.IntegerField(required=False)
-    read_time = serializers.SerializerMethodField()
+    bookmarked = serializers.SerializerMethodField()
+    average_ratings = serializers.IntegerField(read_only=True)
     share_links = serializers.SerializerMethodField()
     read_stats = serializers.SerializerMethodField()
     has_reported = serializers.SerializerMethodField()
@@ -42,9 +81,12 @@ class ArticleSerializer (serializers.ModelSerializer):
             "favorited_by",
             "favoritesCount",
             "favorited",
+            "bookmarked",
             "average_ratings",
             "tag_list",
             "read_time",
+            "word_count",
+            "excerpt",
             "share_links",
             'read_stats',
             'has_reported'
@@ -53,51 +95,58 @@ class ArticleSerializer (serializers.ModelSerializer):
             'author',
             'slug',
             'created_at',
-            'updated_at'
+            'updated_at',
             'like_count',
             'dislike_count',
+            'favoritesCount',
             'read_stats',
+            'read_time',
+            'word_count',
+            'excerpt',
         )
+        list_serializer_class = ArticleViewerStateListSerializer
+
+    def get_fields(self):
+        fields = super().get_fields()
+        # summary listings make do with the excerpt and never load the body
+        if self.context.get('summary'):
+            fields.pop('body')
+        return fields
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        # search results carry a highlighted excerpt of the matching body
+        if hasattr(instance, 'search_highlight'):
+            data['search_highlight'] = instance.search_highlight
+        return data
 
     def get_favorited(self, obj):
         """
         This method returns True is the logged in user favorited the article
         otherwise it returns False.
         """
-        if self.context["request"].user.is_anonymous:
-            return False
-        if self.context["request"].user.profile in obj.favorited_by.all():
-            return True
-        return False
-        extra_kwargs = {
-            "author": {"read_only": True},
-            "slug": {"read_only": True}
-        }
+        return self.viewer_has('favorited', obj)
 
     def get_liked(self, obj):
         """
         This method returns True if the logged in user liked the article
         otherwise it returns False.
         """
-        if self.context["request"].user.is_anonymous:
-            return False
-        if self.context["request"].user in obj.liked_by.all():
-            return True
-        return False
+        return self.viewer_has('liked', obj)
 
     def get_disliked(self, obj):
         """
         This method returns True if the logged in user disliked the article
         otherwise it returns False.
         """
-        if self.context["request"].user.is_anonymous:
-            return False
-        if self.context["request"].user in obj.disliked_by.all():
-            return True
-        return False
+        return self.viewer_has('disliked', obj)
 
-    def get_read_time(self, obj):
-        return get_article_read_time(obj.body)
+    def get_bookmarked(self, obj):
+        """
+        This method returns True if the logged in user bookmarked the article
+        otherwise it returns False.
+        """
+        return self.viewer_has('bookmarked', obj)
 
     def get_share_links(self, obj):
         return get_sharing_links(obj, self.context['request'])
@@ -106,15 +155,10 @@ class ArticleSerializer (serializers.ModelSerializer):
         request = self.context.get('request', None)
         if request.user.username != obj.author.username:
             return None
-        return models.ReadStats.objects.filter(article=obj).count()
+        return obj.read_count
 
     def get_has_reported(self, obj):
-        request = self.context.get('request')
-        if request.user.is_anonymous:
-            return False
-        reports = obj.report_set.all()
-        reporters = [report.reporter.username for report in reports]
-        return True if request.user.username in reporters else False
+        return self.viewer_has('reported', obj)
 
 
 class ArticleRatingSerializer(serializers.ModelSerializer):
@@ -141,18 +185,36 @@ class ArticleRatingSerializer(serializers.ModelSerializer):
         return obj.article.average_ratings
 
 
-class BookmarkSerializer(serializers.ModelSerializer):
+class BookmarkSerializer(ArticleViewerStateMixin,
+                         serializers.ModelSerializer):
     slug = serializers.SerializerMethodField()
     description = serializers.SerializerMethodField()
     title = serializers.SerializerMethodField()
     author = serializers.SerializerMethodField()
     article_url = serializers.SerializerMethodField()
+    liked = serializers.SerializerMethodField()
+    disliked = serializers.SerializerMethodField()
+    favorited = serializers.SerializerMethodField()
 
     class Meta:
         model = models.Bookmark
         fields = (
-            "slug", "title", "description", "author", "article_url"
+            "slug", "title", "description", "author", "article_url",
+            "liked", "disliked", "favorited"
         )
+        list_serializer_class = ArticleViewerStateListSerializer
+
+    def get_article_id(self, obj):
+        return obj.article_id
+
+    def get_liked(self, obj):
+        return self.viewer_has('liked', obj)
+
+    def get_disliked(self, obj):
+        return self.viewer_has('disliked', obj)
+
+    def get_favorited(self, obj):
+        return self.viewer_has('favorited', obj)
 
     def get_slug(self, obj):
         return obj.article.slug
@@ -170,6 +232,26 @@ class BookmarkSerializer(serializers.ModelSerializer):
         return get_articles_url(obj, self.context['request'])
 
 
+class BookmarkSyncSerializer(serializers.Serializer):
+    """
+    Validates a batch of bookmark changes: the slugs of the articles to
+    bookmark and of those to unbookmark
+    """
+    add = serializers.ListField(child=serializers.SlugField(),
+                                max_length=1000, default=list)
+    remove = serializers.ListField(child=serializers.SlugField(),
+                                   max_length=1000, default=list)
+
+    def validate(self, data):
+        both = set(data['add']) & set(data['remove'])
+        if both:
+            raise serializers.ValidationError(
+                f"Cannot both add and remove {', '.join(sorted(both))}")
+        data['add'] = list(dict.fromkeys(data['add']))
+        data['remove'] = list(dict.fromkeys(data['remove']))
+        return data
+
+
 class ReadStatsSerializer(serializers.ModelSerializer):
     """
     Serializer to handle data from the ReadStats models
@@ -178,14 +260,91 @@ class ReadStatsSerializer(serializers.ModelSerializer):
         model = models.ReadStats
         fields = ('user',
                   'article',
-                  'read_date',)
+                  'read_date',
+                  'last_read_date',)
         read_only_fields = ("user", "article")
 
 
-class ArticleReporterSerializer(serializers.ModelSerializer):
-    reporter = ProfileSerializers.ProfileSerializer(read_only=True)
+class ArticleReporterSerializer(ArticleViewerStateMixin,
+                                serializers.ModelSerializer):
+    """
+    A report with the reported article in full. Lists resolve the viewer's
+    relationships to every reported article of the page at once, and the
+    nested articles read them from there
+    """
+    reporter = ProfileSerializers.AuthorSummarySerializer(read_only=True)
     article = ArticleSerializer(read_only=True)
 
     class Meta:
         model = models.Report
         fields = ('id', 'reporter', 'article', 'reason',)
+        list_serializer_class = ArticleViewerStateListSerializer
+
+    def get_article_id(self, obj):
+        return obj.article_id
+
+
+class ArticleImportSerializer(serializers.ModelSerializer):
+    """
+    Validates one record of a bulk article import. `author` names the
+    author by username; records without one are credited to the importer
+    """
+    author = serializers.CharField(max_length=50, required=False)
+
+    class Meta:
+        model = models.Article
+        fields = ('title', 'description', 'body', 'tag_list', 'author')
+
+
+class ReportedArticleListSerializer(serializers.ListSerializer):
+    """
+    ReportedArticleListSerializer looks up the top report reasons of every
+    article on the page in one query before serializing the items
+    """
+
+    def to_representation(self, data):
+        items = list(data)
+        self.context['top_reasons'] = models.Report.objects.top_reasons(
+            [item.pk for item in items])
+        return super().to_representation(items)
+
+
+class ReportedArticleSerializer(serializers.ModelSerializer):
+    """
+    A moderation queue entry: a summary of a reported article with how
+    often, how recently and why it was reported
+    """
+    author = serializers.CharField(source='author.username', read_only=True)
+    report_count = serializers.IntegerField(read_only=True)
+    latest_report_at = serializers.DateTimeField(read_only=True)
+    top_reasons = serializers.SerializerMethodField()
+    reports_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = models.Article
+        fields = ('slug', 'title', 'author', 'report_count',
+                  'latest_report_at', 'top_reasons', 'reports_url')
+        list_serializer_class = ReportedArticleListSerializer
+
+    def get_top_reasons(self, obj):
+        reasons = self.context.get('top_reasons')
+        if reasons is None or obj.pk not in reasons:
+            reasons = models.Report.objects.top_reasons([obj.pk])
+            self.context['top_reasons'] = reasons
+        return reasons[obj.pk]
+
+    def get_reports_url(self, obj):
+        return self.context['request'].build_absolute_uri(
+            reverse('articles:article-reports', kwargs={'slug': obj.slug}))
+
+
+class ReportSummarySerializer(serializers.ModelSerializer):
+    """
+    One report on an article as the moderation queue drills down to it
+    """
+    reporter = serializers.CharField(source='reporter.username',
+                                     read_only=True)
+
+    class Meta:
+        model = models.Report
+        fields = ('id', 'reporter', 'reason', 'created_at')
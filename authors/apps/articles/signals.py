@@ -1,8 +1,15 @@
 """Signal dispatchers and handlers for the articles module"""
-from django.db.models.signals import post_save
+from django.db.models import F, Subquery
+from django.db.models.signals import (m2m_changed, post_delete, post_save,
+                                      pre_delete)
 from django.dispatch import receiver, Signal
 
 from authors.apps.articles.models import Article
+from authors.apps.articles.utils.response_cache import (
+    invalidate_article_responses, invalidate_author_responses)
+from authors.apps.articles.utils.search import invalidate_search_cache
+from authors.apps.articles.utils.tags import invalidate_tag_cache
+from authors.apps.profiles.models import Profile, ProfileStats
 
 # our custom signal that will be sent when a new article is published
 # we could have stuck to using the post_save signal and receiving it in the
@@ -23,3 +30,54 @@ def on_article_post_save(sender, **kwargs):
         # actually happened
         article_published_signal.send(ArticlesSignalSender,
                                       article=kwargs['instance'])
+
+
+@receiver(post_save, sender=Article)
+@receiver(post_delete, sender=Article)
+def on_article_changed(sender, **kwargs):
+    """cached responses, search results and tag counts may no longer hold
+    once an article changes"""
+    invalidate_article_responses(kwargs['instance'].slug)
+    invalidate_search_cache()
+    invalidate_tag_cache()
+
+
+@receiver(post_save, sender=Article)
+def on_article_created(sender, instance, created, **kwargs):
+    """counts a new article on its author's profile"""
+    if created:
+        ProfileStats.objects.adjust(instance.author_id, articles_count=1)
+
+
+@receiver(pre_delete, sender=Article)
+def on_article_deleted(sender, instance, **kwargs):
+    """
+    takes a deleted article and its likes off its author's profile, reading
+    its like count from the row before it goes. The stats row is only
+    updated, never created: when the author is being deleted too, theirs
+    may already be gone and must not come back
+    """
+    like_count = Article.objects.filter(pk=instance.pk).values('like_count')
+    ProfileStats.objects.filter(pk=instance.author_id).update(
+        articles_count=F('articles_count') - 1,
+        likes_received=F('likes_received') - Subquery(like_count))
+
+
+@receiver(post_save, sender=Profile)
+@receiver(m2m_changed, sender=Profile.follows.through)
+def on_author_changed(sender, instance, action='post_save', pk_set=None,
+                      reverse=False, **kwargs):
+    """
+    every article embeds its author's summary, follow counts included, so
+    saving a profile or changing whom it follows retires the cached
+    responses that show the profiles involved
+    """
+    if action == 'pre_clear':
+        # the cleared rows are gone by post_clear, so gather them now
+        mine, theirs = (('to_profile', 'from_profile_id') if reverse
+                        else ('from_profile', 'to_profile_id'))
+        pk_set = Profile.follows.through.objects.filter(
+            **{mine: instance}).values_list(theirs, flat=True)
+    elif action not in ('post_save', 'post_add', 'post_remove'):
+        return
+    invalidate_author_responses({instance.pk} | set(pk_set or ()))
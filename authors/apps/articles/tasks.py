@@ -0,0 +1,19 @@
+from celery import shared_task
+
+from .models import Article, ReadStats
+from .signals import ArticlesSignalSender, article_published_signal
+
+
+@shared_task
+def record_reads(events):
+    """stores a batch of buffered (user id, article id, read at) events"""
+    ReadStats.objects.record_reads(events)
+
+
+@shared_task
+def announce_articles(article_ids):
+    """sends the publish notifications of bulk imported articles"""
+    articles = Article.objects.filter(pk__in=article_ids).select_related(
+        'author').order_by()
+    for article in articles.iterator():
+        article_published_signal.send(ArticlesSignalSender, article=article)
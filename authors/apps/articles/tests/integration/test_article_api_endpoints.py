@@ -4,6 +4,7 @@ from rest_framework import status
 
 from authors.apps.articles.tests import base_class
 from ..test_data import test_article_data
+from ...models import Article
 
 
 class TestArticleAPIEndpoints(base_class.BaseTest):
@@ -33,7 +34,7 @@ class TestArticleAPIEndpoints(base_class.BaseTest):
         self.assertEqual(self.article.is_disliked_by(self.user), False)
 
     def test_like_then_dislike_undoes_the_like(self):
-        self.article.liked_by.add(self.user)
+        Article.objects.add_reaction(self.user, self.article, 'like')
         self.assertEqual(self.article.is_liked_by(self.user), True)
         self.assertEqual(self.article.is_disliked_by(self.user), False)
         response = self.client.post(
@@ -43,7 +44,7 @@ class TestArticleAPIEndpoints(base_class.BaseTest):
         self.assertEqual(self.article.is_disliked_by(self.user), True)
 
     def test_dislike_then_like_undoes_the_dislike(self):
-        self.article.disliked_by.add(self.user)
+        Article.objects.add_reaction(self.user, self.article, 'dislike')
         self.assertEqual(self.article.is_disliked_by(self.user), True)
         self.assertEqual(self.article.is_liked_by(self.user), False)
         response = self.client.post(self.like_article_url(self.article.slug))
@@ -55,11 +56,13 @@ class TestArticleAPIEndpoints(base_class.BaseTest):
         self.assertEqual(self.article.like_count, 0)
         # first like
         self.client.post(self.like_article_url(self.article.slug))
+        self.article.refresh_from_db()
         self.assertEqual(self.article.like_count, 1)
         user2 = self.create_article_and_authenticate_test_user_2()
         self.client.force_authenticate(user2)
         # second like
         self.client.post(self.like_article_url(self.article.slug))
+        self.article.refresh_from_db()
         self.assertEqual(self.article.like_count, 2)
 
     def test_user_can_the_number_of_people_that_liked_an_article(self):
@@ -1,3 +1,4 @@
+from django.test import override_settings
 from django.urls import reverse
 
 from rest_framework import status
@@ -8,6 +9,7 @@ from ..models import Article
 from urllib.parse import quote
 
 
+@override_settings(CELERY_TASK_ALWAYS_EAGER=True)
 class TestArticleView(base_class.BaseTest):
     """
     This Test class tests the api endpoints for article
@@ -239,7 +241,7 @@ class TestArticleLikeDislikeArticleViews(base_class.BaseTest):
         """a user should get the correct like status for an article
         they do like
         """
-        self.article.liked_by.add(self.user)
+        Article.objects.add_reaction(self.user, self.article, 'like')
         response = self.client.get(
             self.is_liked_article_url(self.article.slug))
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -258,7 +260,7 @@ class TestArticleLikeDislikeArticleViews(base_class.BaseTest):
         """a user should get the correct like status
         for an article they do dislike
         """
-        self.article.disliked_by.add(self.user)
+        Article.objects.add_reaction(self.user, self.article, 'dislike')
         response = self.client.get(
             self.is_disliked_article_url(self.article.slug))
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -0,0 +1,72 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from authors.apps.articles.models import Article
+from authors.apps.profiles.models import Profile
+from . import base_class
+
+LONG_BODY = '<p>' + ' '.join(f'word{i}' for i in range(300)) + '</p>'
+
+
+class TestArticleBodySummary(base_class.BaseTest):
+    """
+    Tests that read time, word count and excerpt are stored when an article
+    is saved and served from there
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.user = self.activated_user()
+        self.article = Article.objects.create(
+            title='whale', description='fish', body=LONG_BODY,
+            author=Profile.objects.get(user=self.user))
+
+    def test_summary_is_stored_when_the_article_is_saved(self):
+        self.assertEqual(self.article.word_count, 300)
+        self.assertEqual(self.article.read_time, '2 min read')
+        self.assertTrue(self.article.excerpt.startswith('word0 word1'))
+        self.assertTrue(self.article.excerpt.endswith('word39…'))
+
+    def test_summary_follows_edits_to_the_body(self):
+        self.article.body = 'In water'
+        self.article.save()
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.word_count, 2)
+        self.assertEqual(self.article.excerpt, 'In water')
+
+    def test_rendering_does_not_recompute_the_read_time(self):
+        with patch('readtime.of_text') as of_text:
+            response = self.client.get(self.articles_url)
+        of_text.assert_not_called()
+        self.assertEqual(response.data['results'][0]['read_time'],
+                         '2 min read')
+
+    def test_summary_listing_swaps_the_body_for_the_excerpt(self):
+        response = self.client.get(self.articles_url, {'summary': 'true'})
+        article = response.data['results'][0]
+        self.assertNotIn('body', article)
+        self.assertEqual(article['excerpt'], self.article.excerpt)
+
+    def test_command_fills_in_existing_articles(self):
+        Article.objects.update(read_time='0 min read', word_count=0,
+                               excerpt='')
+        out = StringIO()
+        call_command('summarize_articles', stdout=out)
+        self.assertIn('Summarized 1 article(s)', out.getvalue())
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.word_count, 300)
+        self.assertEqual(self.article.read_time, '2 min read')
+
+    def test_summary_listing_does_not_load_bodies(self):
+        for _ in range(3):
+            self.create_article(self.user)
+        with CaptureQueriesContext(connection) as full:
+            self.client.get(self.articles_url)
+        with CaptureQueriesContext(connection) as summary:
+            self.client.get(self.articles_url, {'summary': 'true'})
+        self.assertEqual(len(summary.captured_queries),
+                         len(full.captured_queries))
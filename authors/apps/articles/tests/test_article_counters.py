@@ -0,0 +1,82 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.urls import reverse
+
+from authors.apps.articles.models import (Article, Rating,
+                                          RatingAggregate, ReadStats)
+from authors.apps.articles.utils.read_events import read_events
+from . import base_class
+
+
+class TestArticleCounters(base_class.BaseTest):
+    """
+    Tests that the engagement counters stored on an article follow every
+    write path and can be rebuilt from their source tables
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.author, self.article = \
+            self.create_article_and_authenticate_test_user()
+        self.reader = self.create_another_user_in_db()
+
+    def test_switching_reaction_moves_the_counters(self):
+        Article.objects.add_reaction(self.reader, self.article, 'like')
+        Article.objects.add_reaction(self.reader, self.article, 'like')
+        self.article.refresh_from_db()
+        self.assertEqual((self.article.like_count,
+                          self.article.dislike_count), (1, 0))
+        Article.objects.add_reaction(self.reader, self.article, 'dislike')
+        self.article.refresh_from_db()
+        self.assertEqual((self.article.like_count,
+                          self.article.dislike_count), (0, 1))
+        Article.objects.remove_reaction(self.reader, self.article, 'dislike')
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.dislike_count, 0)
+
+    def test_favorites_count_follows_toggling(self):
+        profile = self.reader.profile
+        Article.objects.toggle_favorite(profile, self.article, True)
+        Article.objects.toggle_favorite(profile, self.article, True)
+        self.assertEqual(self.article.favoritesCount, 1)
+        Article.objects.toggle_favorite(profile, self.article, False)
+        self.assertEqual(self.article.favoritesCount, 0)
+
+    def test_ratings_and_reads_update_the_counters(self):
+        Rating.objects.create(user=self.reader, article=self.article,
+                              rate_score=4)
+        Rating.objects.create(user=self.author, article=self.article,
+                              rate_score=1)
+        ReadStats.objects.create(user=self.reader, article=self.article)
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.rating_aggregate.count, 2)
+        self.assertEqual(self.article.rating_aggregate.total, 5)
+        self.assertEqual(self.article.average_ratings, 2)
+        self.assertEqual(self.article.read_count, 1)
+
+    def test_article_view_counts_a_read_once(self):
+        self.client.force_authenticate(user=self.reader)
+        url = reverse('articles:article-details',
+                      kwargs={'slug': self.article.slug})
+        read_events.drain()
+        self.client.get(url)
+        self.client.get(url)
+        ReadStats.objects.record_reads(read_events.drain())
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.read_count, 1)
+
+    def test_rebuild_counters_command_repairs_drift(self):
+        Article.objects.add_reaction(self.reader, self.article, 'like')
+        Rating.objects.create(user=self.reader, article=self.article,
+                              rate_score=3)
+        Article.objects.filter(pk=self.article.pk).update(like_count=10)
+        RatingAggregate.objects.filter(article=self.article).update(
+            count=0, total=0)
+        output = StringIO()
+        call_command('rebuild_article_counters', stdout=output)
+        self.assertIn("Rebuilt counters for 1 article(s)", output.getvalue())
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.like_count, 1)
+        self.assertEqual(self.article.rating_aggregate.count, 1)
+        self.assertEqual(self.article.rating_aggregate.total, 3)
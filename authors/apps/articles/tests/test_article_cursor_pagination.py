@@ -0,0 +1,76 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from authors.apps.articles.models import Article, Bookmark
+from . import base_class
+
+
+class TestArticleCursorPagination(base_class.BaseTest):
+    """
+    Tests paging through articles and bookmarks by cursor
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.user = self.activated_user()
+        self.articles = [self.create_article(self.user) for _ in range(5)]
+
+    def walk(self, url, params, key='results'):
+        slugs, response = [], self.client.get(url, params)
+        while True:
+            self.assertEqual(response.status_code, 200)
+            slugs += [item['slug'] for item in response.data[key]]
+            if not response.data['next']:
+                return slugs
+            response = self.client.get(response.data['next'])
+
+    def test_cursor_pages_cover_every_article_newest_first(self):
+        slugs = self.walk(self.articles_url,
+                          {'pagination': 'cursor', 'limit': 2})
+        self.assertEqual(slugs, [a.slug for a in reversed(self.articles)])
+
+    def test_cursor_pages_are_stable_under_new_inserts(self):
+        first = self.client.get(self.articles_url,
+                                {'pagination': 'cursor', 'limit': 2})
+        self.create_article(self.user)
+        second = self.client.get(first.data['next'])
+        self.assertEqual([a['slug'] for a in second.data['results']],
+                         [a.slug for a in reversed(self.articles[1:3])])
+
+    def test_page_boundaries_between_articles_of_the_same_time(self):
+        Article.objects.update(created_at=timezone.now())
+        newest_first = sorted(self.articles, key=lambda a: a.id,
+                              reverse=True)
+        slugs = self.walk(self.articles_url,
+                          {'pagination': 'cursor', 'limit': 2})
+        self.assertEqual(slugs, [a.slug for a in newest_first])
+        first = self.client.get(self.articles_url,
+                                {'pagination': 'cursor', 'limit': 2})
+        second = self.client.get(first.data['next'])
+        back = self.client.get(second.data['previous'])
+        self.assertEqual([a['slug'] for a in back.data['results']],
+                         [a['slug'] for a in first.data['results']])
+
+    def test_cursor_pages_do_not_count_rows(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.articles_url,
+                                       {'pagination': 'cursor'})
+        self.assertNotIn('count', response.data)
+        self.assertFalse(any('COUNT(*)' in query['sql']
+                             for query in context.captured_queries))
+
+    def test_offset_pagination_remains_the_default(self):
+        response = self.client.get(self.articles_url, {'limit': 2})
+        self.assertEqual(response.data['count'], 5)
+
+    def test_bookmarks_can_be_paged_by_cursor(self):
+        self.client.force_authenticate(user=self.user)
+        for article in self.articles:
+            Bookmark.objects.create(article=article, user=self.user)
+        response = self.client.get(reverse('bookmarks'),
+                                   {'pagination': 'cursor', 'limit': 3})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['results']), 3)
+        self.assertIsNotNone(response.data['next'])
@@ -0,0 +1,66 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from authors.apps.authentication.models import User
+from authors.apps.articles.models import Article, Rating, Report
+from . import base_class
+
+
+class TestArticleQueryCount(base_class.BaseTest):
+    """
+    Tests that listing articles costs a fixed number of queries regardless
+    of how many articles are on the page or how much activity each has
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.user = self.activated_user()
+        self.reader = self.create_another_user_in_db()
+
+    def add_engaged_article(self, index):
+        article = self.create_article(self.user)
+        fan = User.objects.create_user(username=f'fan{index}',
+                                       email=f'fan{index}@mail.com',
+                                       password='ia83naJS')
+        Article.objects.add_reaction(self.reader, article, 'like')
+        Article.objects.add_reaction(fan, article, 'like')
+        Article.objects.toggle_favorite(self.reader.profile, article, True)
+        Rating.objects.create(user=fan, article=article, rate_score=4)
+        Report.objects.create(reporter=fan.profile, article=article,
+                              reason="spam")
+        fan.profile.follow(self.user.profile)
+        return article
+
+    def count_list_queries(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.articles_url)
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries)
+
+    def test_list_query_count_does_not_grow_with_page_size_anonymous(self):
+        self.add_engaged_article(0)
+        single_article_queries = self.count_list_queries()
+        for index in range(1, 5):
+            self.add_engaged_article(index)
+        self.assertEqual(self.count_list_queries(), single_article_queries)
+
+    def test_list_query_count_does_not_grow_with_page_size_logged_in(self):
+        self.client.force_authenticate(user=self.reader)
+        self.add_engaged_article(0)
+        single_article_queries = self.count_list_queries()
+        for index in range(1, 5):
+            self.add_engaged_article(index)
+        self.assertEqual(self.count_list_queries(), single_article_queries)
+
+    def test_list_resolves_viewer_state_and_counts(self):
+        self.client.force_authenticate(user=self.reader)
+        self.add_engaged_article(0)
+        article = self.client.get(self.articles_url).data['results'][0]
+        self.assertTrue(article['liked'])
+        self.assertTrue(article['favorited'])
+        self.assertFalse(article['disliked'])
+        self.assertFalse(article['has_reported'])
+        self.assertEqual(article['like_count'], 2)
+        self.assertEqual(article['average_ratings'], 4)
+        self.assertEqual(article['author']['followers_count'], 1)
+        self.assertFalse(article['author']['following'])
@@ -0,0 +1,88 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from authors.apps.articles.models import Article, Rating
+from authors.apps.authentication.models import User
+from . import base_class
+
+
+@override_settings(ARTICLE_RESPONSE_CACHE_ALLOW_LOCAL=True)
+class TestArticleResponseCache(base_class.BaseTest):
+    """
+    Tests that anonymous article list and detail responses are cached and
+    retired when what they show changes
+    """
+
+    def setUp(self):
+        super().setUp()
+        # cached results would otherwise outlive the rolled back test data
+        cache.clear()
+        self.user = self.activated_user()
+        self.reader = self.create_another_user_in_db()
+        self.article = self.create_article(self.user)
+        self.detail_url = self.article_url(self.article.slug)
+
+    def queries_for(self, url, params=None):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries)
+
+    def test_repeated_anonymous_reads_are_served_from_the_cache(self):
+        self.client.get(self.articles_url, {'limit': 5, 'offset': 0})
+        self.client.get(self.detail_url)
+        self.assertEqual(
+            self.queries_for(self.articles_url, {'offset': 0, 'limit': 5}), 0)
+        self.assertEqual(self.queries_for(self.detail_url), 0)
+
+    def test_authenticated_reads_are_not_cached(self):
+        self.client.force_authenticate(user=self.reader)
+        self.client.get(self.detail_url)
+        self.assertGreater(self.queries_for(self.detail_url), 0)
+
+    def test_reactions_and_ratings_retire_cached_responses(self):
+        self.client.get(self.detail_url)
+        Article.objects.add_reaction(self.reader, self.article, 'like')
+        Rating.objects.create(user=self.reader, article=self.article,
+                              rate_score=4)
+        response = self.client.get(self.detail_url)
+        self.assertEqual(response.data['like_count'], 1)
+        self.assertEqual(response.data['average_ratings'], 4)
+        listed = self.client.get(self.articles_url).data['results'][0]
+        self.assertEqual(listed['like_count'], 1)
+
+    def test_editing_an_article_retires_cached_responses(self):
+        self.client.get(self.detail_url)
+        self.article.title = 'dolphin'
+        self.article.save()
+        self.assertEqual(self.client.get(self.detail_url).data['title'],
+                         'dolphin')
+
+    def test_following_an_author_retires_cached_responses(self):
+        self.client.get(self.detail_url)
+        self.reader.profile.follow(self.user.profile)
+        author = self.client.get(self.detail_url).data['author']
+        self.assertEqual(author['followers_count'], 1)
+
+    def test_following_retires_only_the_responses_showing_the_profiles(self):
+        other = self.create_article(self.reader)
+        other_url = self.article_url(other.slug)
+        self.client.get(other_url)
+        self.client.get(self.detail_url)
+        third = User.objects.create_user(
+            username='third', email='third@mail.com', password='ia83naJS')
+        self.user.profile.follow(third.profile)
+        self.assertEqual(self.queries_for(other_url), 0)
+        self.assertGreater(self.queries_for(self.detail_url), 0)
+
+    def test_responses_are_not_cached_on_a_per_process_backend(self):
+        with override_settings(ARTICLE_RESPONSE_CACHE_ALLOW_LOCAL=False):
+            self.client.get(self.detail_url)
+            self.assertGreater(self.queries_for(self.detail_url), 0)
+
+    def test_reads_do_not_retire_cached_responses(self):
+        self.client.get(self.detail_url)
+        Article.objects.adjust_counters(self.article.pk, read_count=1)
+        self.assertEqual(self.queries_for(self.detail_url), 0)
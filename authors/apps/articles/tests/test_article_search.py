@@ -0,0 +1,91 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from authors.apps.articles.models import Article
+from authors.apps.profiles.models import Profile
+from . import base_class
+
+
+class TestArticleSearch(base_class.BaseTest):
+    """
+    Tests the full-text search behind ?search= on the articles endpoint
+    """
+
+    def setUp(self):
+        super().setUp()
+        # cached results would otherwise outlive the rolled back test data
+        cache.clear()
+        self.user = self.activated_user()
+        self.profile = Profile.objects.get(user=self.user)
+
+    def write_article(self, title, description, body):
+        return Article.objects.create(title=title, description=description,
+                                      body=body, author=self.profile)
+
+    def search(self, terms):
+        response = self.client.get(self.articles_url, {'search': terms})
+        self.assertEqual(response.status_code, 200)
+        return response.data['results']
+
+    def test_title_matches_rank_above_body_matches(self):
+        body_match = self.write_article(
+            'Gardening', 'weekend hobbies', 'Compost keeps kubernetes away')
+        title_match = self.write_article(
+            'Kubernetes in production', 'operations', 'Clusters and pods')
+        results = self.search('kubernetes')
+        self.assertEqual([article['slug'] for article in results],
+                         [title_match.slug, body_match.slug])
+
+    def test_cursor_pages_keep_the_rank_order(self):
+        title_match = self.write_article(
+            'Kubernetes in production', 'operations', 'Clusters and pods')
+        body_match = self.write_article(
+            'Gardening', 'weekend hobbies', 'Compost keeps kubernetes away')
+        response = self.client.get(self.articles_url, {
+            'search': 'kubernetes', 'pagination': 'cursor', 'limit': 1})
+        slugs = [article['slug'] for article in response.data['results']]
+        response = self.client.get(response.data['next'])
+        slugs += [article['slug'] for article in response.data['results']]
+        self.assertEqual(slugs, [title_match.slug, body_match.slug])
+        self.assertIsNone(response.data['next'])
+
+    def test_results_carry_highlighted_snippets(self):
+        self.write_article('Gardening', 'hobbies', 'Compost feeds the soil')
+        results = self.search('compost')
+        self.assertIn('<mark>Compost</mark>', results[0]['search_highlight'])
+
+    def test_misspelt_query_falls_back_to_similar_titles(self):
+        article = self.write_article(
+            'Kubernetes in production', 'operations', 'Clusters and pods')
+        results = self.search('kubernetis production')
+        self.assertEqual(results[0]['slug'], article.slug)
+
+    def test_repeated_search_is_answered_from_the_cache(self):
+        self.write_article('Gardening', 'hobbies', 'Compost feeds the soil')
+        self.search('Compost  ')
+        with CaptureQueriesContext(connection) as context:
+            self.search('compost')
+        self.assertFalse(any('to_tsquery' in query['sql'] and 'ts_rank'
+                             in query['sql']
+                             for query in context.captured_queries))
+
+    def test_saving_an_article_invalidates_cached_results(self):
+        self.write_article('Gardening', 'hobbies', 'Compost feeds the soil')
+        self.assertEqual(len(self.search('compost')), 1)
+        self.write_article('Composting', 'hobbies', 'More about compost')
+        self.assertEqual(len(self.search('compost')), 2)
+
+    def test_searches_past_the_result_limit_flag_a_capped_count(self):
+        self.write_article('Gardening', 'hobbies', 'Compost feeds the soil')
+        self.write_article('Composting', 'hobbies', 'More about compost')
+        with patch('authors.apps.articles.utils.search.SEARCH_RESULT_LIMIT',
+                   1):
+            response = self.client.get(self.articles_url,
+                                       {'search': 'compost'})
+        self.assertEqual(response.data['count'], 1)
+        self.assertTrue(response.data['count_is_capped'])
+        response = self.client.get(self.articles_url, {'search': 'soil'})
+        self.assertFalse(response.data['count_is_capped'])
@@ -0,0 +1,80 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from authors.apps.articles.models import Article
+from authors.apps.profiles.models import Profile
+from . import base_class
+
+
+class TestArticleTags(base_class.BaseTest):
+    """
+    Tests tag filtering, the tag cloud and the articles by tag endpoint
+    """
+
+    def setUp(self):
+        super().setUp()
+        # cached results would otherwise outlive the rolled back test data
+        cache.clear()
+        self.user = self.activated_user()
+        self.profile = Profile.objects.get(user=self.user)
+        self.python = self.tag_article('python', ['python', 'django'])
+        self.rust = self.tag_article('rust', ['rust', 'systems'])
+        self.both = self.tag_article('both', ['python', 'rust'])
+
+    def tag_article(self, title, tags):
+        return Article.objects.create(title=title, description='tags',
+                                      body='tags', author=self.profile,
+                                      tag_list=tags)
+
+    def listed_slugs(self, params):
+        response = self.client.get(self.articles_url, params)
+        self.assertEqual(response.status_code, 200)
+        return {article['slug'] for article in response.data['results']}
+
+    def test_tag_filter_matches_whole_tags_only(self):
+        self.assertEqual(self.listed_slugs({'tag': 'pyth'}), set())
+        self.assertEqual(self.listed_slugs({'tag': 'django'}),
+                         {self.python.slug})
+
+    def test_tag_filter_requires_every_listed_tag(self):
+        self.assertEqual(self.listed_slugs({'tag': 'python,rust'}),
+                         {self.both.slug})
+
+    def test_any_tag_filter_requires_one_listed_tag(self):
+        self.assertEqual(self.listed_slugs({'any_tag': 'django,systems'}),
+                         {self.python.slug, self.rust.slug})
+
+    def test_tag_cloud_counts_articles_per_tag(self):
+        response = self.client.get(reverse('articles:tag-cloud'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['tags'][:2], [
+            {'tag': 'python', 'count': 2}, {'tag': 'rust', 'count': 2}])
+        self.assertEqual(len(response.data['tags']), 4)
+
+    def test_tags_are_served_from_the_cache_until_an_article_changes(self):
+        self.client.get(reverse('articles:tags'))
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse('articles:tags'))
+        self.assertEqual(len(context.captured_queries), 0)
+        self.assertNotIn('go', response.data['tags'])
+        self.tag_article('go', ['go'])
+        response = self.client.get(reverse('articles:tags'))
+        self.assertIn('go', response.data['tags'])
+
+    def test_articles_by_tag_are_paginated(self):
+        url = reverse('articles:articles-by-tag', args=['python'])
+        response = self.client.get(url, {'limit': 1})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], 2)
+        self.assertEqual(len(response.data['results']), 1)
+
+    def test_articles_by_unused_tag_is_empty(self):
+        url = reverse('articles:articles-by-tag', args=['cobol'])
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        # only the count, no separate existence check
+        self.assertEqual(len(context.captured_queries), 1)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], 0)
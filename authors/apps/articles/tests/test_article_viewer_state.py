@@ -0,0 +1,60 @@
+import json
+
+from django.contrib.auth.models import AnonymousUser
+from django.urls import reverse
+
+from authors.apps.articles.models import Article, Bookmark, Report
+from authors.apps.articles.utils.viewer_state import ArticleViewerState
+from . import base_class
+
+
+class TestArticleViewerState(base_class.BaseTest):
+    """
+    Tests resolving a viewer's relationships with a page of articles
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.author = self.activated_user()
+        self.viewer = self.create_another_user_in_db()
+        self.first = self.create_article(self.author)
+        self.second = self.create_article(self.author)
+        Article.objects.add_reaction(self.viewer, self.first, 'like')
+        Article.objects.add_reaction(self.viewer, self.second, 'dislike')
+        Article.objects.toggle_favorite(self.viewer.profile, self.first, True)
+        Bookmark.objects.create(user=self.viewer, article=self.second)
+        Report.objects.create(reporter=self.viewer.profile,
+                              article=self.first, reason="spam")
+
+    def test_all_relations_are_resolved_in_one_query(self):
+        with self.assertNumQueries(1):
+            state = ArticleViewerState(self.viewer,
+                                       [self.first.pk, self.second.pk])
+        self.assertTrue(state.has('liked', self.first.pk))
+        self.assertFalse(state.has('liked', self.second.pk))
+        self.assertTrue(state.has('disliked', self.second.pk))
+        self.assertTrue(state.has('favorited', self.first.pk))
+        self.assertTrue(state.has('bookmarked', self.second.pk))
+        self.assertFalse(state.has('bookmarked', self.first.pk))
+        self.assertTrue(state.has('reported', self.first.pk))
+
+    def test_anonymous_viewer_needs_no_query(self):
+        with self.assertNumQueries(0):
+            state = ArticleViewerState(AnonymousUser(), [self.first.pk])
+        self.assertFalse(state.has('liked', self.first.pk))
+
+    def test_bookmarks_listing_carries_viewer_state(self):
+        self.client.force_authenticate(user=self.viewer)
+        response = self.client.get(reverse('bookmarks'))
+        content = json.loads(b''.join(response.streaming_content))
+        bookmark = content['bookmarks'][0]
+        self.assertEqual(bookmark['slug'], self.second.slug)
+        self.assertTrue(bookmark['disliked'])
+        self.assertFalse(bookmark['liked'])
+        self.assertFalse(bookmark['favorited'])
+
+    def test_article_detail_reports_bookmarked(self):
+        self.client.force_authenticate(user=self.viewer)
+        response = self.client.get(self.article_url(self.second.slug))
+        self.assertTrue(response.data['bookmarked'])
+        self.assertTrue(response.data['disliked'])
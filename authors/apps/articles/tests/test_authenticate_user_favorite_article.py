@@ -1,5 +1,9 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
+
+from authors.apps.articles.models import Article
 from authors.apps.authentication.tests import base_class
 
 
@@ -23,7 +27,7 @@ class TestToggleFavoriteArticle(base_class.BaseTest):
         Test an authenticatated user can favourite an article
         """
         self.client.force_authenticate(user=self.user)
-        response = self.client.post(self.favorite_url)
+        response = self.client.post(self.favorite_url + '?with_article=true')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["article"]["favorited"], True)
         self.assertEqual(response.data["article"]["favorited_by"][0],
@@ -38,7 +42,8 @@ class TestToggleFavoriteArticle(base_class.BaseTest):
         Test an authenticatated user can unfavourite an article
         """
         self.client.force_authenticate(user=self.user)
-        response = self.client.delete(self.unfavorite_url)
+        response = self.client.delete(
+            self.unfavorite_url + '?with_article=true')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["article"]["favorited"], False)
         self.assertEqual(response.data["article"]["favorited_by"], [])
@@ -47,6 +52,50 @@ class TestToggleFavoriteArticle(base_class.BaseTest):
         self.assertEqual(response.data["message"],
                          f"You have unfavorited this article {article_title}")
 
+    def test_favoriting_returns_the_new_state_only(self):
+        """
+        Test the article is left out of the response unless asked for
+        """
+        self.client.force_authenticate(user=self.user)
+        response = self.client.post(self.favorite_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("article", response.data)
+        self.assertEqual(response.data["favorited"], True)
+        self.assertEqual(response.data["favoritesCount"], 1)
+        response = self.client.delete(self.unfavorite_url)
+        self.assertEqual(response.data["favorited"], False)
+        self.assertEqual(response.data["favoritesCount"], 0)
+
+    def test_favoriting_twice_counts_once(self):
+        """
+        Test repeating a favorite or an unfavorite changes nothing
+        """
+        self.client.force_authenticate(user=self.user)
+        self.client.post(self.favorite_url)
+        response = self.client.post(self.favorite_url)
+        self.assertEqual(response.data["favoritesCount"], 1)
+        self.client.delete(self.unfavorite_url)
+        response = self.client.delete(self.unfavorite_url)
+        self.assertEqual(response.data["favoritesCount"], 0)
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.favoritesCount, 0)
+
+    def test_favoriting_does_not_save_the_article(self):
+        """
+        Test toggling a favorite writes the membership and the counter only
+        """
+        updated_at = self.article.updated_at
+        with CaptureQueriesContext(connection) as queries:
+            Article.objects.toggle_favorite(self.user.profile, self.article,
+                                            True)
+        writes = [query['sql'] for query in queries.captured_queries
+                  if query['sql'].split()[0] in ('INSERT', 'UPDATE', 'DELETE')]
+        self.assertEqual(len(writes), 2)
+        self.assertIn('ON CONFLICT', writes[0])
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.updated_at, updated_at)
+        self.assertEqual(self.article.favoritesCount, 1)
+
     def test_user_cannot_favorite_non_existing_article(self):
         """
         Test user cannot favourite an article that doesn't exist
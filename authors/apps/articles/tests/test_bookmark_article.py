@@ -1,3 +1,7 @@
+import json
+
+from django.db import IntegrityError, connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 from ...authentication.tests import base_class
@@ -73,3 +77,66 @@ does not exist')
         self.assertIn(response.data.get('error'),
                       f'An article with this slug,{article.slug}, \
 does not exist')
+
+
+class TestBookmarkSync(base_class.BaseTest):
+    """
+    This class tests listing bookmarks and changing many of them at once
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.user = self.activated_user()
+        self.client.force_authenticate(user=self.user)
+        self.articles = [self.create_article(self.user) for _ in range(3)]
+        self.slugs = [article.slug for article in self.articles]
+        self.url_sync = reverse('bookmarks-sync')
+
+    def sync(self, **changes):
+        return self.client.post(self.url_sync, changes, format='json')
+
+    def bookmarked(self):
+        return set(Bookmark.objects.filter(user=self.user).values_list(
+            'article__slug', flat=True))
+
+    def test_a_user_bookmarks_an_article_once(self):
+        Bookmark.objects.create(user=self.user, article=self.articles[0])
+        self.assertFalse(Bookmark.objects.add(self.user, self.articles[0]))
+        with self.assertRaises(IntegrityError):
+            Bookmark.objects.create(user=self.user, article=self.articles[0])
+
+    def test_listing_bookmarks_is_a_single_query(self):
+        for article in self.articles:
+            Bookmark.objects.add(self.user, article)
+        with self.assertNumQueries(2):
+            # the bookmarks with their articles, then the viewer's state
+            response = self.client.get(reverse('bookmarks'))
+            bookmarks = json.loads(
+                b''.join(response.streaming_content))['bookmarks']
+        self.assertEqual([bookmark['slug'] for bookmark in bookmarks],
+                         self.slugs)
+        self.assertEqual(bookmarks[0]['author'], self.user.username)
+
+    def test_sync_adds_and_removes_bookmarks(self):
+        Bookmark.objects.add(self.user, self.articles[0])
+        Bookmark.objects.add(self.user, self.articles[1])
+        response = self.sync(add=[self.slugs[0], self.slugs[2], 'missing'],
+                             remove=[self.slugs[1]])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {'added': [self.slugs[2]],
+                                         'removed': [self.slugs[1]],
+                                         'not_found': ['missing']})
+        self.assertEqual(self.bookmarked(), {self.slugs[0], self.slugs[2]})
+
+    def test_sync_writes_one_statement_per_direction(self):
+        with CaptureQueriesContext(connection) as queries:
+            Bookmark.objects.sync(self.user, add=self.slugs[:2],
+                                  remove=self.slugs[2:])
+        self.assertEqual(len([query for query in queries.captured_queries
+                              if 'articles_bookmark' in query['sql']]), 2)
+        self.assertEqual(self.bookmarked(), set(self.slugs[:2]))
+
+    def test_sync_rejects_contradicting_changes(self):
+        response = self.sync(add=[self.slugs[0]], remove=[self.slugs[0]])
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.bookmarked(), set())
@@ -0,0 +1,146 @@
+import json
+import tempfile
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from authors.apps.articles.models import Article
+from authors.apps.articles.tasks import announce_articles
+from authors.apps.articles.utils.bulk_import import ArticleImport
+from authors.apps.authentication.models import User
+from authors.apps.notifications.models import Notification
+from authors.apps.profiles.models import Profile, ProfileStats
+from . import base_class
+
+
+def ndjson(*records):
+    return ''.join(json.dumps(record) + '\n' for record in records)
+
+
+def record(title='whale', **fields):
+    return dict(title=title, description='fish', body='In water', **fields)
+
+
+class TestBulkImport(base_class.BaseTest):
+    """
+    Tests loading articles in bulk from NDJSON
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.author = self.activated_user().profile
+        self.admin = User.objects.create_superuser(
+            username='admin', email='admin@mail.com', password='ia83naJS')
+        self.import_url = reverse('articles:import')
+
+    def run_command(self, content, *args):
+        with tempfile.NamedTemporaryFile('w', suffix='.ndjson') as source:
+            source.write(content)
+            source.flush()
+            out, err = StringIO(), StringIO()
+            call_command('import_articles', source.name, *args,
+                         stdout=out, stderr=err)
+        return out.getvalue(), err.getvalue()
+
+    def test_command_imports_articles_in_chunks(self):
+        content = ndjson(*(record(f'story {i}', tag_list=['sea'])
+                           for i in range(5)))
+        with CaptureQueriesContext(connection) as queries:
+            out, err = self.run_command(content, '--author', 'abc123',
+                                        '--chunk-size', '2')
+        self.assertIn('Imported 5 article(s), skipped 0 line(s)', out)
+        inserts = [query for query in queries.captured_queries
+                   if query['sql'].startswith('INSERT INTO "articles_art')]
+        self.assertEqual(len(inserts), 3)
+        articles = Article.objects.filter(author=self.author)
+        self.assertEqual(articles.count(), 5)
+        self.assertEqual(len({article.slug for article in articles}), 5)
+        self.assertEqual(ProfileStats.of(Profile.objects.get(
+            pk=self.author.pk)).articles_count, 5)
+        article = articles.get(title='story 0')
+        self.assertTrue(article.slug.startswith('story-0-'))
+        self.assertEqual(article.tag_list, ['sea'])
+        self.assertEqual(article.word_count, 2)
+        self.assertEqual(article.excerpt, 'In water')
+
+    def test_invalid_lines_are_reported_and_skipped(self):
+        content = ndjson(record(), record(author='nobody'),
+                         {'title': 'no body'}, [1, 2]) + 'not json\n\n'
+        out, err = self.run_command(content, '--author', 'abc123')
+        self.assertIn('Imported 1 article(s), skipped 4 line(s)', out)
+        for line in ('line 2:', 'line 3:', 'line 4:', 'line 5:'):
+            self.assertIn(line, err)
+
+    def test_clashing_slugs_are_redrawn(self):
+        suffixes = iter(['xxxxxxx', 'aaaaaaa', 'aaaaaaa', 'bbbbbbb'])
+        with patch('authors.apps.articles.utils.bulk_import.'
+                   'unique_random_string', lambda: next(suffixes)):
+            ArticleImport(default_author=self.author).run(
+                ndjson(record(), record()).splitlines())
+        self.assertEqual(
+            set(Article.objects.values_list('slug', flat=True)),
+            {'whale-aaaaaaa', 'whale-bbbbbbb'})
+
+    def test_import_sends_no_notifications_unless_asked(self):
+        # tests never commit, so the on-commit callbacks are run at once
+        with patch('authors.apps.articles.utils.bulk_import.'
+                   'transaction.on_commit', lambda callback: callback()), \
+                patch('authors.apps.articles.utils.bulk_import.'
+                      'announce_articles') as announce:
+            ArticleImport(default_author=self.author).run(
+                ndjson(record()).splitlines())
+            announce.delay.assert_not_called()
+            imported = ArticleImport(default_author=self.author,
+                                     notify=True).run(
+                ndjson(record(), record()).splitlines())
+        self.assertFalse(Notification.objects.exists())
+        announce.delay.assert_called_once_with(imported.article_ids)
+        self.assertEqual(len(imported.article_ids), 2)
+
+    def test_imports_are_announced_only_once_committed(self):
+        with patch('authors.apps.articles.utils.bulk_import.'
+                   'announce_articles') as announce:
+            ArticleImport(default_author=self.author, notify=True).run(
+                ndjson(record()).splitlines())
+        announce.delay.assert_not_called()
+
+    def test_announcing_imported_articles_notifies_followers(self):
+        imported = ArticleImport(default_author=self.author, notify=True)
+        with patch('authors.apps.articles.utils.bulk_import.'
+                   'announce_articles'):
+            imported.run(ndjson(record(), record()).splitlines())
+        announce_articles(imported.article_ids)
+        self.assertEqual(Notification.objects.filter(
+            title="New Article for You").count(), 2)
+
+    def test_only_admins_can_import_over_the_api(self):
+        self.client.force_authenticate(user=self.author.user)
+        response = self.client.post(self.import_url, ndjson(record()),
+                                    content_type='application/x-ndjson')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(Article.objects.exists())
+
+    def test_admin_imports_over_the_api(self):
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.post(
+            self.import_url,
+            ndjson(record(), record(author='abc123'), {'title': ''}),
+            content_type='application/x-ndjson')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['imported'], 2)
+        self.assertEqual([error['line'] for error in response.data['errors']],
+                         [3])
+        self.assertEqual(
+            sorted(Article.objects.values_list('author__username', flat=True)),
+            ['abc123', 'admin'])
+
+    def test_an_import_with_nothing_valid_is_rejected(self):
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.post(self.import_url, 'not json\n',
+                                    content_type='application/x-ndjson')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -1,3 +1,4 @@
+from django.core.cache import cache
 from django.urls import reverse
 from rest_framework import status
 from ...authentication.tests.base_class import BaseTest
@@ -10,6 +11,8 @@ class TestFilterSearchFunctionality(BaseTest):
     """
     def setUp(self):
         super().setUp()
+        # cached results would otherwise outlive the rolled back test data
+        cache.clear()
         self.user = self.activated_user()
         self.client.force_authenticate(user=self.user)
         self.article = self.create_article(self.user)
@@ -2,7 +2,7 @@ from django.urls import reverse
 from rest_framework import status
 from ...authentication.tests import base_class
 from .test_data import test_rate_article_data
-from ..models import Rating, Article
+from ..models import Rating, RatingAggregate, Article
 from ...profiles.models import Profile
 
 
@@ -70,9 +70,8 @@ class TestRatingModel(base_class.BaseTest):
 
     def test_rate_article_not_author_rate_same_article(self):
         """
-        Test rating an article passes but does not process request
-        when it's not author rating
-        an article they already rated
+        Test rating an article a user already rated replaces their
+        previous score instead of adding a second rating
         """
         self.user = self.create_another_user_in_db()
         self.client.force_authenticate(user=self.user)
@@ -81,12 +80,24 @@ class TestRatingModel(base_class.BaseTest):
                          format='json')
         response = self.client.post(
             self.url_rate_article,
-            data=test_rate_article_data.valid_rate_data,
+            data={"rate_score": 5},
             format='json')
-        self.assertEqual(response.status_code,
-                         status.HTTP_422_UNPROCESSABLE_ENTITY)
-        self.assertIn("You already rated this article",
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("You have updated your rating of this article",
                       response.data.get('message'))
+        self.assertEqual(response.data['articles']['average_ratings'], 5)
+        self.assertEqual(Rating.objects.filter(article=self.article).count(),
+                         1)
+
+    def test_rate_missing_article(self):
+        """
+        Test rating an article that does not exist fails
+        """
+        response = self.client.post(
+            reverse('articles:article-rates', kwargs={"slug": "missing"}),
+            data=test_rate_article_data.valid_rate_data,
+            format='json')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
     def test_get_rate_average(self):
         """
@@ -103,3 +114,68 @@ class TestRatingModel(base_class.BaseTest):
         self.assertEqual(response.status_code,
                          status.HTTP_200_OK)
         self.assertEqual(response.data['results'][0]['average_ratings'], 2)
+
+
+class TestRatingAggregate(base_class.BaseTest):
+    """
+    This class tests the per-article rating aggregate and the rating
+    distribution endpoint that reads it
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.author = self.activated_user()
+        self.article = Article.objects.create(
+            title='whale', description='fish', body='In water',
+            author=self.author.profile)
+        self.reader = self.create_another_user_in_db()
+        self.url_distribution = reverse(
+            'articles:article-rating-distribution',
+            kwargs={"slug": self.article.slug})
+
+    def aggregate(self):
+        return RatingAggregate.objects.get(article=self.article)
+
+    def test_aggregate_follows_insert_update_and_delete(self):
+        rating = Rating.objects.create(user=self.reader, article=self.article,
+                                       rate_score=4)
+        Rating.objects.create(user=self.author, article=self.article,
+                              rate_score=1)
+        aggregate = self.aggregate()
+        self.assertEqual((aggregate.count, aggregate.total), (2, 5))
+        self.assertEqual(aggregate.histogram, [1, 0, 0, 1, 0])
+        rating.rate_score = 5
+        rating.save()
+        self.assertEqual(self.aggregate().histogram, [1, 0, 0, 0, 1])
+        rating.delete()
+        aggregate = self.aggregate()
+        self.assertEqual((aggregate.count, aggregate.total), (1, 1))
+        self.assertEqual(aggregate.histogram, [1, 0, 0, 0, 0])
+
+    def test_rate_upserts_one_rating_per_user(self):
+        self.assertTrue(Rating.objects.rate(self.reader, self.article, 2))
+        self.assertFalse(Rating.objects.rate(self.reader, self.article, 3))
+        self.assertEqual(Rating.objects.count(), 1)
+        aggregate = self.aggregate()
+        self.assertEqual((aggregate.count, aggregate.total), (1, 3))
+        self.assertEqual(aggregate.histogram, [0, 0, 1, 0, 0])
+
+    def test_distribution_is_read_from_the_aggregate_alone(self):
+        Rating.objects.rate(self.reader, self.article, 4)
+        Rating.objects.rate(self.author, self.article, 5)
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url_distribution)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 2)
+        self.assertEqual(response.data['average'], 4.5)
+        self.assertEqual(response.data['distribution'],
+                         {1: 0, 2: 0, 3: 0, 4: 1, 5: 1})
+
+    def test_distribution_of_an_unrated_article(self):
+        response = self.client.get(self.url_distribution)
+        self.assertEqual(response.data['count'], 0)
+        self.assertEqual(response.data['average'], 0)
+        response = self.client.get(reverse(
+            'articles:article-rating-distribution',
+            kwargs={"slug": "missing"}))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
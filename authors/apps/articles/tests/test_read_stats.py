@@ -1,7 +1,13 @@
+import threading
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework import status
 from . import base_class
-from ..models import Article
+from ..models import Article, ReadStats
+from ..utils.read_events import ReadEventBuffer, read_events
 from ...profiles.models import Profile
 
 
@@ -21,6 +27,7 @@ class TestReadStats(base_class.BaseTest):
 
         self.create_article_and_authenticate_test_user_2()
         self.client.get(url,)
+        ReadStats.objects.record_reads(read_events.drain())
 
         username = Profile.objects.latest('created_at').username
         url2 = reverse('profiles:read-stats')
@@ -38,3 +45,67 @@ class TestReadStats(base_class.BaseTest):
         self.assertEqual(
             response.status_code,
             status.HTTP_403_FORBIDDEN)
+
+
+class TestReadEventIngestion(base_class.BaseTest):
+    """
+    This class tests buffering article reads and recording them in batches
+    """
+
+    def setUp(self):
+        super().setUp()
+        read_events.drain()
+        self.author, self.article = \
+            self.create_article_and_authenticate_test_user()
+        self.reader = self.create_another_user_in_db()
+
+    def read(self, user, when=None):
+        return (user.pk, self.article.pk, (when or timezone.now()).isoformat())
+
+    def test_viewing_an_article_does_not_write(self):
+        self.client.force_authenticate(user=self.reader)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.article_url(self.article.slug))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse([query for query in queries.captured_queries
+                          if 'readstats' in query['sql']])
+        self.assertEqual([event[:2] for event in read_events.drain()],
+                         [(self.reader.pk, self.article.pk)])
+
+    def test_reads_are_recorded_once_per_reader(self):
+        earlier = timezone.now() - timezone.timedelta(days=1)
+        ReadStats.objects.record_reads([
+            self.read(self.reader),
+            self.read(self.reader, earlier),
+        ])
+        ReadStats.objects.record_reads([self.read(self.reader)])
+        stats = ReadStats.objects.get(user=self.reader)
+        self.assertEqual(stats.read_date, earlier)
+        self.assertGreater(stats.last_read_date, earlier)
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.read_count, 1)
+
+    def test_reads_of_deleted_articles_are_dropped(self):
+        event = self.read(self.reader)
+        self.article.delete()
+        ReadStats.objects.record_reads([event])
+        self.assertFalse(ReadStats.objects.exists())
+
+    def test_buffer_flushes_full_batches(self):
+        batches = []
+        buffer = ReadEventBuffer(batches.append, batch_size=2, max_delay=60)
+        buffer.add(self.reader.pk, self.article.pk)
+        self.assertEqual(batches, [])
+        buffer.add(self.author.pk, self.article.pk)
+        self.assertEqual(len(batches), 1)
+        self.assertEqual([event[0] for event in batches[0]],
+                         [self.reader.pk, self.author.pk])
+        self.assertIsNone(buffer.timer)
+
+    def test_buffer_flushes_late_reads_after_a_delay(self):
+        flushed = threading.Event()
+        buffer = ReadEventBuffer(lambda events: flushed.set(),
+                                 batch_size=100, max_delay=0.01)
+        buffer.add(self.reader.pk, self.article.pk)
+        self.assertTrue(flushed.wait(5))
+        self.assertEqual(buffer.events, [])
@@ -1,3 +1,5 @@
+from django.db import IntegrityError
+from django.test import override_settings
 from django.urls import reverse
 from rest_framework import status
 from authors.apps.authentication.models import User
@@ -6,6 +8,7 @@ from ...authentication.tests.base_class import BaseTest
 from .test_data.report_article_data import *
 
 
+@override_settings(CELERY_TASK_ALWAYS_EAGER=True)
 class TestReportArticle(BaseTest):
     def setUp(self):
         super().setUp()
@@ -183,3 +186,75 @@ class TestReportArticle(BaseTest):
         self.assertEqual(response.data["report"]["reason"], report.reason)
         self.assertEqual(response.data["report"]["reporter"]["username"],
                          self.user.profile.username)
+
+
+class TestModerationQueue(BaseTest):
+    """
+    Tests the admin moderation queue of reported articles
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.author = self.activated_user()
+        self.admin = User.objects.create_superuser(
+            username='admin', email='admin@mail.com', password='pass1234')
+        self.reporters = [
+            User.objects.create_user(username=f'reader{i}',
+                                     email=f'reader{i}@mail.com',
+                                     password='pass1234').profile
+            for i in range(3)]
+        self.quiet, self.loud, self.unreported = [
+            self.create_article(self.author) for _ in range(3)]
+        self.report(self.quiet, self.reporters[0], 'Spam')
+        for reporter, reason in zip(self.reporters,
+                                    ('spam', ' Plagiarism', 'plagiarism ')):
+            self.report(self.loud, reporter, reason)
+        self.queue_url = reverse('articles:moderation-queue')
+        self.client.force_authenticate(user=self.admin)
+
+    @staticmethod
+    def report(article, reporter, reason):
+        return Report.objects.create(article=article, reporter=reporter,
+                                     reason=reason)
+
+    def test_queue_groups_reports_by_article(self):
+        with self.assertNumQueries(3):
+            # the count, the page and the top reasons of the page
+            response = self.client.get(self.queue_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 2)
+        loud, quiet = response.data['results']
+        self.assertEqual((loud['slug'], loud['report_count']),
+                         (self.loud.slug, 3))
+        self.assertEqual(loud['author'], self.author.username)
+        self.assertEqual(loud['top_reasons'],
+                         [{'reason': 'plagiarism', 'count': 2},
+                          {'reason': 'spam', 'count': 1}])
+        self.assertEqual((quiet['slug'], quiet['report_count']),
+                         (self.quiet.slug, 1))
+        self.assertTrue(quiet['reports_url'].endswith(
+            reverse('articles:article-reports',
+                    kwargs={'slug': self.quiet.slug})))
+
+    def test_queue_can_be_sorted(self):
+        response = self.client.get(self.queue_url,
+                                   {'ordering': 'latest_report_at'})
+        self.assertEqual([entry['slug'] for entry in response.data['results']],
+                         [self.quiet.slug, self.loud.slug])
+
+    def test_queue_drills_down_into_reports(self):
+        response = self.client.get(reverse(
+            'articles:article-reports', kwargs={'slug': self.loud.slug}))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [report['reporter'] for report in response.data['results']],
+            ['reader2', 'reader1', 'reader0'])
+
+    def test_only_admins_see_the_queue(self):
+        self.client.force_authenticate(user=self.author)
+        response = self.client.get(self.queue_url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_a_user_reports_an_article_once(self):
+        with self.assertRaises(IntegrityError):
+            self.report(self.quiet, self.reporters[0], 'again')
@@ -0,0 +1,118 @@
+import json
+from unittest.mock import patch
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import serializers
+
+from authors.apps.articles.models import Article, Bookmark, Report
+from authors.apps.authentication.models import User
+from authors.apps.core.streaming import StreamingJSONListResponse, \
+    iterate_in_batches
+from . import base_class
+
+
+class FailingSlugSerializer(serializers.Serializer):
+    """renders the slug of articles up to the `fail_from` id in context"""
+    slug = serializers.SerializerMethodField()
+
+    def get_slug(self, article):
+        if article.pk >= self.context.get('fail_from', 0):
+            raise ValueError('cannot render this article')
+        return article.slug
+
+
+class TestStreamingLists(base_class.BaseTest):
+    """
+    Tests the unpaginated listings that are streamed a batch at a time
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.user = self.activated_user()
+        self.articles = [self.create_article(self.user) for _ in range(5)]
+
+    @staticmethod
+    def streamed(response):
+        return json.loads(b''.join(response.streaming_content))
+
+    def test_batches_cover_every_row_with_prefetches_applied(self):
+        batches = list(iterate_in_batches(
+            Article.objects.prefetch_related('favorited_by'), batch_size=2))
+        self.assertEqual([len(batch) for batch in batches], [2, 2, 1])
+        with self.assertNumQueries(0):
+            for batch in batches:
+                for article in batch:
+                    list(article.favorited_by.all())
+
+    def test_a_failing_first_batch_fails_before_the_response(self):
+        with self.assertRaises(ValueError):
+            StreamingJSONListResponse(Article.objects.order_by('id'),
+                                      FailingSlugSerializer, 'articles',
+                                      batch_size=2)
+
+    def test_a_failing_later_batch_is_logged_and_cuts_the_stream(self):
+        response = StreamingJSONListResponse(
+            Article.objects.order_by('id'), FailingSlugSerializer,
+            'articles', context={'fail_from': self.articles[2].pk},
+            batch_size=2)
+        with self.assertLogs('authors.apps.core.streaming', 'ERROR'):
+            content = b''.join(response.streaming_content)
+        with self.assertRaises(ValueError):
+            json.loads(content)
+
+    def test_reports_keep_their_envelope(self):
+        admin = User.objects.create_superuser(
+            username='admin', email='admin@email.com', password='pass1234')
+        for article in self.articles:
+            Report.objects.create(reporter=self.user.profile,
+                                  article=article, reason="spam")
+        self.client.force_authenticate(user=admin)
+        response = self.client.get(reverse('articles:reports'))
+        self.assertEqual(response.status_code, 200)
+        reports = self.streamed(response)['reports']
+        self.assertEqual([report['article']['slug'] for report in reports],
+                         [article.slug for article in self.articles])
+
+    def test_reports_cost_a_fixed_number_of_queries_per_batch(self):
+        admin = User.objects.create_superuser(
+            username='admin', email='admin@email.com', password='pass1234')
+        self.client.force_authenticate(user=admin)
+        queries = []
+        with patch('authors.apps.core.streaming.STREAM_BATCH_SIZE', 2):
+            for article in self.articles:
+                Report.objects.create(reporter=self.user.profile,
+                                      article=article, reason="spam")
+                with CaptureQueriesContext(connection) as context:
+                    reports = self.streamed(self.client.get(
+                        reverse('articles:reports')))['reports']
+                queries.append(len(context.captured_queries))
+        self.assertEqual(len(reports), 5)
+        # 1 to 5 reports stream in 1, 1, 2, 2 and 3 batches
+        self.assertEqual(queries[0], queries[1])
+        self.assertEqual(queries[2], queries[3])
+        self.assertEqual(queries[3] - queries[1], queries[4] - queries[3])
+
+    def test_bookmarks_keep_their_envelope(self):
+        self.client.force_authenticate(user=self.user)
+        for article in self.articles[:2]:
+            Bookmark.objects.create(article=article, user=self.user)
+        response = self.client.get(reverse('bookmarks'))
+        bookmarks = self.streamed(response)['bookmarks']
+        self.assertEqual([bookmark['slug'] for bookmark in bookmarks],
+                         [article.slug for article in self.articles[:2]])
+
+    def test_empty_listing_is_valid_json(self):
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(reverse('bookmarks'))
+        self.assertEqual(self.streamed(response), {'bookmarks': []})
+
+    def test_profiles_keep_their_envelope(self):
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(reverse('profiles:profile-list'))
+        content = self.streamed(response)
+        self.assertEqual(content['message'],
+                         "Successfully returned all users profiles")
+        self.assertEqual(content['profiles'][0]['username'],
+                         self.user.username)
@@ -6,7 +6,14 @@ app_name = "articles"
 
 urlpatterns = [
     path('tags', views.ArticleTagsApiView.as_view(), name='tags'),
+    path('tags/cloud', views.ArticleTagCloudApiView.as_view(),
+         name='tag-cloud'),
+    path('tags/<tag_name>/articles', views.ArticlesByTagApiView.as_view(),
+         name='articles-by-tag'),
+    path('import', views.ArticleImportAPIView.as_view(), name='import'),
     path('reports', views.ReportsAPIView.as_view(), name='reports'),
+    path('reports/queue', views.ModerationQueueAPIView.as_view(),
+         name='moderation-queue'),
     path('reports/<id>', views.ReportAPIView.as_view(), name='report'),
     path('<slug>/like', views.LikeDislikeArticleAPIView.as_view(),
          kwargs={'action': 'like'},
@@ -30,8 +37,12 @@ urlpatterns = [
          name='article-unfavorite'),
     path('<slug>/rate', views.ArticleRatingAPIView.as_view(),
          name='article-rates'),
+    path('<slug>/ratings', views.ArticleRatingDistributionAPIView.as_view(),
+         name='article-rating-distribution'),
     path('<slug>/bookmark', views.ArticleBookmarkAPIView.as_view(),
          name='article-bookmark'),
     path('<slug>/report', views.ReportArticleAPIView.as_view(),
          name='report-article'),
+    path('<slug>/reports', views.ArticleReportsAPIView.as_view(),
+         name='article-reports'),
 ]
@@ -1,5 +1,9 @@
 from django_filters import FilterSet, rest_framework
+from rest_framework import filters
+
 from ..models import Article
+from .search import ArticleSearch
+from .tags import parse_tags
 
 
 class ArticleFilter(FilterSet):
@@ -8,16 +12,55 @@ class ArticleFilter(FilterSet):
     article modeland the fields it will filter by are the article title,
     author username and tags.ArticleFilter also overides the filter fields
     lookup expressions from exact to icontains.
+    Tags are matched exactly against the GIN indexed tag_list: `tag=a,b`
+    returns articles tagged with both, `any_tag=a,b` those tagged with either.
     """
     title = rest_framework.CharFilter('title',
                                       lookup_expr='icontains')
     author = rest_framework.CharFilter('author__username',
                                        lookup_expr='icontains')
-    tag = rest_framework.CharFilter('tag_list',
-                                    lookup_expr='icontains')
+    tag = rest_framework.CharFilter(method='filter_all_tags')
+    any_tag = rest_framework.CharFilter(method='filter_any_tag')
     favorited_by = rest_framework.CharFilter('favorited_by__username',
                                     lookup_expr='icontains')
 
     class Meta:
         model = Article
-        fields = ("title", "author", "tag", "favorited_by")
+        fields = ("title", "author", "tag", "any_tag", "favorited_by")
+
+    def filter_all_tags(self, queryset, name, value):
+        return queryset.filter(tag_list__contains=parse_tags(value))
+
+    def filter_any_tag(self, queryset, name, value):
+        return queryset.filter(tag_list__overlap=parse_tags(value))
+
+
+class ArticleSearchFilter(filters.SearchFilter):
+    """
+    ArticleSearchFilter answers the ?search= query parameter with the
+    Postgres full-text search in ArticleSearch instead of ILIKE scans over
+    every searched column. Results come back ordered by relevance. Whether
+    the search dropped results past its limit is left on the request as
+    `search_count_is_capped` for the paginator to report.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        terms = ' '.join(self.get_search_terms(request))
+        if not terms:
+            return queryset
+        search = ArticleSearch(terms)
+        queryset = search.apply(queryset)
+        request.search_count_is_capped = search.count_is_capped
+        return queryset
+
+
+class StableOrderingFilter(filters.OrderingFilter):
+    """
+    StableOrderingFilter sorts by the ?ordering= the client asked for, or
+    the view's default, and breaks ties on the primary key so that rows
+    sharing a sort value never move between offset pages
+    """
+
+    def get_ordering(self, request, queryset, view):
+        ordering = super().get_ordering(request, queryset, view) or ()
+        return list(ordering) + ['-pk']
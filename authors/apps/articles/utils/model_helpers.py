@@ -1,12 +1,17 @@
 from rest_framework import status
 from ..models import Article, Bookmark, Report
+from .tags import get_tag_cloud
 
 
-def get_single_article_using_slug(slug):
+def get_single_article_using_slug(slug, queryset=None):
     # This method will be used to get a single article using a slug
     # It will return none if there's no article in the DB with slug
+    # An optional queryset, e.g. Article.objects.for_display(), can be
+    # passed in to control what gets loaded along with the article
+    if queryset is None:
+        queryset = Article.objects.all()
     try:
-        obj = Article.objects.get(slug=slug)
+        obj = queryset.get(slug=slug)
         return obj
     except Article.DoesNotExist:
         return None
@@ -17,20 +22,28 @@ def favorite_unfavorite_article(request, slug,
     """
     favorite_unfavorite_article returns either a dictionary with key of
     message indicating whether an article has been favorited or unfavorited,
-    article which has been favorited or unfavorited and a status code of 200
+    the new favorited state and favoritesCount and a status code of 200
     or it returns a dictionary with a key of errors with the appropriate status
-    code
+    code. The whole article is only serialized into the response when the
+    request asks for it with ?with_article=true
     """
-    article = get_single_article_using_slug(slug)
-    user = request.user.profile
+    article = get_single_article_using_slug(slug, Article.objects.only(
+        'pk', 'slug', 'title', 'favoritesCount'))
     if article:
-        Article.objects.toggle_favorite(user, article, is_favoriting)
-        serializer = serializer_class(article,
-                                      context={"request": request})
+        Article.objects.toggle_favorite(request.user.profile, article,
+                                        is_favoriting)
         title = article.title
         message = f"You have favorited this article {title}" if \
             is_favoriting else f"You have unfavorited this article {title}"
-        data = {"message": message, "article": serializer.data}
+        data = {"message": message,
+                "favorited": is_favoriting,
+                "favoritesCount": article.favoritesCount}
+        if request.query_params.get('with_article') == 'true':
+            article = get_single_article_using_slug(
+                slug, Article.objects.for_display())
+            serializer = serializer_class(article,
+                                          context={"request": request})
+            data["article"] = serializer.data
         status_code = status.HTTP_200_OK
     else:
         data = {'errors': 'Article with this slug doesnot exist'}
@@ -42,26 +55,21 @@ def get_all_available_tags():
     """
     This method returns all tags authors created if any
     """
-    try:
-        articles = Article.objects.all()
-        articles_w_tags = [a for a in articles if a.tag_list]
-        merged_tags_list = []
-        if articles_w_tags:
-            all_tags_list = [a.tag_list for a in articles_w_tags]
-            for tag in all_tags_list:
-                merged_tags_list += tag
-            return set(merged_tags_list)
-    except Article.DoesNotExist:
-        return None
+    tags = {entry['tag'] for entry in get_tag_cloud()}
+    return tags or None
 
 
-def get_all_articles_with_same_tag_name(tag_name):
+def get_all_articles_with_same_tag_name(tag_name, queryset=None):
     """
-    This method returns all articles with the same tag name
+    This method returns all articles with the same tag name. An optional
+    queryset, e.g. Article.objects.for_display(), can be passed in to
+    control what gets loaded along with the articles
     """
-    articles_with_same_name = Article.objects.filter(
+    if queryset is None:
+        queryset = Article.objects.all()
+    articles_with_same_name = queryset.filter(
         tag_list__contains=[tag_name])
-    if articles_with_same_name:
+    if articles_with_same_name.exists():
         return articles_with_same_name
 
 
@@ -72,18 +80,6 @@ def get_single_bookmark_user(article, user):
     return Bookmark.objects.filter(article=article, user=user)
 
 
-def get_single_bookmark_or_create_bookmark(article, user):
-    """
-    This method returns a bookmarks
-    """
-    try:
-        obj = Bookmark.objects.get(article=article, user=user)
-        return obj
-    except Bookmark.DoesNotExist:
-        Bookmark.objects.create(article=article, user=user)
-        return None
-
-
 def get_single_report(id):
     """
     get_single_report returns report based on the id otherwise returns None
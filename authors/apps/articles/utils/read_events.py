@@ -0,0 +1,74 @@
+import atexit
+import logging
+import threading
+
+from django.conf import settings
+from django.utils import timezone
+
+from ..tasks import record_reads
+
+logger = logging.getLogger(__name__)
+
+
+class ReadEventBuffer:
+    """
+    ReadEventBuffer collects article reads in memory so that serving an
+    article does not write to the database. The reads are handed to `sink`
+    in batches, once `batch_size` of them are waiting or `max_delay` seconds
+    after the first of them came in, whichever is sooner.
+    """
+
+    def __init__(self, sink, batch_size, max_delay):
+        self.sink = sink
+        self.batch_size = batch_size
+        self.max_delay = max_delay
+        self.events = []
+        self.lock = threading.Lock()
+        self.timer = None
+
+    def add(self, user_id, article_id):
+        """
+        add buffers a read of an article by a user
+        """
+        with self.lock:
+            self.events.append(
+                (user_id, article_id, timezone.now().isoformat()))
+            full = len(self.events) >= self.batch_size
+            if not full and self.timer is None:
+                self.timer = threading.Timer(self.max_delay, self.flush)
+                self.timer.daemon = True
+                self.timer.start()
+        if full:
+            self.flush()
+
+    def drain(self):
+        """
+        drain empties the buffer and returns the reads it held
+        """
+        with self.lock:
+            events, self.events = self.events, []
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+        return events
+
+    def flush(self):
+        """
+        flush hands every buffered read to the sink
+        """
+        events = self.drain()
+        if not events:
+            return
+        try:
+            self.sink(events)
+        except Exception:
+            # read stats are best effort, losing a batch must not fail the
+            # request or kill the timer thread that flushed it
+            logger.exception('Could not record %d article read(s)',
+                             len(events))
+
+
+read_events = ReadEventBuffer(record_reads.delay,
+                              batch_size=settings.READ_EVENTS_BATCH_SIZE,
+                              max_delay=settings.READ_EVENTS_FLUSH_INTERVAL)
+atexit.register(read_events.flush)
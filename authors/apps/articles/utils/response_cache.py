@@ -0,0 +1,137 @@
+from functools import wraps
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+from rest_framework import status
+from rest_framework.response import Response
+
+from ...core import cache as cache_utils
+from ...profiles.models import Profile
+
+# the article list, retired whenever any article's public fields change
+ARTICLE_LIST_NAMESPACE = 'articles:list'
+# every cached article response, retired e.g. when the counters of every
+# article are rebuilt
+ARTICLE_RESPONSES_NAMESPACE = 'articles:responses'
+# backends whose entries live in one process, where invalidating in one
+# process leaves the others serving retired responses
+PROCESS_LOCAL_CACHES = (LocMemCache, DummyCache)
+
+
+def article_detail_namespace(slug):
+    return f'articles:detail:{slug}'
+
+
+def article_author_namespace(profile_id):
+    """the cached responses that embed an author's summary"""
+    return f'articles:author:{profile_id}'
+
+
+def response_caching_enabled():
+    """
+    response_caching_enabled tells whether anonymous article responses may be
+    cached: only on a backend every process shares, unless
+    ARTICLE_RESPONSE_CACHE_ALLOW_LOCAL says otherwise (e.g. in tests)
+    """
+    if settings.ARTICLE_RESPONSE_CACHE_TIMEOUT <= 0:
+        return False
+    return (settings.ARTICLE_RESPONSE_CACHE_ALLOW_LOCAL or
+            not isinstance(caches['default'], PROCESS_LOCAL_CACHES))
+
+
+def embedded_authors(data):
+    """
+    embedded_authors gives the usernames of the author summaries found
+    anywhere in serialized response data
+    """
+    if isinstance(data, dict):
+        if 'username' in data and 'followers_count' in data:
+            return {data['username']}
+        return set().union(*map(embedded_authors, data.values()))
+    if isinstance(data, (list, tuple)):
+        return set().union(*map(embedded_authors, data))
+    return set()
+
+
+def normalize_query(request):
+    """
+    normalize_query orders the query parameters of a request so that
+    `?a=1&b=2` and `?b=2&a=1` share a cache entry
+    """
+    return urlencode(sorted(
+        (key, value) for key, values in request.query_params.lists()
+        for value in values))
+
+
+def cache_anonymous_response(namespace):
+    """
+    cache_anonymous_response caches the successful responses a GET handler
+    gives anonymous readers, keyed by host, path and normalized query string.
+    `namespace(**kwargs)` names the cache namespace from the URL kwargs;
+    bumping it (see invalidate_article_responses) retires those entries.
+    Each entry also records the generations of the authors it embeds, so
+    that bumping an author's namespace retires only the responses showing
+    that author. Authenticated requests always reach the handler, since
+    their responses carry the reader's likes, favorites and bookmarks.
+    """
+    def decorator(handler):
+        @wraps(handler)
+        def wrapper(view, request, *args, **kwargs):
+            if (not request.user.is_anonymous or
+                    not response_caching_enabled()):
+                return handler(view, request, *args, **kwargs)
+            key = cache_utils.make_key(
+                namespace(**kwargs),
+                cache_utils.get_generation(ARTICLE_RESPONSES_NAMESPACE),
+                request.get_host(), request.path, normalize_query(request))
+            entry = cache.get(key)
+            if entry is not None and cache_utils.get_generations(
+                    entry['authors']) == entry['authors']:
+                return Response(entry['data'], status=status.HTTP_200_OK)
+            response = handler(view, request, *args, **kwargs)
+            if response.status_code == status.HTTP_200_OK:
+                authors = cache_utils.get_generations(
+                    article_author_namespace(profile_id)
+                    for profile_id in Profile.objects.filter(
+                        username__in=embedded_authors(response.data)
+                    ).values_list('pk', flat=True))
+                cache.set(key, {'data': response.data, 'authors': authors},
+                          settings.ARTICLE_RESPONSE_CACHE_TIMEOUT)
+            return response
+        return wrapper
+    return decorator
+
+
+def invalidate_article_responses(slug):
+    """
+    invalidate_article_responses retires the cached list and the cached
+    detail of an article. It runs again once the surrounding transaction
+    commits, so a reader cannot re-cache the rows as they were before it.
+    """
+    def bump():
+        cache_utils.bump_generation(ARTICLE_LIST_NAMESPACE)
+        cache_utils.bump_generation(article_detail_namespace(slug))
+    bump()
+    transaction.on_commit(bump)
+
+
+def invalidate_author_responses(profile_ids):
+    """
+    invalidate_author_responses retires the cached responses that embed any
+    of the authors' summaries, now and again once the transaction commits
+    """
+    namespaces = [article_author_namespace(pk) for pk in profile_ids]
+
+    def bump():
+        for namespace in namespaces:
+            cache_utils.bump_generation(namespace)
+    bump()
+    transaction.on_commit(bump)
+
+
+def invalidate_all_article_responses():
+    cache_utils.bump_generation(ARTICLE_RESPONSES_NAMESPACE)
@@ -0,0 +1,107 @@
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.search import (SearchQuery, SearchRank,
+                                            TrigramSimilarity)
+from django.core.cache import cache
+from django.db.models import F, Func, IntegerField, Q, TextField, Value
+
+from ...core import cache as cache_utils
+from ...profiles.models import Profile
+from ..models import Article
+
+SEARCH_CONFIG = 'english'
+# namespace of cached result lists, invalidated whenever an article changes
+SEARCH_CACHE_NAMESPACE = 'articles:search'
+SEARCH_CACHE_TIMEOUT = 60 * 5
+# the most ids a single search keeps, in rank order. Paginated responses
+# flag `count_is_capped` when a search matched more than this
+SEARCH_RESULT_LIMIT = 1000
+
+
+class SearchHeadline(Func):
+    """
+    ts_headline() excerpt of a document with the words matching a query
+    wrapped in <mark> tags
+    """
+    function = 'ts_headline'
+    template = (f"%(function)s('{SEARCH_CONFIG}', %(expressions)s, "
+                "'StartSel=<mark>, StopSel=</mark>, MaxWords=35, "
+                "MinWords=15')")
+    output_field = TextField()
+
+
+class ArrayPosition(Func):
+    function = 'array_position'
+    output_field = IntegerField()
+
+
+def normalize_search_terms(terms):
+    """
+    normalize_search_terms lower-cases a query and collapses its whitespace
+    so that equivalent queries share one cache entry
+    """
+    return ' '.join(terms.lower().split())
+
+
+class ArticleSearch:
+    """
+    ArticleSearch runs a full-text query against the search_vector column
+    Postgres maintains on articles (title weighted above description, above
+    body). Matches are ranked by relevance; when there are none the title is
+    matched by trigram similarity instead so that typos still find something.
+    The ranked ids are cached per normalized query until an article changes.
+    At most SEARCH_RESULT_LIMIT results are kept; `count_is_capped` tells
+    whether apply dropped any.
+    """
+
+    def __init__(self, terms):
+        self.terms = normalize_search_terms(terms)
+        self.query = SearchQuery(self.terms, config=SEARCH_CONFIG)
+        self.count_is_capped = False
+
+    def ranked_ids(self):
+        """
+        ranked_ids gives the ids of the matches in rank order, one more than
+        SEARCH_RESULT_LIMIT when there are more matches than that
+        """
+        key = cache_utils.make_key(SEARCH_CACHE_NAMESPACE, self.terms)
+        ids = cache.get(key)
+        if ids is None:
+            ids = self.full_text_matches() or self.similar_title_matches()
+            cache.set(key, ids, SEARCH_CACHE_TIMEOUT)
+        return ids
+
+    def full_text_matches(self):
+        authors = Profile.objects.filter(username__iexact=self.terms)
+        return list(Article.objects.filter(
+            Q(search_vector=self.query) | Q(author__in=authors)
+        ).annotate(
+            rank=SearchRank(F('search_vector'), self.query)
+        ).order_by('-rank', '-created_at').values_list(
+            'pk', flat=True)[:SEARCH_RESULT_LIMIT + 1])
+
+    def similar_title_matches(self):
+        return list(Article.objects.filter(
+            title__trigram_similar=self.terms
+        ).annotate(
+            similarity=TrigramSimilarity('title', self.terms)
+        ).order_by('-similarity', '-created_at').values_list(
+            'pk', flat=True)[:SEARCH_RESULT_LIMIT + 1])
+
+    def apply(self, queryset):
+        """
+        apply narrows a queryset down to the search results, in rank order,
+        with a highlighted excerpt of each body as `search_highlight`
+        """
+        ids = self.ranked_ids()
+        self.count_is_capped = len(ids) > SEARCH_RESULT_LIMIT
+        ids = ids[:SEARCH_RESULT_LIMIT]
+        position = ArrayPosition(
+            Value(ids, output_field=ArrayField(IntegerField())), F('pk'))
+        return queryset.filter(pk__in=ids).annotate(
+            search_position=position,
+            search_highlight=SearchHeadline(F('body'), self.query)
+        ).order_by('search_position')
+
+
+def invalidate_search_cache():
+    cache_utils.bump_generation(SEARCH_CACHE_NAMESPACE)
@@ -0,0 +1,48 @@
+from django.core.cache import cache
+from django.db import connection
+
+from ...core import cache as cache_utils
+from ..models import Article
+
+# namespace of the cached tag cloud, invalidated whenever an article changes
+TAG_CACHE_NAMESPACE = 'articles:tags'
+TAG_CACHE_TIMEOUT = 60 * 60
+
+# every tag with the number of articles carrying it, most used first.
+# Only the tag_list column is read, the articles themselves are not loaded.
+TAG_CLOUD_SQL = """
+    SELECT tag, COUNT(*) AS count
+    FROM {table}, unnest({table}.tag_list) AS tag
+    GROUP BY tag
+    ORDER BY count DESC, tag
+"""
+
+
+def parse_tags(value):
+    """
+    parse_tags splits a comma separated query parameter into the tags it
+    names, dropping blanks
+    """
+    return [tag.strip() for tag in value.split(',') if tag.strip()]
+
+
+def get_tag_cloud():
+    """
+    get_tag_cloud returns a list of {'tag', 'count'} dicts for every tag in
+    use, most used first. The list is computed in a single query and cached
+    until an article is saved or deleted.
+    """
+    key = cache_utils.make_key(TAG_CACHE_NAMESPACE, 'cloud')
+    cloud = cache.get(key)
+    if cloud is None:
+        with connection.cursor() as cursor:
+            cursor.execute(TAG_CLOUD_SQL.format(
+                table=Article._meta.db_table))
+            cloud = [{'tag': tag, 'count': count}
+                     for tag, count in cursor.fetchall()]
+        cache.set(key, cloud, TAG_CACHE_TIMEOUT)
+    return cloud
+
+
+def invalidate_tag_cache():
+    cache_utils.bump_generation(TAG_CACHE_NAMESPACE)
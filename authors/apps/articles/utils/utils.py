@@ -2,8 +2,8 @@ import random
 import string
 import readtime
 
-from django.utils.text import slugify
-from django.db.models import Avg
+from django.utils.html import strip_tags
+from django.utils.text import Truncator, slugify
 from django.urls import reverse
 from urllib.parse import quote
 
@@ -17,16 +17,6 @@ def create_slug(instance):
     return slugify(instance.title)
 
 
-def get_average_rate(**kwargs):
-    average_ratings = kwargs.get('model').objects.all().filter(
-        article=kwargs.get('article')).aggregate(
-            Avg('rate_score')).get('rate_score__avg')
-    if average_ratings is None:
-        return 0
-    else:
-        return int(average_ratings)
-
-
 def get_article_read_time(body):
     """
     Calculates the time some article takes the average human to read,
@@ -50,6 +40,22 @@ def get_article_read_time(body):
         return "0 min read"
 
 
+def get_article_word_count(body):
+    """
+    Returns the number of words in the plain text of an article body
+    """
+    return len(strip_tags(body or '').split())
+
+
+def get_article_excerpt(body, words=40):
+    """
+    Returns the first `words` words of the plain text of an article body,
+    on a single line, with an ellipsis if the body was cut short
+    """
+    text = ' '.join(strip_tags(body or '').split())
+    return Truncator(text).words(words, truncate='…')
+
+
 def get_articles_url(obj, request):
     url = request.build_absolute_uri(reverse('articles:article-details',
                                              kwargs={
@@ -0,0 +1,54 @@
+from django.db.models import Case, CharField, Value, When
+
+from ..models import Article, Bookmark, Report
+from ...reactions.models import Reaction
+
+
+class ArticleViewerState:
+    """
+    ArticleViewerState answers, for one user and a page of articles, which of
+    those articles the user has liked, disliked, favorited, bookmarked and
+    reported. All five sets are fetched together in a single UNION query, so
+    serializers can look the answers up per row without touching the DB.
+    """
+    relations = ('liked', 'disliked', 'favorited', 'bookmarked', 'reported')
+
+    def __init__(self, user, article_ids):
+        self.article_ids = set(article_ids)
+        self.memberships = {relation: set() for relation in self.relations}
+        if user.is_anonymous or not self.article_ids:
+            return
+        for article_id, relation in self.query(user, self.article_ids):
+            self.memberships[relation].add(article_id)
+
+    @staticmethod
+    def query(user, article_ids):
+        """
+        query builds the UNION of (article id, relation) pairs linking the
+        user to any of the given articles
+        """
+        reactions = Reaction.objects.for_model(Article).filter(
+            user=user, object_id__in=article_ids).order_by().annotate(
+                relation=Case(
+                    When(reaction=Reaction.LIKE, then=Value('liked')),
+                    default=Value('disliked'), output_field=CharField()))
+        sources = (
+            ('favorited', Article.favorited_by.through.objects.filter(
+                profile__user=user)),
+            ('bookmarked', Bookmark.objects.filter(user=user)),
+            ('reported', Report.objects.filter(reporter__user=user)),
+        )
+        queries = [
+            queryset.filter(article_id__in=article_ids).order_by()
+            .annotate(relation=Value(relation, output_field=CharField()))
+            .values_list('article_id', 'relation')
+            for relation, queryset in sources
+        ]
+        return reactions.values_list('object_id', 'relation').union(
+            *queries, all=True)
+
+    def covers(self, article_id):
+        return article_id in self.article_ids
+
+    def has(self, relation, article_id):
+        return article_id in self.memberships[relation]
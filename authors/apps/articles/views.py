@@ -1,8 +1,10 @@
 from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Prefetch
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.response import Response
-from rest_framework import generics, permissions, filters
+from rest_framework import generics, permissions
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.permissions import IsAuthenticated
 
@@ -15,24 +17,55 @@ from .renderers import ArticleJSONRenderer, BookmarkJSONRenderer
 from .utils.model_helpers import *
 from ..profiles import models as profile_model
 
-from .models import Rating, Article, Bookmark, ReadStats, Report
-from .paginators import ArticleLimitOffsetPagination
-from .utils.custom_filters import ArticleFilter
-from authors.apps.notifications.tasks import send_email
+from .models import Rating, Article, Bookmark, Report
+from .parsers import NDJSONParser
+from .paginators import (ArticleLimitOffsetPagination, ArticlePagination,
+                         BookmarkCursorPagination, ReportPagination)
+from .utils.bulk_import import ArticleImport
+from .utils.custom_filters import (ArticleFilter, ArticleSearchFilter,
+                                   StableOrderingFilter)
+from .utils.response_cache import (ARTICLE_LIST_NAMESPACE,
+                                   article_detail_namespace,
+                                   cache_anonymous_response)
+from .utils.read_events import read_events
+from .utils.tags import get_tag_cloud
+from authors.apps.notifications.tasks import send_emails
+from authors.apps.notifications.utils.mailer import email_message
+from ..core.streaming import StreamingJSONListResponse
+from ..reactions.models import Reaction
 
 
 class ArticlesApiView (generics.ListCreateAPIView):
     """The ArticleDetailApiView handles the retreiving of a all article,
     and creation of a new article.
+    `?summary=true` lists articles with their excerpt instead of their body.
     """
     queryset = models.Article.objects.all()
     permission_classes = (permissions.IsAuthenticatedOrReadOnly,)
     serializer_class = serializers.ArticleSerializer
     renderer_classes = (ArticleJSONRenderer,)
-    pagination_class = ArticleLimitOffsetPagination
-    filter_backends = (DjangoFilterBackend, filters.SearchFilter, )
+    pagination_class = ArticlePagination
+    filter_backends = (DjangoFilterBackend, ArticleSearchFilter, )
     filter_class = ArticleFilter
-    search_fields = ('author__username', 'description', 'body', 'title', )
+
+    def wants_summary(self):
+        return self.request.query_params.get('summary') == 'true'
+
+    def get_queryset(self):
+        queryset = models.Article.objects.for_display()
+        if self.wants_summary():
+            # summaries carry the excerpt, the body need not be loaded
+            queryset = queryset.defer('body')
+        return queryset
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['summary'] = self.wants_summary()
+        return context
+
+    @cache_anonymous_response(lambda **kwargs: ARTICLE_LIST_NAMESPACE)
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
 
     def post(self, request):
         data = request.data
@@ -48,6 +81,27 @@ class ArticlesApiView (generics.ListCreateAPIView):
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
 
+class ArticleImportAPIView(generics.GenericAPIView):
+    """
+    ArticleImportAPIView lets an admin load articles in bulk by posting
+    them as NDJSON, one article per line. Records without an author are
+    credited to the admin. `?notify=true` announces the imported articles
+    to their authors' followers in one deferred job.
+    """
+    permission_classes = (permissions.IsAdminUser,)
+    parser_classes = (NDJSONParser,)
+
+    def post(self, request):
+        result = ArticleImport(
+            default_author=request.user.profile,
+            notify=request.query_params.get('notify') == 'true',
+        ).run(request.data)
+        status_code = status.HTTP_201_CREATED if result.imported or \
+            not result.errors else status.HTTP_400_BAD_REQUEST
+        return Response({"imported": result.imported,
+                         "errors": result.errors}, status=status_code)
+
+
 class ArticleDetailApiView (generics.GenericAPIView):
     """
     The ArticleDetailApiView handles the retreiving,
@@ -62,8 +116,10 @@ class ArticleDetailApiView (generics.GenericAPIView):
         article = get_single_article_using_slug(slug)
         return article
 
+    @cache_anonymous_response(article_detail_namespace)
     def get(self, request, slug):
-        article = self.get_object(slug)
+        article = get_single_article_using_slug(
+            slug, models.Article.objects.for_display())
         context = {"request": request}
         if not article:
             return Response({
@@ -73,11 +129,10 @@ class ArticleDetailApiView (generics.GenericAPIView):
                                                 context=context)
         # We try to add the user to the readstats of an article after they read
         # the article, but only if they are logged in and are not the authors
-        # of the article.
+        # of the article. The read is buffered and recorded in the background
         if not request.user.is_anonymous and\
                 article.author.pk != request.user.pk:
-            ReadStats.objects.get_or_create(
-                user=request.user, article=article)
+            read_events.add(request.user.pk, article.pk)
         return Response(serialized_data.data, status=status.HTTP_200_OK)
 
     def patch(self, request, slug):
@@ -130,15 +185,13 @@ class LikeDislikeArticleAPIView(generics.GenericAPIView):
         article = get_single_article_using_slug(slug)
 
         if article and action is 'like':
-            article.disliked_by.remove(request.user)
-            article.liked_by.add(request.user)
+            Reaction.objects.react(request.user, article, Reaction.LIKE)
             return Response({
                 'message': 'You liked this article!'
             })
 
         if article and action is 'dislike':
-            article.liked_by.remove(request.user)
-            article.disliked_by.add(request.user)
+            Reaction.objects.react(request.user, article, Reaction.DISLIKE)
             return Response({
                 'message': 'You disliked this article!'
             })
@@ -154,13 +207,13 @@ class LikeDislikeArticleAPIView(generics.GenericAPIView):
         article = get_single_article_using_slug(slug)
 
         if article and action is 'like':
-            article.liked_by.remove(request.user)
+            Reaction.objects.unreact(request.user, article, Reaction.LIKE)
             return Response({
                 'message': 'You no longer like this article'
             })
 
         if article and action is 'dislike':
-            article.disliked_by.remove(request.user)
+            Reaction.objects.unreact(request.user, article, Reaction.DISLIKE)
             return Response({
                 'message': 'You no longer dislike this article'
             })
@@ -178,15 +231,17 @@ class ArticlesIsLikedDislikedAPIView(generics.GenericAPIView):
 
     def get(self, request, slug='', action='like'):
         article = get_single_article_using_slug(slug)
+        if article:
+            reaction = Reaction.objects.reaction_of(request.user, article)
 
         if article and action is 'like':
             return Response({
-                'is_liked': article.is_liked_by(request.user)
+                'is_liked': reaction == Reaction.LIKE
             })
 
         if article and action is 'dislike':
             return Response({
-                'is_disliked': article.is_disliked_by(request.user)
+                'is_disliked': reaction == Reaction.DISLIKE
             })
 
         return Response({
@@ -243,6 +298,10 @@ class ArticleRatingAPIView(generics.GenericAPIView):
 
         article = get_single_article_using_slug(slug)
         user = request.user
+        if not article:
+            return Response({
+                'errors': 'article with that slug does not exist'
+            }, status=status.HTTP_404_NOT_FOUND)
 
         serializer = self.serializer_class(data=request.data)
         serializer.is_valid(raise_exception=True)
@@ -264,24 +323,50 @@ class ArticleRatingAPIView(generics.GenericAPIView):
                              'message': message},
                             status=status.HTTP_403_FORBIDDEN)
 
-        try:
-            Rating.objects.get(user=user.pk, article_id=article.pk)
-            message = 'You already rated this article'
-            data = {
-                "title": article.title,
-                "author": article.author.username,
-                "average_ratings": article.average_ratings
-            }
-            return Response({'articles': data,
-                             'message': message},
-                            status=status.HTTP_422_UNPROCESSABLE_ENTITY)
-        except Rating.DoesNotExist:
-            serializer.save(user=user, article=article)
-            rate_data = serializer.data
+        created = Rating.objects.rate(user, article,
+                                      serializer.validated_data['rate_score'])
+        rating = Rating.objects.select_related(
+            'article__author__user', 'article__rating_aggregate').get(
+                user=user, article=article)
+        rate_data = self.serializer_class(rating).data
+        if created:
             message = 'You have rated this article successfully'
-            return Response({'articles': rate_data,
-                             'message': message},
-                            status=status.HTTP_201_CREATED)
+            status_code = status.HTTP_201_CREATED
+        else:
+            message = 'You have updated your rating of this article'
+            status_code = status.HTTP_200_OK
+        return Response({'articles': rate_data,
+                         'message': message},
+                        status=status_code)
+
+
+class ArticleRatingDistributionAPIView(generics.GenericAPIView):
+    """
+    Returns how an article's ratings are spread over the 1 to 5 scale,
+    read from its rating aggregate alone
+    """
+    permission_classes = (permissions.IsAuthenticatedOrReadOnly,)
+    renderer_classes = (ArticleJSONRenderer,)
+
+    def get(self, request, slug):
+        aggregate = models.Article.objects.filter(slug=slug).values(
+            'rating_aggregate__count', 'rating_aggregate__total',
+            'rating_aggregate__histogram').first()
+        if aggregate is None:
+            return Response({
+                'errors': 'article with that slug does not exist'
+            }, status=status.HTTP_404_NOT_FOUND)
+        summary = models.RatingAggregate(
+            count=aggregate['rating_aggregate__count'] or 0,
+            total=aggregate['rating_aggregate__total'] or 0,
+            histogram=aggregate['rating_aggregate__histogram'] or
+            models.empty_histogram())
+        return Response({
+            'slug': slug,
+            'count': summary.count,
+            'average': round(summary.average, 2),
+            'distribution': summary.distribution()
+        })
 
 
 class ArticleTagsApiView(generics.GenericAPIView):
@@ -299,6 +384,30 @@ class ArticleTagsApiView(generics.GenericAPIView):
             status=status.HTTP_404_NOT_FOUND)
 
 
+class ArticleTagCloudApiView(generics.GenericAPIView):
+    """
+    Returns every tag in use with the number of articles carrying it,
+    most used first
+    """
+
+    def get(self, request):
+        return Response({'tags': get_tag_cloud()}, status=status.HTTP_200_OK)
+
+
+class ArticlesByTagApiView(generics.ListAPIView):
+    """
+    Returns a paginated list of the articles tagged with a tag name
+    """
+    permission_classes = (permissions.AllowAny,)
+    serializer_class = serializers.ArticleSerializer
+    renderer_classes = (ArticleJSONRenderer,)
+    pagination_class = ArticlePagination
+
+    def get_queryset(self):
+        return models.Article.objects.for_display().filter(
+            tag_list__contains=[self.kwargs['tag_name']])
+
+
 class BookmarkAPIView(generics.ListAPIView):
     """
     Class returns all articles in bookmarks of the user logged in
@@ -306,14 +415,39 @@ class BookmarkAPIView(generics.ListAPIView):
     permission_classes = (permissions.IsAuthenticated,)
     serializer_class = serializers.BookmarkSerializer
     renderer_classes = (BookmarkJSONRenderer,)
+    pagination_class = BookmarkCursorPagination
 
     def get_queryset(self):
         """
         This view should return a list of all the bookmarks
         for the currently authenticated user.
         """
-        user = self.request.user
-        return Bookmark.objects.filter(user=user)
+        return Bookmark.objects.for_listing(self.request.user).order_by('id')
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        if self.paginator.wants_cursor(request):
+            return super().list(request, *args, **kwargs)
+        return StreamingJSONListResponse(
+            queryset, self.serializer_class, 'bookmarks',
+            context=self.get_serializer_context())
+
+
+class BookmarkSyncAPIView(generics.GenericAPIView):
+    """
+    Adds and removes many bookmarks of the user logged in at once, so a
+    client can send the changes it made to its reading list while offline
+    in a single request
+    """
+    permission_classes = (permissions.IsAuthenticated,)
+    serializer_class = serializers.BookmarkSyncSerializer
+
+    def post(self, request):
+        serializer = self.serializer_class(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        changes = Bookmark.objects.sync(request.user,
+                                        **serializer.validated_data)
+        return Response(changes, status=status.HTTP_200_OK)
 
 
 class ArticleBookmarkAPIView(generics.GenericAPIView):
@@ -334,10 +468,7 @@ class ArticleBookmarkAPIView(generics.GenericAPIView):
                 'error': error,
                 'status': status.HTTP_404_NOT_FOUND},
                 status=status.HTTP_404_NOT_FOUND)
-        user = request.user
-        bookmark = get_single_bookmark_or_create_bookmark(article, user)
-
-        if bookmark:
+        if not Bookmark.objects.add(request.user, article):
             return Response({
                 'message': f'Article already exists in bookmarks',
                 'status': status.HTTP_400_BAD_REQUEST
@@ -361,10 +492,8 @@ class ArticleBookmarkAPIView(generics.GenericAPIView):
                 'error': f'An article with this slug,{slug}, does not exist',
                 'status': status.HTTP_404_NOT_FOUND},
                 status=status.HTTP_404_NOT_FOUND)
-        user = request.user
-        bookmark = get_single_bookmark_user(article, user)
-        if bookmark:
-            bookmark.delete()
+        deleted, _ = get_single_bookmark_user(article, request.user).delete()
+        if deleted:
             message = f'Article has been deleted from your bookmarks'
             return Response({
                 'message': message,
@@ -392,7 +521,8 @@ class ReportArticleAPIView(generics.GenericAPIView):
         article_url = request.build_absolute_uri(article_url)
         body = f"""Article {article_url} has been reported by
         {reporter.username} for the reason {request.data["reason"]}"""
-        send_email.delay('Report Article', body, [settings.DEFAULT_FROM_EMAIL])
+        send_emails.delay([email_message('Report Article', body,
+                                         [settings.DEFAULT_FROM_EMAIL])])
 
     def check_if_user_can_report(self, article, reporter):
         """
@@ -406,7 +536,8 @@ class ReportArticleAPIView(generics.GenericAPIView):
         elif article.author == reporter:
             msg = "You cannot report your own article"
             status_code = status.HTTP_403_FORBIDDEN
-        elif Report.objects.filter(reporter=reporter, article=article):
+        elif Report.objects.filter(reporter=reporter,
+                                   article=article).exists():
             msg = "You already reported this article"
             status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
         return msg, status_code
@@ -420,7 +551,14 @@ class ReportArticleAPIView(generics.GenericAPIView):
         context = {"request": request}
         serializer = self.serializer_class(data=request.data, context=context)
         serializer.is_valid(raise_exception=True)
-        serializer.save(reporter=reporter, article=article)
+        try:
+            with transaction.atomic():
+                serializer.save(reporter=reporter, article=article)
+        except IntegrityError:
+            # the same report came in concurrently since the check above
+            return Response(
+                {"message": "You already reported this article"},
+                status=status.HTTP_422_UNPROCESSABLE_ENTITY)
         self.email_admin(article, request, reporter)
         msg = f"You have reported this article {article.title}"
         response_data = {"message": msg, "report": serializer.data}
@@ -442,10 +580,53 @@ class ReportsAPIView(generics.GenericAPIView):
         else:
             user = request.user.profile
             reports = user.report_set.all()
+        # everything the nested articles render is joined or prefetched
+        # per streamed batch, their viewer state is resolved per batch
+        reports = reports.select_related(
+            'reporter', 'article__author',
+            'article__rating_aggregate').prefetch_related(
+                Prefetch('article__favorited_by',
+                         queryset=profile_model.Profile.objects.only(
+                             'pk')))
         context = {"request": request}
-        serializer = self.serializer_class(reports, many=True, context=context)
-        response_data = {"reports": serializer.data}
-        return Response(response_data, status=status.HTTP_200_OK)
+        return StreamingJSONListResponse(
+            reports.order_by('id'), self.serializer_class, 'reports',
+            context=context)
+
+
+class ModerationQueueAPIView(generics.ListAPIView):
+    """
+    ModerationQueueAPIView lists the reported articles for admins, most
+    reported first, each with its report count, latest report time and
+    most given reasons. `?ordering=` sorts by `report_count` or
+    `latest_report_at`, prefixed with `-` for descending order.
+    """
+    permission_classes = (permissions.IsAdminUser,)
+    serializer_class = serializers.ReportedArticleSerializer
+    pagination_class = ArticleLimitOffsetPagination
+    filter_backends = (StableOrderingFilter,)
+    ordering_fields = ('report_count', 'latest_report_at')
+    ordering = ('-report_count', '-latest_report_at')
+
+    def get_queryset(self):
+        return Report.objects.moderation_queue()
+
+
+class ArticleReportsAPIView(generics.ListAPIView):
+    """
+    ArticleReportsAPIView lists the reports on one article for admins,
+    latest first
+    """
+    permission_classes = (permissions.IsAdminUser,)
+    serializer_class = serializers.ReportSummarySerializer
+    pagination_class = ReportPagination
+
+    def get_queryset(self):
+        return Report.objects.filter(
+            article__slug=self.kwargs['slug']).select_related(
+                'reporter').only(
+                    'reason', 'created_at', 'reporter__username').order_by(
+                        '-created_at', '-id')
 
 
 class ReportAPIView(generics.GenericAPIView):
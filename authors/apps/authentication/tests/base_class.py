@@ -1,6 +1,11 @@
 """Test base class file containing setup"""
 import json
+
+from celery.app.defaults import DEFAULTS
+from django.conf import settings
 from django.core import mail
+from django.dispatch import receiver
+from django.test.signals import setting_changed
 
 from authors.apps.authentication.models import User
 from authors.apps.authentication.tests.test_data.login_data import (
@@ -13,6 +18,23 @@ from django.urls import reverse
 from authors.apps.articles.models import Article
 from authors.apps.profiles.models import Profile
 from authors.apps.comments.models import Comment
+from authors.apps.core.celery import app
+
+
+@receiver(setting_changed)
+def on_celery_setting_changed(setting, value, enter, **kwargs):
+    """
+    celery copies its settings once, so changes made with override_settings
+    (e.g. CELERY_TASK_ALWAYS_EAGER, since there is no worker under test) are
+    copied over as they happen
+    """
+    if not setting.startswith('CELERY_'):
+        return
+    key = setting[len('CELERY_'):].lower()
+    if enter or hasattr(settings, setting):
+        app.conf[key] = value
+    else:
+        app.conf[key] = DEFAULTS.get(key)
 
 
 class BaseTest(APITestCase):
@@ -38,7 +60,8 @@ class BaseTest(APITestCase):
         """
         Method that registers a user and uses the outbox method of django's
         email services to access the sent email and extract the url from the
-        sent link.
+        sent link. There is no worker under test, so the test has to run
+        its tasks in place with CELERY_TASK_ALWAYS_EAGER.
         """
         self.register_test_user()
         token = (mail.outbox[0].body.split("\n").pop(1).split(
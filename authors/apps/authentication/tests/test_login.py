@@ -1,6 +1,7 @@
 """Tests for user login"""
 import json
 from django.core import mail
+from django.test import override_settings
 from rest_framework import status
 from .test_data.login_data import (valid_login_data, login_no_email,
                                    login_no_password, login_unregistered_email,
@@ -9,6 +10,7 @@ from .test_data.login_data import (valid_login_data, login_no_email,
 from .base_class import BaseTest
 
 
+@override_settings(CELERY_TASK_ALWAYS_EAGER=True)
 class LoginTest(BaseTest):
 
     def test_login_successful(self):
@@ -1,6 +1,7 @@
 """Tests for user registration"""
 import json
 from django.core import mail
+from django.test import override_settings
 from django.urls import reverse
 from rest_framework import status
 from .test_data.register_data import (
@@ -13,6 +14,7 @@ from .test_data import login_data
 from .base_class import BaseTest
 
 
+@override_settings(CELERY_TASK_ALWAYS_EAGER=True)
 class RegistrationTest(BaseTest):
     """
     unit tests for all modules under user registration
@@ -12,9 +12,12 @@ from .test_data.password_reset_data import (
     registered_email, unregistered_email, new_valid_password,
     new_blank_password, new_invalid_password, new_short_password
 )
+from django.core import mail
+from django.test import override_settings
 from django.urls import reverse
 
 
+@override_settings(CELERY_TASK_ALWAYS_EAGER=True)
 class ResetPassword(BaseTest):
 
     def setUp(self):
@@ -34,6 +37,8 @@ class ResetPassword(BaseTest):
             content_type='application/json'
         )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(mail.outbox[-1].to,
+                         [registered_email['user']['email']])
 
     def test_request_password_reset_unregistered_user(self):
         """test user with no account requests for a password reset"""
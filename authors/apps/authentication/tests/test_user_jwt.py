@@ -1,7 +1,7 @@
 import json
 import os
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.core import mail
 from django.urls import reverse
 
@@ -12,6 +12,7 @@ from .base_class import BaseTest
 from .test_data import login_data, register_data
 
 
+@override_settings(CELERY_TASK_ALWAYS_EAGER=True)
 class TestUserJwtAuthentication (BaseTest):
     """This class tests The JWT authentcation
     it contains tests that test whether
@@ -2,7 +2,6 @@ import os
 import uuid
 from django.conf import settings
 from django.contrib.sites.shortcuts import get_current_site
-from django.core.mail import send_mail
 from django.utils.http import urlsafe_base64_decode, urlsafe_base64_encode
 from django.utils.encoding import force_bytes
 from django.urls import reverse
@@ -13,6 +12,8 @@ from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from ..core.password_reset_manager import PasswordResetManager
+from ..notifications.tasks import send_emails
+from ..notifications.utils.mailer import email_message
 
 from .renderers import UserJSONRenderer
 from .serializers import (
@@ -74,13 +75,14 @@ class RegistrationAPIView(GenericAPIView):
         """
         domain = f"{os.getenv('FRONT_END_URL')}"
         link = f'{domain}email-verification/{token}'
-        # send_mail(subject, message, from_email, to_list, fail_silently=True)
         subject = "Activation for your Author's Haven account"
         message = f'Thank you, Please Activate your account below.\n{link}'
         from_mail = settings.EMAIL_HOST_USER
         to_mail = [user.email]
 
-        send_mail(subject, message, from_mail, to_mail, fail_silently=True)
+        # sent by a worker, registering does not wait on the mail server
+        send_emails.delay([email_message(subject, message, to_mail,
+                                         from_email=from_mail)])
 
         response_data = {
             "email": user.email,
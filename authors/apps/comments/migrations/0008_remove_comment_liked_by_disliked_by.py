@@ -0,0 +1,22 @@
+# Generated by Django 2.1.5 on 2026-10-18 14:03
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('comments', '0007_comment_reaction_counters'),
+        ('reactions', '0002_move_likes_and_dislikes'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='comment',
+            name='disliked_by',
+        ),
+        migrations.RemoveField(
+            model_name='comment',
+            name='liked_by',
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 2.1.5 on 2026-10-18 14:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('comments', '0008_remove_comment_liked_by_disliked_by'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['article', 'created_at', 'id'], name='comments_co_article_3837f6_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='commentreply',
+            index=models.Index(fields=['comment', 'created_at', 'id'], name='comments_co_comment_279e52_idx'),
+        ),
+    ]
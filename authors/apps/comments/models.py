@@ -1,12 +1,66 @@
 from django.conf import settings
-
+from django.contrib.contenttypes.fields import GenericRelation
 from django.db import models
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Coalesce
 from rest_framework.reverse import reverse
 
 from simple_history.models import HistoricalRecords
 
 from ..profiles.models import Profile
 from ..articles.models import Article
+from ..reactions.models import Reaction
+
+
+class CommentManager(models.Manager):
+    """
+    CommentManager class is a custom Comment model manager
+    """
+    # the ids of the first `limit` replies to each of the comments
+    first_replies_sql = """
+        SELECT id FROM (
+            SELECT id, row_number() OVER (
+                PARTITION BY comment_id ORDER BY created_at, id) AS position
+            FROM {table} WHERE comment_id = ANY(%s)
+        ) ranked
+        WHERE position <= %s
+    """
+
+    def adjust_counters(self, comment_id, **deltas):
+        """
+        adjust_counters moves the given counter columns of a comment by the
+        given amounts in a single UPDATE
+        """
+        self.filter(pk=comment_id).update(
+            **{field: F(field) + delta for field, delta in deltas.items()})
+
+    def thread(self, article):
+        """
+        thread returns the comments on an article with their authors and
+        the number of replies each has, counted per comment in SQL
+        """
+        replies = CommentReply.objects.filter(
+            comment=OuterRef('pk')).order_by().values('comment').annotate(
+                total=Count('pk')).values('total')
+        return self.filter(article=article).select_related('author').annotate(
+            reply_count=Coalesce(Subquery(
+                replies, output_field=models.IntegerField()), 0))
+
+    def first_replies(self, comment_ids, limit):
+        """
+        first_replies maps each of the comments to its `limit` oldest
+        replies, with their authors, fetched together in one query
+        """
+        replies = {comment_id: [] for comment_id in comment_ids}
+        if not replies or limit <= 0:
+            return replies
+        first = RawSQL(self.first_replies_sql.format(
+            table=CommentReply._meta.db_table), [list(replies), limit])
+        for reply in CommentReply.objects.filter(pk__in=first).select_related(
+                'author').order_by('created_at', 'id'):
+            replies[reply.comment_id].append(reply)
+        return replies
 
 
 class Comment(models.Model):
@@ -18,17 +72,22 @@ class Comment(models.Model):
     updated_at = models.DateTimeField(auto_now=True, null=True)
     author = models.ForeignKey(Profile, on_delete=models.CASCADE)
     article = models.ForeignKey(Article, on_delete=models.CASCADE)
-    edit_history = HistoricalRecords()
-    liked_by = models.ManyToManyField(to=settings.AUTH_USER_MODEL,
-                                      related_name='liked_comments')
-    disliked_by = models.ManyToManyField(to=settings.AUTH_USER_MODEL,
-                                         related_name='disliked_comments')
+    edit_history = HistoricalRecords(
+        excluded_fields=['like_count', 'dislike_count'])
+    # likes and dislikes of this comment, counted by the reactions service
+    reactions = GenericRelation(Reaction, related_query_name='comment')
+    like_count = models.IntegerField(default=0)
+    dislike_count = models.IntegerField(default=0)
+
+    objects = CommentManager()
 
     class Meta:
         """
         Ensure that the comments are returned in the order they were created
         """
         ordering = ['-created_at']
+        # serves an article's thread a page at a time
+        indexes = [models.Index(fields=['article', 'created_at', 'id'])]
 
     def __str__(self):
         return self.body
@@ -41,14 +100,6 @@ class Comment(models.Model):
         return settings.URL + reverse('comments:comment-details',
                                       kwargs={"pk": self.pk})
 
-    @property
-    def like_count(self):
-        return self.liked_by.count()
-
-    @property
-    def dislike_count(self):
-        return self.disliked_by.count()
-
 
 class CommentReply(models.Model):
     """The model defines the Comment-Replies table as stored in the DB
@@ -66,6 +117,8 @@ class CommentReply(models.Model):
         created
         """
         ordering = ['-created_at']
+        # serves the first replies to each comment of a thread page
+        indexes = [models.Index(fields=['comment', 'created_at', 'id'])]
 
     def __str__(self):
         return self.body
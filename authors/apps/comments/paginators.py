@@ -0,0 +1,19 @@
+from ..core.pagination import OptInCursorPagination
+
+
+class CommentCursorPagination(OptInCursorPagination):
+    """
+    Pages comments and replies by (created_at, id) cursor on request, they
+    are returned whole otherwise
+    """
+
+
+class CommentThreadPagination(CommentCursorPagination):
+    """
+    Threads are always paged by cursor, popular ones are too long to be
+    returned whole
+    """
+    page_size = 20
+
+    def wants_cursor(self, request):
+        return True
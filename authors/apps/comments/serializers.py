@@ -4,6 +4,7 @@ from rest_framework.exceptions import ValidationError
 from authors.apps.core import serializers as custom_serializers
 from .models import Comment, CommentReply
 from ..profiles import serializers as profile_serializers
+from ..reactions.models import Reaction
 
 
 class CommentSerializer(custom_serializers.ModelSerializer):
@@ -13,7 +14,7 @@ class CommentSerializer(custom_serializers.ModelSerializer):
     It specifies the author, article, created_at and updated_at fields
     as read-only since these fields data is auto generated
     """
-    author = profile_serializers.ProfileSerializer(read_only=True)
+    author = profile_serializers.AuthorSummarySerializer(read_only=True)
     like_status = serializers.SerializerMethodField()
     dislike_status = serializers.SerializerMethodField()
 
@@ -38,13 +39,17 @@ class CommentSerializer(custom_serializers.ModelSerializer):
             "author",
             "created_at",
             'updated_at',
-            "id"
+            "id",
+            "like_count",
+            "dislike_count"
         )
         extra_kwargs = {
             'commenting_on': {
                 'required': False
             }
         }
+        list_serializer_class = \
+            profile_serializers.AuthorSummaryListSerializer
 
     def validate_commenting_on(self, data):
         if not data:
@@ -64,23 +69,24 @@ class CommentSerializer(custom_serializers.ModelSerializer):
         """
         Check if the logged in user has liked the comment-
         """
-
-        if self.context["request"].user.is_anonymous:
-            return False
-        if self.context["request"].user in obj.liked_by.all():
-            return True
-        return False
+        return self.get_viewer_reaction(obj) == Reaction.LIKE
 
     def get_dislike_status(self, obj):
         """
        Check if the logged in user has disliked the comment
         """
+        return self.get_viewer_reaction(obj) == Reaction.DISLIKE
 
-        if self.context["request"].user.is_anonymous:
-            return False
-        if self.context["request"].user in obj.disliked_by.all():
-            return True
-        return False
+    def get_viewer_reaction(self, obj):
+        """
+        get_viewer_reaction looks the logged in user's reaction to the
+        comment up once for both status fields
+        """
+        reactions = self.context.setdefault('viewer_reactions', {})
+        if obj.pk not in reactions:
+            reactions[obj.pk] = Reaction.objects.reaction_of(
+                self.context["request"].user, obj)
+        return reactions[obj.pk]
 
 
 class CommentReplySerializer(serializers.ModelSerializer):
@@ -90,7 +96,7 @@ class CommentReplySerializer(serializers.ModelSerializer):
     the author, comment,created_at and updated_at fields as read-only
     since these fields data is auto generated
     """
-    author = profile_serializers.ProfileSerializer(read_only=True)
+    author = profile_serializers.AuthorSummarySerializer(read_only=True)
 
     class Meta:
         model = CommentReply
@@ -109,3 +115,57 @@ class CommentReplySerializer(serializers.ModelSerializer):
             'comment',
             "id"
         )
+        list_serializer_class = \
+            profile_serializers.AuthorSummaryListSerializer
+
+
+class ThreadReplySerializer(serializers.ModelSerializer):
+    """
+    A reply as it is previewed under its comment in a thread
+    """
+    author = profile_serializers.AuthorSummarySerializer(read_only=True)
+
+    class Meta:
+        model = CommentReply
+        fields = ("id", "body", "author", "created_at", "updated_at")
+
+
+class CommentThreadListSerializer(
+        profile_serializers.AuthorSummaryListSerializer):
+    """
+    CommentThreadListSerializer fetches the reply previews of every comment
+    on the page, the viewer's reactions to them and the summaries of their
+    authors, one query each, before serializing the comments
+    """
+
+    def to_representation(self, data):
+        items = list(data)
+        comment_ids = [item.pk for item in items]
+        self.context['thread_replies'] = Comment.objects.first_replies(
+            comment_ids, self.context.get('reply_limit', 0))
+        self.context['viewer_reactions'] = Reaction.objects.reactions_of(
+            self.context['request'].user, Comment, comment_ids)
+        return super().to_representation(items)
+
+    def authors_of(self, item):
+        replies = self.context['thread_replies'].get(item.pk, [])
+        return [item.author] + [reply.author for reply in replies]
+
+
+class CommentThreadSerializer(CommentSerializer):
+    """
+    A comment in a thread, with its reply count, its first replies and the
+    viewer's reaction to it. Pages of these are serialized in a fixed
+    number of queries
+    """
+    reply_count = serializers.IntegerField(read_only=True)
+    replies = serializers.SerializerMethodField()
+
+    class Meta(CommentSerializer.Meta):
+        fields = CommentSerializer.Meta.fields + ("reply_count", "replies")
+        list_serializer_class = CommentThreadListSerializer
+
+    def get_replies(self, obj):
+        replies = self.context.get('thread_replies', {}).get(obj.pk, [])
+        return ThreadReplySerializer(replies, many=True,
+                                     context=self.context).data
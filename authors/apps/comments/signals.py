@@ -1,8 +1,9 @@
-from django.db.models.signals import (
-    post_save, m2m_changed as model_field_changed_signal)
+from django.db.models.signals import post_save
 from django.dispatch import receiver, Signal
 
 from authors.apps.comments.models import Comment
+from authors.apps.reactions.models import Reaction
+from authors.apps.reactions.signals import reaction_added_signal
 
 
 # custom signal we shall send when a comment is published
@@ -24,19 +25,15 @@ def on_comment_post_save(sender, **kwargs):
                                       comment=kwargs['instance'])
 
 
-@receiver(model_field_changed_signal, sender=Comment.liked_by.through)
+@receiver(reaction_added_signal, sender=Comment)
 def on_like_comment(sender, **kwargs):
     """
     on_like_comment is run when a user likes a comment. Then calls a signal
     to notify the user
     """
-    comment = kwargs.get("instance")
-    user_model = kwargs.get("model")
-    action = kwargs.get("action")
-    pk_set = kwargs.get("pk_set")
-    if action == "post_add":
-        user_id = [pk for pk in pk_set]
+    if kwargs["reaction"] == Reaction.LIKE:
+        user = kwargs["user"]
         comment_liked_signal.send(CommentsSignalSender,
-                                  comment=comment,
-                                  user_model=user_model,
-                                  id=user_id[0])
+                                  comment=kwargs["target"],
+                                  user_model=type(user),
+                                  id=user.pk)
@@ -0,0 +1,86 @@
+from django.urls import reverse
+from rest_framework import status
+
+from authors.apps.comments.models import CommentReply
+from authors.apps.reactions.models import Reaction
+from .base_class import BaseTest
+
+
+class TestCommentThread(BaseTest):
+    """
+    Tests the paged comment thread of an article
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.author, self.article = \
+            self.create_article_and_authenticate_test_user()
+        self.reader = self.create_another_user_in_db()
+        self.thread_url = reverse('comments:comment-thread',
+                                  kwargs={'slug': self.article.slug})
+
+    def add_comments(self, total):
+        comments = [self.create_comment(self.article, self.author)
+                    for _ in range(total)]
+        for comment in comments:
+            for number in range(2):
+                CommentReply.objects.create(
+                    body=f"reply {number}", comment=comment,
+                    author=self.reader.profile)
+            Reaction.objects.react(self.reader, comment, Reaction.LIKE)
+        return comments
+
+    def test_thread_previews_replies_and_viewer_reactions(self):
+        first, second = self.add_comments(2)
+        Reaction.objects.react(self.reader, first, Reaction.DISLIKE)
+        self.client.force_authenticate(user=self.reader)
+        response = self.client.get(self.thread_url, {'replies': 1})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        newest, oldest = response.data['comments']
+        self.assertEqual((newest['id'], oldest['id']), (second.pk, first.pk))
+        self.assertEqual(newest['reply_count'], 2)
+        self.assertEqual([reply['body'] for reply in newest['replies']],
+                         ['reply 0'])
+        self.assertEqual(newest['replies'][0]['author']['username'],
+                         self.reader.username)
+        self.assertEqual(newest['author']['username'], self.author.username)
+        self.assertEqual(newest['author']['followers_count'], 0)
+        self.assertNotIn('followers', newest['author'])
+        self.assertTrue(newest['like_status'])
+        self.assertTrue(oldest['dislike_status'])
+        self.assertEqual(oldest['like_count'], 0)
+
+    def test_thread_is_paged_by_cursor(self):
+        comments = self.add_comments(3)
+        response = self.client.get(self.thread_url, {'limit': 2})
+        self.assertEqual([comment['id'] for comment in
+                          response.data['comments']],
+                         [comments[2].pk, comments[1].pk])
+        response = self.client.get(response.data['next'])
+        self.assertEqual([comment['id'] for comment in
+                          response.data['comments']], [comments[0].pk])
+        self.assertIsNone(response.data['next'])
+
+    def test_thread_costs_the_same_whatever_its_size(self):
+        self.client.force_authenticate(user=self.reader)
+        self.add_comments(2)
+        with self.assertNumQueries(5):
+            # the article, the page, the reply previews, the reactions and
+            # the author summaries
+            self.client.get(self.thread_url)
+        self.add_comments(8)
+        with self.assertNumQueries(5):
+            response = self.client.get(self.thread_url)
+        self.assertEqual(len(response.data['comments']), 10)
+
+    def test_reply_previews_can_be_turned_off(self):
+        self.add_comments(1)
+        response = self.client.get(self.thread_url, {'replies': 0})
+        comment = response.data['comments'][0]
+        self.assertEqual(comment['replies'], [])
+        self.assertEqual(comment['reply_count'], 2)
+
+    def test_thread_of_a_missing_article(self):
+        response = self.client.get(reverse('comments:comment-thread',
+                                           kwargs={'slug': 'missing'}))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -670,3 +670,20 @@ class TestCommenting(base_class.BaseTest):
             "do not dislike",
             response.data['message'])
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_comments_can_be_paged_by_cursor(self):
+        self.create_comment()
+        for body in ("second", "third"):
+            self.client.post(self.comments_url,
+                             data=json.dumps({"body": body}),
+                             content_type='application/json')
+        response = self.client.get(
+            self.comments_url, {'pagination': 'cursor', 'limit': 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([c['body'] for c in response.data['comments']],
+                         ["third", "second"])
+        self.assertNotIn('commentCount', response.data)
+        response = self.client.get(response.data['next'])
+        self.assertEqual([c['body'] for c in response.data['comments']],
+                         ["very true"])
+        self.assertIsNone(response.data['next'])
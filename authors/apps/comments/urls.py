@@ -2,6 +2,7 @@ from django.urls import path
 
 from .views import (
     CommentApiView,
+    CommentThreadApiView,
     CommentDetailApiView,
     CommentReplyApiView,
     CommentReplyDetailApiView,
@@ -33,6 +34,8 @@ urlpatterns = [
     path('comments/<int:pk>',
          CommentDetailApiView.as_view(), name='comment-details'),
     path('<str:slug>/comments', CommentApiView.as_view(), name='comments'),
+    path('<str:slug>/comments/thread', CommentThreadApiView.as_view(),
+         name='comment-thread'),
     path('comments/<int:pk>/like', LikeCommentApiView.as_view(),
          name='comment-likes'),
     path('comments/<int:pk>/dislike', DislikeCommentApiView.as_view(),
@@ -2,6 +2,8 @@ import timeago
 from django.utils import timezone
 from rest_framework import status
 
+from ...reactions.models import Reaction
+
 
 def get_single_comment_using_id(obj, id):
     """
@@ -62,7 +64,7 @@ def check_if_user_is_object_author(obj, user):
 class LikeDislikeObject():
     """
     This class has methods that handle liking, disliking,
-    un-liking, un-disliking of a comment
+    un-liking, un-disliking of a comment through the reactions service
     """
 
     def __init__(self, request, model,
@@ -72,6 +74,7 @@ class LikeDislikeObject():
         self.pk = pk
         self.object_type = object_type
         self.action = action
+        self.reaction = Reaction.named(action)
         self.obj = get_single_comment_using_id(
             self.model, self.pk
         )
@@ -81,44 +84,8 @@ class LikeDislikeObject():
             )
 
     def action_is_active(self):
-        if self.action == "like" and (
-                self.request.user in self.obj.liked_by.all()):
-            status = True
-        elif self.action == "dislike" and (
-                self.request.user in self.obj.disliked_by.all()):
-            status = True
-        else:
-            status = False
-        return status
-
-    def opposite_is_active(self):
-        if self.action == "like" and (
-                self.request.user in self.obj.disliked_by.all()):
-            opposite_status = True
-        elif self.action == "dislike" and (
-                self.request.user in self.obj.liked_by.all()):
-            opposite_status = True
-        else:
-            opposite_status = False
-        return opposite_status
-
-    def add_action(self):
-        if self.action == "like":
-            self.obj.liked_by.add(self.request.user)
-        elif self.action == "dislike":
-            self.obj.disliked_by.add(self.request.user)
-
-    def remove_action(self):
-        if self.action == "like":
-            self.obj.liked_by.remove(self.request.user)
-        elif self.action == "dislike":
-            self.obj.disliked_by.remove(self.request.user)
-
-    def remove_opposite_action(self):
-        if self.action == "like":
-            self.obj.disliked_by.remove(self.request.user)
-        elif self.action == "dislike":
-            self.obj.liked_by.remove(self.request.user)
+        return Reaction.objects.reaction_of(
+            self.request.user, self.obj) == self.reaction
 
     def get_status_of_action_for_obj(self):
         if self.obj:
@@ -148,15 +115,6 @@ with pk: {self.pk} does not exist!",
             }
             status_code = status.HTTP_404_NOT_FOUND
 
-        elif self.action_is_active() is True:
-            data = {
-                "id": self.pk,
-                "message": f"Failed! You already {self.action} \
-{self.object_type} with pk {self.pk}",
-                "status": 400
-            }
-            status_code = status.HTTP_400_BAD_REQUEST
-
         elif self.is_author is True:
             data = {
                 "message": f"Failed! You cannot {self.action} a \
@@ -165,26 +123,33 @@ with pk: {self.pk} does not exist!",
             }
             status_code = status.HTTP_400_BAD_REQUEST
 
-        elif self.opposite_is_active() is True:
-            self.remove_opposite_action()
-            self.add_action()
-            data = {
-                "id": self.pk,
-                "message": f"Success! You have changed your action \
+        else:
+            previous = Reaction.objects.react(
+                self.request.user, self.obj, self.reaction)
+            if previous == self.reaction:
+                data = {
+                    "id": self.pk,
+                    "message": f"Failed! You already {self.action} \
+{self.object_type} with pk {self.pk}",
+                    "status": 400
+                }
+                status_code = status.HTTP_400_BAD_REQUEST
+            elif previous is not None:
+                data = {
+                    "id": self.pk,
+                    "message": f"Success! You have changed your action \
 to {self.action} {self.object_type} with pk {self.pk}",
-                "status": 201
-            }
-            status_code = status.HTTP_201_CREATED
-
-        elif self.action_is_active() is False and self.is_author is False:
-            self.add_action()
-            data = {
-                "id": self.pk,
-                "message": f"Success! You have a added a \
+                    "status": 201
+                }
+                status_code = status.HTTP_201_CREATED
+            else:
+                data = {
+                    "id": self.pk,
+                    "message": f"Success! You have a added a \
 {self.action} to {self.object_type} with pk {self.pk}",
-                "status": 201
-            }
-            status_code = status.HTTP_201_CREATED
+                    "status": 201
+                }
+                status_code = status.HTTP_201_CREATED
         return data, status_code
 
     def undo_action_on_object(self):
@@ -196,15 +161,6 @@ with pk: {self.pk} does not exist!",
             }
             status_code = status.HTTP_404_NOT_FOUND
 
-        elif self.action_is_active() is False:
-            data = {
-                "id": self.pk,
-                "message": f" Failed! You do not {self.action} \
-{self.object_type} with pk {self.pk}",
-                "status": 400
-            }
-            status_code = status.HTTP_400_BAD_REQUEST
-
         elif self.is_author is True:
             data = {
                 "id": self.pk,
@@ -214,8 +170,8 @@ with pk: {self.pk} does not exist!",
             }
             status_code = status.HTTP_400_BAD_REQUEST
 
-        elif self.action_is_active() is True:
-            self.remove_action()
+        elif Reaction.objects.unreact(
+                self.request.user, self.obj, self.reaction):
             data = {
                 "id": self.pk,
                 "message": f"Success! You have reversed \
@@ -223,4 +179,13 @@ with pk: {self.pk} does not exist!",
                 "status": 200
             }
             status_code = status.HTTP_200_OK
+
+        else:
+            data = {
+                "id": self.pk,
+                "message": f" Failed! You do not {self.action} \
+{self.object_type} with pk {self.pk}",
+                "status": 400
+            }
+            status_code = status.HTTP_400_BAD_REQUEST
         return data, status_code
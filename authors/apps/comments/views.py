@@ -6,8 +6,10 @@ from rest_framework.response import Response
 from rest_framework import permissions
 from rest_framework.renderers import JSONRenderer
 
-from .serializers import CommentSerializer, CommentReplySerializer
+from .serializers import (CommentSerializer, CommentReplySerializer,
+                          CommentThreadSerializer)
 from .models import Comment, CommentReply
+from .paginators import CommentCursorPagination, CommentThreadPagination
 from ..profiles.models import Profile
 from ..articles.models import Article
 from ..articles.utils import model_helpers as article_helpers
@@ -23,6 +25,7 @@ class CommentApiView (GenericAPIView):
     permission_classes = (permissions.IsAuthenticatedOrReadOnly,)
     serializer_class = CommentSerializer
     renderer_classes = (JSONRenderer,)
+    pagination_class = CommentCursorPagination
 
     def get_required_objects(self, request, slug):
         self.article = get_object_or_404(Article, slug=slug)
@@ -35,19 +38,26 @@ class CommentApiView (GenericAPIView):
     def get(self, request, slug):
         """Retrieve all comments on an article"""
         self.get_required_objects(request, slug)
-        comments = Comment.objects.filter(article=self.article)
+        comments = Comment.objects.filter(
+            article=self.article).select_related('author')
+        page = self.paginate_queryset(comments)
         serialized_data = self.serializer_class(
-            comments,
+            comments if page is None else page,
             context={'request': request},
             many=True
         )
-        return Response({
+        data = {
             "comments": serialized_data.data,
-            "commentCount": comments.count(),
             "message": (
                 "Successfully returned comments on article: {}".format(slug)
             ),
-            'status': 200}, status=status.HTTP_200_OK)
+            'status': 200}
+        if page is None:
+            data["commentCount"] = comments.count()
+        else:
+            data.update(next=self.paginator.get_next_link(),
+                        previous=self.paginator.get_previous_link())
+        return Response(data, status=status.HTTP_200_OK)
 
     def post(self, request, slug):
         self.get_required_objects(request, slug)
@@ -70,6 +80,47 @@ class CommentApiView (GenericAPIView):
                          'status': 201}, status=status.HTTP_201_CREATED)
 
 
+class CommentThreadApiView(GenericAPIView):
+    """
+    The CommentThreadApiView returns a page of the comments on an article,
+    newest first, each with its reply count, its first replies and the
+    viewer's reaction to it. `?replies=` sets how many replies are included
+    per comment, up to `max_replies`; the rest are paged through the
+    comment's replies endpoint.
+    """
+    permission_classes = (permissions.AllowAny,)
+    serializer_class = CommentThreadSerializer
+    renderer_classes = (JSONRenderer,)
+    pagination_class = CommentThreadPagination
+    default_replies = 3
+    max_replies = 10
+
+    def get_reply_limit(self, request):
+        try:
+            limit = int(request.query_params.get('replies',
+                                                 self.default_replies))
+        except ValueError:
+            limit = self.default_replies
+        return max(0, min(limit, self.max_replies))
+
+    def get(self, request, slug):
+        """Retrieve a page of the comment thread of an article"""
+        article = get_object_or_404(Article.objects.only('pk'), slug=slug)
+        page = self.paginate_queryset(Comment.objects.thread(article))
+        serialized_data = self.serializer_class(
+            page, many=True,
+            context={'request': request,
+                     'reply_limit': self.get_reply_limit(request)})
+        return Response({
+            "comments": serialized_data.data,
+            "next": self.paginator.get_next_link(),
+            "previous": self.paginator.get_previous_link(),
+            "message": (
+                "Successfully returned comments on article: {}".format(slug)
+            ),
+            'status': 200}, status=status.HTTP_200_OK)
+
+
 class CommentDetailApiView (GenericAPIView):
     """
     The CommentDetailApiView handles the retreiving, modification and
@@ -157,6 +208,7 @@ class CommentReplyApiView(GenericAPIView):
     permission_classes = (permissions.IsAuthenticatedOrReadOnly,)
     serializer_class = CommentReplySerializer
     renderer_classes = (JSONRenderer,)
+    pagination_class = CommentCursorPagination
 
     def get_required_objects(self, request, comment_pk):
         self.comment = get_object_or_404(Comment, pk=comment_pk)
@@ -169,17 +221,24 @@ class CommentReplyApiView(GenericAPIView):
     def get(self, request, comment_pk):
         """Retrieve all replies on an comment"""
         self.get_required_objects(request, comment_pk)
-        replies = CommentReply.objects.filter(comment=self.comment)
-        serialized_data = self.serializer_class(replies, many=True,
-                                                context={
-                                                    'request': request})
-        return Response({
+        replies = CommentReply.objects.filter(
+            comment=self.comment).select_related('author')
+        page = self.paginate_queryset(replies)
+        serialized_data = self.serializer_class(
+            replies if page is None else page, many=True,
+            context={'request': request})
+        data = {
             "replies": serialized_data.data,
-            "repliesCount": replies.count(),
             "message": (
                 "Successfully returned replies to comment: {}".format(
                     comment_pk)),
-                'status': 200}, status=status.HTTP_200_OK)
+            'status': 200}
+        if page is None:
+            data["repliesCount"] = replies.count()
+        else:
+            data.update(next=self.paginator.get_next_link(),
+                        previous=self.paginator.get_previous_link())
+        return Response(data, status=status.HTTP_200_OK)
 
     def post(self, request, comment_pk):
         """Make a reply to a comment"""
@@ -0,0 +1,5 @@
+"""
+Endpoint benchmarks: seed a local database with a realistic dataset
+(seed_benchmark_data) and time every endpoint against it
+(run_benchmarks).
+"""
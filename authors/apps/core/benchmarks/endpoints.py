@@ -0,0 +1,146 @@
+from collections import namedtuple
+
+from django.urls import reverse
+
+# `path` and `data` are callables of the benchmark subjects (see
+# runner.BenchmarkSubjects); `as_user` names the subject the request is
+# authenticated as, None for an anonymous request. `budget` is the most SQL
+# statements the endpoint may run, whatever the size of the dataset.
+Endpoint = namedtuple('Endpoint', 'name method path as_user data budget')
+
+
+def endpoint(name, method, path, as_user=None, data=None, budget=None):
+    return Endpoint(name, method, path, as_user, data or (lambda s: None),
+                    budget)
+
+
+# Every endpoint of articles, comments, profiles, notifications and
+# authentication that can run offline. Writes run in a transaction that is
+# rolled back after each request. Left out: social logins (they call the
+# providers), registration, password reset, reporting, following and
+# commenting (they send email through Celery).
+ENDPOINTS = (
+    # articles
+    endpoint('articles.list', 'get',
+             lambda s: reverse('articles:articles'), budget=5),
+    endpoint('articles.list.reader', 'get',
+             lambda s: reverse('articles:articles'), as_user='reader',
+             budget=8),
+    endpoint('articles.list.deep_offset', 'get',
+             lambda s: reverse('articles:articles') +
+             f'?limit=10&offset={max(s.article_count - 10, 0)}', budget=5),
+    endpoint('articles.list.cursor', 'get',
+             lambda s: reverse('articles:articles') + '?pagination=cursor',
+             budget=4),
+    endpoint('articles.list.summary', 'get',
+             lambda s: reverse('articles:articles') + '?summary=true',
+             budget=5),
+    endpoint('articles.search', 'get',
+             lambda s: reverse('articles:articles') + '?search=whale+ocean',
+             budget=5),
+    endpoint('articles.filter.tag', 'get',
+             lambda s: reverse('articles:articles') + '?tag=python', budget=5),
+    endpoint('articles.detail', 'get',
+             lambda s: reverse('articles:article-details',
+                               args=[s.article.slug]), budget=4),
+    endpoint('articles.detail.reader', 'get',
+             lambda s: reverse('articles:article-details',
+                               args=[s.article.slug]), as_user='reader',
+             budget=12),
+    endpoint('articles.update', 'patch',
+             lambda s: reverse('articles:article-details',
+                               args=[s.article.slug]), as_user='author',
+             data=lambda s: {'body': s.article.body + ' edited'}),
+    endpoint('articles.tags', 'get', lambda s: reverse('articles:tags'),
+             budget=1),
+    endpoint('articles.tag_cloud', 'get',
+             lambda s: reverse('articles:tag-cloud'), budget=1),
+    endpoint('articles.by_tag', 'get',
+             lambda s: reverse('articles:articles-by-tag',
+                               args=['python']), budget=6),
+    endpoint('articles.like', 'post',
+             lambda s: reverse('articles:like-article',
+                               args=[s.article.slug]), as_user='admin'),
+    endpoint('articles.is_liked', 'get',
+             lambda s: reverse('articles:is-liked', args=[s.article.slug]),
+             as_user='reader', budget=3),
+    endpoint('articles.favorite', 'post',
+             lambda s: reverse('articles:article-favorite',
+                               args=[s.article.slug]), as_user='reader'),
+    endpoint('articles.rate', 'post',
+             lambda s: reverse('articles:article-rates',
+                               args=[s.article.slug]), as_user='admin',
+             data=lambda s: {'rate_score': 4}),
+    endpoint('articles.bookmark', 'post',
+             lambda s: reverse('articles:article-bookmark',
+                               args=[s.article.slug]), as_user='admin'),
+    endpoint('articles.bookmarks', 'get', lambda s: reverse('bookmarks'),
+             as_user='reader'),
+    endpoint('articles.reports', 'get',
+             lambda s: reverse('articles:reports'), as_user='admin'),
+    # comments
+    endpoint('comments.list', 'get',
+             lambda s: reverse('comments:comments',
+                               args=[s.article.slug])),
+    endpoint('comments.thread', 'get',
+             lambda s: reverse('comments:comment-thread',
+                               args=[s.article.slug]), as_user='reader',
+             budget=7),
+    endpoint('comments.detail', 'get',
+             lambda s: reverse('comments:comment-details',
+                               args=[s.comment.pk])),
+    endpoint('comments.history', 'get',
+             lambda s: reverse('comments:comment-edit-history',
+                               args=[s.comment.article.slug, s.comment.pk]),
+             as_user='comment_author'),
+    endpoint('comments.like_status', 'get',
+             lambda s: reverse('comments:comment-likes',
+                               args=[s.comment.pk]), as_user='reader'),
+    endpoint('comments.replies', 'get',
+             lambda s: reverse('comments:comment-reply',
+                               args=[s.comment.pk])),
+    endpoint('comments.reply_detail', 'get',
+             lambda s: reverse('comments:comment-reply-details',
+                               args=[s.reply.pk])),
+    endpoint('comments.reply_history', 'get',
+             lambda s: reverse('comments:comment-reply-edit-history',
+                               args=[s.comment.pk, s.reply.pk]),
+             as_user='reply_author'),
+    # profiles
+    endpoint('profiles.list', 'get',
+             lambda s: reverse('profiles:profile-list'), as_user='reader'),
+    endpoint('profiles.detail', 'get',
+             lambda s: reverse('profiles:profile-detail-update',
+                               args=[s.author.username]),
+             as_user='reader'),
+    endpoint('profiles.followers', 'get',
+             lambda s: reverse('profiles:followers'), as_user='author'),
+    endpoint('profiles.following', 'get',
+             lambda s: reverse('profiles:following'), as_user='reader'),
+    endpoint('profiles.author_followers', 'get',
+             lambda s: reverse('profiles:profile-followers',
+                               args=[s.author.username]),
+             as_user='reader', budget=4),
+    endpoint('profiles.read_stats', 'get',
+             lambda s: reverse('profiles:read-stats'), as_user='author'),
+    # notifications
+    endpoint('notifications.list', 'get',
+             lambda s: reverse('notifications:notifications'),
+             as_user='reader', budget=3),
+    endpoint('notifications.unread_count', 'get',
+             lambda s: reverse('notifications:unread-count'),
+             as_user='reader', budget=2),
+    endpoint('notifications.mark_read', 'post',
+             lambda s: reverse('notifications:read'), as_user='reader'),
+    endpoint('notifications.settings', 'get',
+             lambda s: reverse('notifications:settings'),
+             as_user='reader', budget=6),
+    # authentication
+    endpoint('authentication.user', 'get',
+             lambda s: reverse('authentication:retrieve-update'),
+             as_user='reader', budget=1),
+    endpoint('authentication.login', 'post',
+             lambda s: reverse('authentication:login'),
+             data=lambda s: {'user': {'email': s.reader.email,
+                                      'password': s.password}}),
+)
@@ -0,0 +1,241 @@
+import json
+import math
+import time
+from contextlib import contextmanager
+
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import (setup_test_environment,
+                               teardown_test_environment)
+from django.utils import timezone
+
+from authors.apps.articles.models import Article, ReadStats
+from authors.apps.authentication.models import User
+from authors.apps.comments.models import Comment, CommentReply
+from authors.apps.profiles.models import Profile
+from .endpoints import ENDPOINTS
+from .seed import BENCHMARK_PASSWORD, benchmark_names
+
+PERCENTILES = (50, 90, 95, 99)
+# a p95 latency this much slower than the baseline counts as a regression
+DEFAULT_THRESHOLD = 0.2
+
+
+class BenchmarkSubjects:
+    """
+    BenchmarkSubjects looks up the users, article, comment and reply the
+    endpoints are exercised with in data laid down by seed_benchmark_data
+    """
+
+    def __init__(self, prefix):
+        names = benchmark_names(prefix)
+        self.author = User.objects.get(username=names['author'])
+        self.reader = User.objects.get(username=names['reader'])
+        self.admin = User.objects.get(username=names['admin'])
+        self.article = Article.objects.get(slug=names['article'])
+        self.article_count = Article.objects.count()
+        self.comment = Comment.objects.filter(
+            article__slug__startswith=f'{prefix}-article-',
+            commentreply__isnull=False).order_by('pk').first()
+        self.reply = CommentReply.objects.filter(
+            comment=self.comment).order_by('pk').first()
+        # only authors may read the edit history of what they wrote
+        self.comment_author = self.comment.author.user \
+            if self.comment else None
+        self.reply_author = self.reply.author.user if self.reply else None
+        self.password = BENCHMARK_PASSWORD
+
+
+class QueryRecorder:
+    """
+    QueryRecorder is a database execute wrapper counting the statements a
+    request runs and the rows its SELECTs return. Rows read through a
+    server-side cursor (streamed responses) are not known up front and so
+    are not counted.
+    """
+
+    def __init__(self):
+        self.queries = 0
+        self.rows = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        result = execute(sql, params, many, context)
+        self.queries += 1
+        rowcount = context['cursor'].rowcount
+        if sql.lstrip()[:6].upper() == 'SELECT' and rowcount > 0:
+            self.rows += rowcount
+        return result
+
+
+@contextmanager
+def benchmark_environment():
+    """
+    Routes email to memory and lets the test client's host through, as the
+    test runner does, unless the test runner already has
+    """
+    try:
+        setup_test_environment()
+    except RuntimeError:
+        yield
+    else:
+        try:
+            yield
+        finally:
+            teardown_test_environment()
+
+
+def percentile(sorted_values, rank):
+    """nearest-rank percentile of an ascending list"""
+    index = max(math.ceil(rank / 100 * len(sorted_values)) - 1, 0)
+    return sorted_values[index]
+
+
+class BenchmarkRunner:
+    """
+    BenchmarkRunner requests every endpoint `iterations` times (after
+    `warmup` untimed rounds) through Django's test client, each request in
+    a transaction that is rolled back so writes leave no trace. The cache is
+    cleared before every request unless `warm_cache` is set. It reports the
+    latency percentiles, SQL statements and rows fetched per endpoint.
+    """
+
+    def __init__(self, prefix='bench', iterations=20, warmup=2,
+                 warm_cache=False, only=None, log=print):
+        self.subjects = BenchmarkSubjects(prefix)
+        self.iterations = iterations
+        self.warmup = warmup
+        self.warm_cache = warm_cache
+        self.endpoints = [e for e in ENDPOINTS
+                          if not only or any(o in e.name for o in only)]
+        self.log = log
+        self.clients = {}
+
+    def client_for(self, name):
+        if name not in self.clients:
+            user = getattr(self.subjects, name) if name else None
+            headers = {'HTTP_AUTHORIZATION': f'Bearer {user.token}'} \
+                if user else {}
+            self.clients[name] = Client(**headers)
+        return self.clients[name]
+
+    def request(self, endpoint, path, data):
+        """times one request and returns (status, seconds, recorder)"""
+        client = self.client_for(endpoint.as_user)
+        kwargs = {} if endpoint.method == 'get' else {
+            'data': json.dumps(data or {}),
+            'content_type': 'application/json'}
+        recorder = QueryRecorder()
+        if not self.warm_cache:
+            cache.clear()
+        with transaction.atomic():
+            with connection.execute_wrapper(recorder):
+                started = time.perf_counter()
+                response = getattr(client, endpoint.method)(path, **kwargs)
+                if response.streaming:
+                    b''.join(response.streaming_content)
+                elapsed = time.perf_counter() - started
+            transaction.set_rollback(True)
+        return response.status_code, elapsed, recorder
+
+    def measure(self, endpoint):
+        try:
+            path = endpoint.path(self.subjects)
+            data = endpoint.data(self.subjects)
+        except AttributeError:
+            return {'skipped': 'nothing to request in the seeded data'}
+        if endpoint.as_user and getattr(self.subjects, endpoint.as_user) \
+                is None:
+            return {'skipped': f'no {endpoint.as_user} in the seeded data'}
+        for _ in range(self.warmup):
+            self.request(endpoint, path, data)
+        samples = [self.request(endpoint, path, data)
+                   for _ in range(self.iterations)]
+        latencies = sorted(seconds * 1000 for _, seconds, _ in samples)
+        queries = sorted(recorder.queries for _, _, recorder in samples)
+        rows = sorted(recorder.rows for _, _, recorder in samples)
+        result = {
+            'method': endpoint.method.upper(),
+            'path': path,
+            'status': sorted({status for status, _, _ in samples}),
+            'latency_ms': dict(
+                {f'p{rank}': round(percentile(latencies, rank), 3)
+                 for rank in PERCENTILES},
+                mean=round(sum(latencies) / len(latencies), 3),
+                max=round(latencies[-1], 3)),
+            'queries': percentile(queries, 50),
+            'max_queries': queries[-1],
+            'rows_fetched': percentile(rows, 50),
+        }
+        if endpoint.budget is not None:
+            result['query_budget'] = endpoint.budget
+        return result
+
+    def run(self):
+        report = {
+            'generated_at': timezone.now().isoformat(),
+            'iterations': self.iterations,
+            'warm_cache': self.warm_cache,
+            'dataset': {
+                'users': User.objects.count(),
+                'profiles': Profile.objects.count(),
+                'articles': self.subjects.article_count,
+                'reads': ReadStats.objects.count(),
+                'comments': Comment.objects.count(),
+                'followers_of_author':
+                    self.subjects.author.profile.followed_by.count(),
+            },
+            'endpoints': {},
+        }
+        with benchmark_environment():
+            for endpoint in self.endpoints:
+                result = self.measure(endpoint)
+                report['endpoints'][endpoint.name] = result
+                self.log(format_result(endpoint.name, result))
+        return report
+
+
+def format_result(name, result):
+    if 'skipped' in result:
+        return f'{name:32} skipped: {result["skipped"]}'
+    latency = result['latency_ms']
+    return (f'{name:32} p50 {latency["p50"]:9.2f}ms  '
+            f'p95 {latency["p95"]:9.2f}ms  '
+            f'{result["queries"]:4} queries  '
+            f'{result["rows_fetched"]:7} rows  {result["status"]}')
+
+
+def over_budget(report):
+    """
+    over_budget lists the endpoints that ran more SQL statements than their
+    query budget allows
+    """
+    return [
+        f'{name}: {result["max_queries"]} queries, budget '
+        f'{result["query_budget"]}'
+        for name, result in report['endpoints'].items()
+        if result.get('query_budget') is not None
+        and result['max_queries'] > result['query_budget']]
+
+
+def compare_reports(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """
+    compare_reports lists the endpoints of `current` that regressed against
+    `baseline`: p95 latency up by more than `threshold` (a fraction), more
+    SQL statements or more rows fetched
+    """
+    regressions = []
+    for name, result in current['endpoints'].items():
+        before = baseline['endpoints'].get(name)
+        if not before or 'skipped' in result or 'skipped' in before:
+            continue
+        old_p95 = before['latency_ms']['p95']
+        new_p95 = result['latency_ms']['p95']
+        if old_p95 and (new_p95 - old_p95) / old_p95 > threshold:
+            regressions.append(
+                f'{name}: p95 {old_p95:.2f}ms -> {new_p95:.2f}ms')
+        for metric in ('queries', 'rows_fetched'):
+            if result[metric] > before[metric]:
+                regressions.append(
+                    f'{name}: {metric} {before[metric]} -> {result[metric]}')
+    return regressions
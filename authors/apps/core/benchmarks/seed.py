@@ -0,0 +1,233 @@
+import random
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db import transaction
+
+from authors.apps.articles.models import Article, Bookmark, ReadStats
+from authors.apps.articles.utils import utils
+from authors.apps.authentication.models import User
+from authors.apps.comments.models import Comment, CommentReply
+from authors.apps.notifications.models import Notification, \
+    NotificationStatus
+from authors.apps.profiles.models import Profile, ProfileStats
+from authors.apps.reactions.models import Reaction
+
+# rows per INSERT
+BATCH_SIZE = 5000
+BENCHMARK_PASSWORD = 'benchmark-pass-1'
+
+# row counts at scale 1; --scale 100 gives 100k articles, 1M reads, 500k
+# comments and an author with 50k followers
+DEFAULT_COUNTS = {
+    'users': 1000,
+    'articles': 1000,
+    'reads': 10000,
+    'comments': 5000,
+    'replies': 1000,
+    'likes': 5000,
+    'followers': 500,
+    'bookmarks': 100,
+    'notifications': 1000,
+}
+
+WORDS = (
+    'the of and to in is that for it as with was on be by this are from at '
+    'or an have not they which you one had but all their there were can '
+    'data system model query index cache server request response latency '
+    'article author reader story writing code design python django review '
+    'ocean whale forest river mountain city night morning coffee music'
+).split()
+TAGS = ('python', 'django', 'postgres', 'design', 'travel', 'food',
+        'music', 'science', 'health', 'history', 'sports', 'business')
+
+
+def benchmark_names(prefix):
+    """
+    benchmark_names returns the usernames and slug the benchmark runner
+    uses to find its subjects in the seeded data
+    """
+    return {
+        'author': f'{prefix}_user_0',
+        'reader': f'{prefix}_user_1',
+        'admin': f'{prefix}_admin',
+        'article': f'{prefix}-article-0',
+    }
+
+
+class BenchmarkSeeder:
+    """
+    BenchmarkSeeder bulk inserts users, articles, reads, comments, follows
+    and notifications, BATCH_SIZE rows at a time and without going through
+    model signals, so large datasets load in minutes. The data is skewed the
+    way real traffic is: user 0 writes the most read article and is followed
+    by `followers` users, and user 1 has bookmarks and notifications.
+    Counters are rebuilt from the inserted rows at the end.
+    """
+
+    def __init__(self, prefix='bench', scale=1, seed=0, log=print, **counts):
+        self.prefix = prefix
+        self.counts = {name: int(default * scale)
+                       for name, default in DEFAULT_COUNTS.items()}
+        self.counts.update(
+            {name: count for name, count in counts.items()
+             if count is not None})
+        # there is always an author and a reader to benchmark as
+        self.counts['users'] = max(self.counts['users'], 2)
+        self.counts['articles'] = max(self.counts['articles'], 1)
+        self.random = random.Random(seed)
+        self.log = log
+
+    def run(self):
+        with transaction.atomic():
+            users, profiles = self.seed_users()
+            articles = self.seed_articles(profiles)
+            self.seed_follows(profiles)
+            self.seed_reads(users, articles)
+            self.seed_likes(users, articles)
+            self.seed_bookmarks(users[1], articles)
+            comments = self.seed_comments(profiles, articles)
+            self.seed_replies(profiles, comments)
+            self.seed_notifications(profiles)
+            Article.objects.rebuild_counters()
+            ProfileStats.objects.reconcile()
+        cache.clear()
+        return self.counts
+
+    def text(self, words):
+        return ' '.join(self.random.choice(WORDS) for _ in range(words))
+
+    def bulk_create(self, model, rows, total):
+        """inserts the generated rows in batches and returns their pks"""
+        pks, batch = [], []
+        for row in rows:
+            batch.append(row)
+            if len(batch) == BATCH_SIZE:
+                pks += [obj.pk for obj in model.objects.bulk_create(batch)]
+                batch = []
+        if batch:
+            pks += [obj.pk for obj in model.objects.bulk_create(batch)]
+        self.log(f'{model._meta.label}: {total} row(s)')
+        return pks
+
+    def seed_users(self):
+        password = make_password(BENCHMARK_PASSWORD)
+        total = self.counts['users']
+        names = [f'{self.prefix}_user_{i}' for i in range(total)]
+        users = self.bulk_create(User, (
+            User(username=name, email=f'{name}@example.com',
+                 password=password) for name in names), total)
+        profiles = self.bulk_create(Profile, (
+            Profile(user_id=user, username=name, bio=self.text(12))
+            for user, name in zip(users, names)), total)
+        admin = benchmark_names(self.prefix)['admin']
+        User.objects.create_superuser(
+            username=admin, email=f'{admin}@example.com',
+            password=BENCHMARK_PASSWORD)
+        return users, profiles
+
+    def seed_articles(self, profiles):
+        total = self.counts['articles']
+
+        def articles():
+            for i in range(total):
+                body = self.text(self.random.randint(150, 1500))
+                yield Article(
+                    title=self.text(6)[:100], description=self.text(12)[:100],
+                    body=body, slug=f'{self.prefix}-article-{i}',
+                    # the first article and every tenth belong to user 0
+                    author_id=profiles[0] if i % 10 == 0
+                    else self.random.choice(profiles),
+                    tag_list=self.random.sample(TAGS, 3),
+                    read_time=utils.get_article_read_time(body),
+                    word_count=utils.get_article_word_count(body),
+                    excerpt=utils.get_article_excerpt(body))
+        return self.bulk_create(Article, articles(), total)
+
+    def seed_follows(self, profiles):
+        through = Profile.follows.through
+        followers = profiles[1:self.counts['followers'] + 1]
+        self.bulk_create(through, (
+            through(from_profile_id=follower, to_profile_id=profiles[0])
+            for follower in followers), len(followers))
+
+    def seed_reads(self, users, articles):
+        total = min(self.counts['reads'], len(users) * len(articles))
+        pairs = set()
+        # a user reads an article once, so redraw repeated pairs
+        while len(pairs) < total:
+            pairs.add((self.random.choice(users), self.skewed(articles)))
+        self.bulk_create(ReadStats, (
+            ReadStats(user_id=user, article_id=article)
+            for user, article in pairs), total)
+
+    def seed_likes(self, users, articles):
+        content_type = ContentType.objects.get_for_model(Article)
+        total = min(self.counts['likes'], len(users) * len(articles))
+
+        def likes():
+            # walks (article, user) pairs without repeating one
+            for i in range(total):
+                article = i % len(articles)
+                user = (article + i // len(articles)) % len(users)
+                yield Reaction(content_type=content_type,
+                               object_id=articles[article],
+                               user_id=users[user], reaction=Reaction.LIKE)
+        self.bulk_create(Reaction, likes(), total)
+
+    def seed_bookmarks(self, user, articles):
+        chosen = articles[:self.counts['bookmarks']]
+        self.bulk_create(Bookmark, (
+            Bookmark(user_id=user, article_id=article)
+            for article in chosen), len(chosen))
+
+    def seed_comments(self, profiles, articles):
+        total = self.counts['comments']
+        return self.bulk_create(Comment, (
+            Comment(body=self.text(self.random.randint(5, 60)),
+                    author_id=self.random.choice(profiles),
+                    article_id=self.skewed(articles))
+            for _ in range(total)), total)
+
+    def seed_replies(self, profiles, comments):
+        total = self.counts['replies'] if comments else 0
+        # replies pile up on the first few comments, like real threads
+        threads = comments[:10]
+        replies = self.bulk_create(CommentReply, (
+            CommentReply(body=self.text(self.random.randint(5, 30)),
+                         author_id=self.random.choice(profiles),
+                         comment_id=self.random.choice(threads))
+            for _ in range(total)), total)
+        # bulk inserts skip the edit history the threads' history
+        # endpoints read
+        Comment.edit_history.bulk_history_create(
+            Comment.objects.filter(pk__in=threads))
+        CommentReply.edit_history.bulk_history_create(
+            CommentReply.objects.filter(comment__in=threads))
+        return replies
+
+    def seed_notifications(self, profiles):
+        total = self.counts['notifications']
+        notifications = self.bulk_create(Notification, (
+            Notification(title=self.text(5), body=self.text(20))
+            for _ in range(total)), total)
+        through = Notification.recipients.through
+        # every other notification goes to the reader, user 1
+        pairs = [(profiles[1] if i % 2 else self.random.choice(profiles),
+                  notification)
+                 for i, notification in enumerate(notifications)]
+        self.bulk_create(through, (
+            through(notification_id=notification, profile_id=profile)
+            for profile, notification in pairs), total)
+        for start in range(0, len(pairs), BATCH_SIZE):
+            NotificationStatus.objects.fan_out(pairs[start:start + BATCH_SIZE])
+
+    def skewed(self, pks):
+        """
+        skewed picks a pk with a long tail: the first article gets a tenth
+        of the traffic, the rest is spread evenly
+        """
+        if self.random.random() < 0.1:
+            return pks[0]
+        return self.random.choice(pks)
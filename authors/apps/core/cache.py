@@ -0,0 +1,46 @@
+import hashlib
+
+from django.core.cache import cache
+
+
+def get_generation(namespace):
+    """
+    Returns the current generation of a cache namespace. Keys built with
+    make_key embed it, so bumping the generation retires every entry in the
+    namespace at once without having to know what was stored.
+    """
+    return cache.get_or_set(f'{namespace}:generation', 1, None)
+
+
+def get_generations(namespaces):
+    """
+    Returns the current generations of several cache namespaces in one
+    round trip, starting a generation only for those the cache lacks
+    """
+    keys = {f'{namespace}:generation': namespace for namespace in namespaces}
+    found = cache.get_many(list(keys))
+    return {
+        namespace: found[key] if key in found else get_generation(namespace)
+        for key, namespace in keys.items()}
+
+
+def bump_generation(namespace):
+    """
+    Invalidates every entry of a cache namespace
+    """
+    key = f'{namespace}:generation'
+    try:
+        cache.incr(key)
+    except ValueError:
+        # the generation expired or was evicted, start a fresh one
+        cache.set(key, 2, None)
+
+
+def make_key(namespace, *parts):
+    """
+    Builds a key for the current generation of a namespace. The parts are
+    hashed so that arbitrary user input stays within backend key limits.
+    """
+    digest = hashlib.md5(
+        ':'.join(str(part) for part in parts).encode('utf-8')).hexdigest()
+    return f'{namespace}:{get_generation(namespace)}:{digest}'
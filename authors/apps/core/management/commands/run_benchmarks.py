@@ -0,0 +1,60 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from authors.apps.core.benchmarks.runner import (DEFAULT_THRESHOLD,
+                                                 BenchmarkRunner,
+                                                 compare_reports,
+                                                 over_budget)
+
+
+class Command(BaseCommand):
+    """
+    Times every endpoint against data from seed_benchmark_data and writes a
+    JSON report. Given an earlier report it lists the regressions.
+    """
+    help = "Benchmark the API endpoints against seeded data"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--prefix', default='bench',
+                            help="prefix the data was seeded with")
+        parser.add_argument('--iterations', type=int, default=20)
+        parser.add_argument('--warmup', type=int, default=2)
+        parser.add_argument(
+            '--warm-cache', action='store_true',
+            help="keep the cache between requests instead of clearing it")
+        parser.add_argument(
+            '--only', action='append',
+            help="benchmark the endpoints whose name contains this")
+        parser.add_argument('--output', default='benchmark-report.json',
+                            help="where to write the JSON report")
+        parser.add_argument('--compare',
+                            help="an earlier report to compare against")
+        parser.add_argument(
+            '--threshold', type=float, default=DEFAULT_THRESHOLD,
+            help="p95 slowdown, as a fraction, counted as a regression")
+        parser.add_argument(
+            '--fail-on-regression', action='store_true',
+            help="exit with an error on regressions or blown budgets")
+
+    def handle(self, *args, **options):
+        runner = BenchmarkRunner(
+            prefix=options['prefix'], iterations=options['iterations'],
+            warmup=options['warmup'], warm_cache=options['warm_cache'],
+            only=options['only'], log=self.stdout.write)
+        report = runner.run()
+        with open(options['output'], 'w') as output:
+            json.dump(report, output, indent=2)
+        self.stdout.write(f"Report written to {options['output']}")
+
+        problems = over_budget(report)
+        if options['compare']:
+            with open(options['compare']) as baseline:
+                problems += compare_reports(
+                    json.load(baseline), report, options['threshold'])
+        for problem in problems:
+            self.stdout.write(self.style.WARNING(problem))
+        if problems and options['fail_on_regression']:
+            raise CommandError(f"{len(problems)} regression(s)")
+        if not problems:
+            self.stdout.write(self.style.SUCCESS("No regressions"))
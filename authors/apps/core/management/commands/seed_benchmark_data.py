@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from authors.apps.authentication.models import User
+from authors.apps.core.benchmarks.seed import (DEFAULT_COUNTS,
+                                               BenchmarkSeeder,
+                                               benchmark_names)
+
+
+class Command(BaseCommand):
+    """
+    Fills the database with a dataset for run_benchmarks to measure
+    against. Meant for a local, throwaway database.
+    """
+    help = "Seed a large, realistic dataset for endpoint benchmarks"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--prefix', default='bench',
+            help="prefix of the seeded usernames and slugs")
+        parser.add_argument(
+            '--scale', type=float, default=1,
+            help="multiplies every default row count; 100 seeds 100k "
+                 "articles, 1M reads, 500k comments and 50k followers")
+        parser.add_argument('--seed', type=int, default=0,
+                            help="random seed, for repeatable datasets")
+        for name, default in DEFAULT_COUNTS.items():
+            parser.add_argument(
+                f'--{name}', type=int,
+                help=f"number of {name} (default {default} x scale)")
+
+    def handle(self, *args, **options):
+        prefix = options['prefix']
+        if User.objects.filter(
+                username=benchmark_names(prefix)['author']).exists():
+            raise CommandError(
+                f"Benchmark data prefixed '{prefix}' already exists")
+        seeder = BenchmarkSeeder(
+            prefix=prefix, scale=options['scale'], seed=options['seed'],
+            log=self.stdout.write,
+            **{name: options[name] for name in DEFAULT_COUNTS})
+        seeder.run()
+        self.stdout.write(self.style.SUCCESS(
+            f"Seeded benchmark data prefixed '{prefix}'"))
@@ -5,7 +5,8 @@ import os
 import datetime
 from django.conf import settings
 from django.template.loader import render_to_string
-from django.core.mail import send_mail
+from ..notifications.tasks import send_emails
+from ..notifications.utils.mailer import email_message
 
 
 class PasswordResetManager:
@@ -59,13 +60,12 @@ class PasswordResetManager:
 
     def send_password_reset_email(self, email):
         self.prepare_password_reset_email(email)
-        send_mail(
+        send_emails.delay([email_message(
             self.subject,
             self.email_body,
-            self.sender_email,
             [self.requester_email],
-            fail_silently=False
-        )
+            self.sender_email
+        )])
         return self.encoded_token.decode('utf-8')
 
     def update_password(self, email, new_password):
@@ -0,0 +1,79 @@
+import logging
+
+from django.db.models import prefetch_related_objects
+from django.http import StreamingHttpResponse
+from rest_framework.utils.encoders import JSONEncoder
+
+logger = logging.getLogger(__name__)
+
+# rows fetched, prefetched for and serialized together
+STREAM_BATCH_SIZE = 200
+
+
+def iterate_in_batches(queryset, batch_size=None):
+    """
+    Yields the rows of a queryset as lists of `batch_size` instances,
+    reading them from a server-side cursor rather than loading them all.
+    QuerySet.iterator() skips prefetch_related, so the queryset's prefetches
+    are applied to each batch instead.
+    """
+    batch_size = batch_size or STREAM_BATCH_SIZE
+    lookups = queryset._prefetch_related_lookups
+    rows = queryset.iterator(chunk_size=batch_size)
+    while True:
+        batch = [row for _, row in zip(range(batch_size), rows)]
+        if not batch:
+            return
+        prefetch_related_objects(batch, *lookups)
+        yield batch
+
+
+class StreamingJSONListResponse(StreamingHttpResponse):
+    """
+    StreamingJSONListResponse renders `{"<key>": [...], **extra}` for a
+    queryset one batch of rows at a time, so the whole list is never held in
+    memory and the first bytes leave before the last rows are read. Each
+    batch goes through `serializer_class(batch, many=True)`, so list
+    serializers that resolve state per page still work.
+
+    The first batch is read and serialized before the response is made, so
+    a failing query or serializer still comes back as an ordinary DRF
+    error. Once the 200 is on its way it cannot be taken back: a later batch
+    that fails is logged and cuts the stream short, leaving the client with
+    JSON that does not parse.
+    """
+
+    def __init__(self, queryset, serializer_class, key, context=None,
+                 extra=None, batch_size=None, **kwargs):
+        kwargs.setdefault('content_type', 'application/json')
+        context = context or {}
+        batches = iterate_in_batches(queryset, batch_size)
+        first = self.render_batch(next(batches, []), serializer_class,
+                                  context)
+        super().__init__(
+            self.stream_items(first, batches, serializer_class, key,
+                              context, extra or {}),
+            **kwargs)
+
+    @staticmethod
+    def render_batch(batch, serializer_class, context):
+        encode = JSONEncoder().encode
+        items = serializer_class(batch, many=True, context=context).data
+        return ', '.join(encode(item) for item in items)
+
+    @classmethod
+    def stream_items(cls, first, batches, serializer_class, key, context,
+                     extra):
+        encode = JSONEncoder().encode
+        yield '{%s: [%s' % (encode(key), first)
+        try:
+            for batch in batches:
+                yield ', ' + cls.render_batch(batch, serializer_class,
+                                              context)
+        except Exception:
+            logger.exception('Streaming the %s list failed', key)
+            return
+        yield ']'
+        for name, value in extra.items():
+            yield ', %s: %s' % (encode(name), encode(value))
+        yield '}'
@@ -0,0 +1,64 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from authors.apps.articles.models import Article
+from authors.apps.core.benchmarks.endpoints import ENDPOINTS
+from authors.apps.core.benchmarks.runner import compare_reports, over_budget
+
+
+class TestBenchmarks(TestCase):
+    """
+    Runs the benchmark suite end to end on a tiny seeded dataset
+    """
+
+    def setUp(self):
+        call_command('seed_benchmark_data', scale=0.01, stdout=StringIO())
+        handle, self.report_path = tempfile.mkstemp(suffix='.json')
+        os.close(handle)
+        self.addCleanup(os.remove, self.report_path)
+
+    def run_benchmarks(self, **options):
+        out = StringIO()
+        call_command('run_benchmarks', iterations=1, warmup=0,
+                     output=self.report_path, stdout=out, **options)
+        with open(self.report_path) as report:
+            return json.load(report), out.getvalue()
+
+    def test_seeding_builds_a_consistent_dataset(self):
+        article = Article.objects.get(slug='bench-article-0')
+        self.assertEqual(article.author.followed_by.count(), 5)
+        self.assertGreater(article.read_count, 0)
+        self.assertGreater(article.word_count, 0)
+
+    def test_every_endpoint_is_measured_without_errors(self):
+        report, _ = self.run_benchmarks()
+        self.assertEqual(set(report['endpoints']),
+                         {endpoint.name for endpoint in ENDPOINTS})
+        for name, result in report['endpoints'].items():
+            self.assertNotIn('skipped', result, name)
+            self.assertTrue(all(status < 500 for status in result['status']),
+                            name)
+            self.assertGreater(result['queries'], 0, name)
+        self.assertEqual(over_budget(report), [])
+
+    def test_writes_are_rolled_back(self):
+        self.run_benchmarks(only=['articles.like'])
+        self.assertEqual(
+            Article.objects.get(slug='bench-article-0').reactions.filter(
+                user__username='bench_admin').count(), 0)
+
+    def test_comparison_flags_slower_and_chattier_endpoints(self):
+        baseline, _ = self.run_benchmarks(only=['articles.detail'])
+        current = json.loads(json.dumps(baseline))
+        detail = current['endpoints']['articles.detail']
+        detail['latency_ms']['p95'] = baseline['endpoints'][
+            'articles.detail']['latency_ms']['p95'] * 2 + 1
+        detail['queries'] += 1
+        regressions = compare_reports(baseline, current)
+        self.assertEqual(len(regressions), 2)
+        self.assertEqual(compare_reports(baseline, baseline), [])
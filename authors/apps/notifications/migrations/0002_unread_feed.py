@@ -0,0 +1,43 @@
+# Generated by Django 2.1.5 on 2026-10-18 14:50
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+# gives every recipient the status reading their notifications used to
+# create on the fly, then counts each profile's unread notifications
+FILL_STATUSES_SQL = """
+INSERT INTO notifications_notificationstatus
+    (recipient_id, notification_id, was_read_in_app, email_was_sent)
+SELECT recipient.profile_id, recipient.notification_id, false, false
+FROM notifications_notification_recipients recipient
+ORDER BY recipient.notification_id
+ON CONFLICT (recipient_id, notification_id) DO NOTHING;
+
+INSERT INTO notifications_notificationcounter (profile_id, unread)
+SELECT recipient_id, count(*) FROM notifications_notificationstatus
+WHERE NOT was_read_in_app
+GROUP BY recipient_id;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0004_profile_stats'),
+        ('notifications', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationCounter',
+            fields=[
+                ('profile', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='notification_counter', serialize=False, to='profiles.Profile')),
+                ('unread', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='notificationstatus',
+            index=models.Index(fields=['recipient', 'was_read_in_app', '-notification'], name='notificatio_recipie_efd6a2_idx'),
+        ),
+        migrations.RunSQL(FILL_STATUSES_SQL, migrations.RunSQL.noop),
+    ]
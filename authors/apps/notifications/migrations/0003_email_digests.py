@@ -0,0 +1,31 @@
+# Generated by Django 2.1.5 on 2026-10-18 15:40
+
+from django.db import migrations, models
+
+# statuses were never recorded as emailed before, so that switching to a
+# digest does not email a user their whole history, everything there is
+# now counts as emailed
+BACKFILL_EMAILED_SQL = """
+UPDATE notifications_notificationstatus SET email_was_sent = true
+WHERE NOT email_was_sent;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0002_unread_feed'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notificationsettings',
+            name='email_delivery',
+            field=models.CharField(choices=[('immediate', 'immediate'), ('hourly', 'hourly'), ('daily', 'daily')], default='immediate', max_length=10),
+        ),
+        migrations.AddIndex(
+            model_name='notificationsettings',
+            index=models.Index(fields=['email_delivery', 'profile'], name='notificatio_email_d_1020cb_idx'),
+        ),
+        migrations.RunSQL(BACKFILL_EMAILED_SQL, migrations.RunSQL.noop),
+    ]
@@ -1,6 +1,5 @@
-from django.db import models
-
-from django.db.models import CASCADE, PROTECT
+from django.db import connections, models
+from django.db.models import CASCADE, PROTECT, Q
 
 from authors.apps.profiles.models import Profile
 
@@ -32,31 +31,217 @@ class Notification(models.Model):
     def get_unread_in_app_notifications(profile):
         """
         :param profile: user profile whose notifications we're interested in
-        :return: the user's unread in-app notifications
+        :return: the user's unread in-app notifications, newest first
         """
-        all_notifications = Notification.objects.filter(recipients=profile)
-        unread_notifications = []
-        for notification in all_notifications:
-            notification_status, _ = NotificationStatus.objects.get_or_create(
-                recipient=profile, notification=notification)
-            if not notification_status.was_read_in_app:
-                unread_notifications.append(notification)
-        return unread_notifications
+        return Notification.objects.filter(
+            notificationstatus__recipient=profile,
+            notificationstatus__was_read_in_app=False).order_by('-id')
 
     def __str__(self):
         return "Title: {}, To: {}".format(self.title, self.recipients.all())
 
     @staticmethod
-    def mark_all_unread_as_read(profile):
+    def mark_all_unread_as_read(profile, up_to=None):
         """
         mark all notifications as read in-app
         :param profile: the user whose notifications we shall be targeting
+        :param up_to: the newest notification the user has seen, if given
+        :return: how many notifications were marked
+        """
+        return NotificationStatus.objects.mark_all_as_read(profile,
+                                                           up_to=up_to)
+
+
+class NotificationStatusManager(models.Manager):
+    """
+    NotificationStatusManager keeps each recipient's statuses and their
+    unread counter in step
+    """
+    # creates the statuses of the given (recipient id, notification id)
+    # pairs that do not exist yet and counts the new ones as unread
+    fan_out_sql = """
+        WITH added AS (
+            INSERT INTO {table} (recipient_id, notification_id,
+                                 was_read_in_app, email_was_sent)
+            SELECT recipient_id, notification_id, false, false
+            FROM unnest(%s::integer[], %s::integer[])
+                AS pair (recipient_id, notification_id)
+            ON CONFLICT (recipient_id, notification_id) DO NOTHING
+            RETURNING recipient_id
+        )
+        INSERT INTO {counters} AS counter (profile_id, unread)
+        SELECT recipient_id, count(*) FROM added
+        GROUP BY recipient_id ORDER BY recipient_id
+        ON CONFLICT (profile_id) DO UPDATE
+            SET unread = counter.unread + EXCLUDED.unread
+    """
+
+    def fan_out(self, pairs):
+        """
+        fan_out gives each (recipient id, notification id) pair its unread
+        status, in a single statement
+        """
+        pairs = list(pairs)
+        if not pairs:
+            return
+        recipient_ids, notification_ids = zip(*pairs)
+        with connections[self.db].cursor() as cursor:
+            cursor.execute(self.fan_out_sql.format(
+                table=self.model._meta.db_table,
+                counters=NotificationCounter._meta.db_table),
+                [list(recipient_ids), list(notification_ids)])
+
+    def unread_feed(self, profile):
+        """
+        unread_feed returns the statuses of a profile's unread notifications
+        with the notifications joined in, newest first
+        """
+        return self.get_queryset().filter(
+            recipient=profile, was_read_in_app=False).select_related(
+                'notification').order_by('-notification_id')
+
+    def pending_emails(self, notification, recipient_ids=None):
+        """
+        pending_emails returns the statuses of the recipients of a
+        notification who have not been emailed it yet and want it emailed
+        right away, in recipient order. Those who turned emails off or get
+        digests are left out. Recipients without settings get the default,
+        which is to be emailed right away
+        :param recipient_ids: only consider these recipients
+        """
+        not_immediate = NotificationSettings.objects.filter(
+            Q(allow_email_notifications=False) |
+            ~Q(email_delivery=NotificationSettings.IMMEDIATE)).values(
+                'profile_id')
+        statuses = self.get_queryset().filter(
+            notification=notification, email_was_sent=False).exclude(
+                recipient_id__in=not_immediate)
+        if recipient_ids is not None:
+            statuses = statuses.filter(recipient_id__in=recipient_ids)
+        return statuses.order_by('recipient_id')
+
+    # the newest `limit` unsent notifications of each recipient, with how
+    # many they have unsent in all
+    pending_digests_sql = """
+        SELECT pending.recipient_id, pending.notification_id,
+               notification.title, notification.body, pending.total
+        FROM (
+            SELECT recipient_id, notification_id,
+                   row_number() OVER recipient_newest AS position,
+                   count(*) OVER (PARTITION BY recipient_id) AS total
+            FROM {table}
+            WHERE recipient_id = ANY(%s::integer[]) AND NOT email_was_sent
+            WINDOW recipient_newest AS (PARTITION BY recipient_id
+                                        ORDER BY notification_id DESC)
+        ) pending
+        JOIN {notifications} notification
+            ON notification.id = pending.notification_id
+        WHERE pending.position <= %s
+        ORDER BY pending.recipient_id, pending.notification_id DESC
+    """
+
+    def pending_digests(self, recipient_ids, limit):
+        """
+        pending_digests returns the newest `limit` notifications each of the
+        given recipients has not been emailed yet, as (recipient id,
+        notification id, title, body, how many are unsent in all), each
+        recipient's newest first
+        """
+        with connections[self.db].cursor() as cursor:
+            cursor.execute(self.pending_digests_sql.format(
+                table=self.model._meta.db_table,
+                notifications=Notification._meta.db_table),
+                [list(recipient_ids), limit])
+            return cursor.fetchall()
+
+    # records as emailed every unsent notification of each recipient up to
+    # the newest one their digest listed
+    mark_digests_sent_sql = """
+        UPDATE {table} status SET email_was_sent = true
+        FROM unnest(%s::integer[], %s::integer[])
+            AS digest (recipient_id, newest_id)
+        WHERE status.recipient_id = digest.recipient_id
+            AND status.notification_id <= digest.newest_id
+            AND NOT status.email_was_sent
+    """
+
+    def mark_digests_sent(self, newest_by_recipient):
+        """
+        mark_digests_sent records the digests sent to the recipients of
+        `newest_by_recipient`, the newest notification each digest listed,
+        in a single UPDATE
+        """
+        if not newest_by_recipient:
+            return 0
+        recipient_ids, newest_ids = zip(*newest_by_recipient.items())
+        with connections[self.db].cursor() as cursor:
+            cursor.execute(self.mark_digests_sent_sql.format(
+                table=self.model._meta.db_table),
+                [list(recipient_ids), list(newest_ids)])
+            return cursor.rowcount
+
+    def mark_emails_sent(self, notification, recipient_ids):
         """
-        for notification in Notification.get_unread_in_app_notifications(
-                profile):
-            notification_status = NotificationStatus.objects.get(
-                recipient=profile, notification=notification)
-            notification_status.set_in_app_notification_as_read()
+        mark_emails_sent records that a notification was emailed to the
+        given recipients, in a single UPDATE
+        """
+        return self.filter(notification=notification,
+                           recipient_id__in=recipient_ids).update(
+                               email_was_sent=True)
+
+    def discard_pending_emails(self, profile_id):
+        """
+        discard_pending_emails records every notification a profile was not
+        emailed yet as emailed, so that none of them ever is
+        """
+        return self.filter(recipient_id=profile_id,
+                           email_was_sent=False).update(email_was_sent=True)
+
+    # marks a profile's unread statuses read and takes as many off its unread
+    # counter as it marked, both in one statement
+    mark_as_read_sql = """
+        WITH marked AS (
+            UPDATE {table} SET was_read_in_app = true
+            WHERE recipient_id = %s AND NOT was_read_in_app {condition}
+            RETURNING 1
+        ), counted AS (
+            UPDATE {counters} SET unread = unread - (SELECT count(*)
+                                                     FROM marked)
+            WHERE profile_id = %s
+        )
+        SELECT count(*) FROM marked
+    """
+
+    def mark_as_read(self, profile, notification_ids=None, up_to=None):
+        """
+        mark_as_read marks a profile's unread notifications as read, in a
+        single statement
+        :param notification_ids: only mark these notifications
+        :param up_to: only mark notifications up to this id, so that those
+        that fanned out after the user last looked stay unread
+        :return: how many notifications were marked
+        """
+        condition, params = '', [profile.pk]
+        if notification_ids is not None:
+            condition += ' AND notification_id = ANY(%s::integer[])'
+            params.append(list(notification_ids))
+        if up_to is not None:
+            condition += ' AND notification_id <= %s'
+            params.append(up_to)
+        with connections[self.db].cursor() as cursor:
+            cursor.execute(self.mark_as_read_sql.format(
+                table=self.model._meta.db_table,
+                counters=NotificationCounter._meta.db_table,
+                condition=condition), params + [profile.pk])
+            marked, = cursor.fetchone()
+        return marked
+
+    def mark_all_as_read(self, profile, up_to=None):
+        """
+        mark_all_as_read marks every unread notification of a profile as
+        read, or every one up to the read watermark `up_to`
+        """
+        return self.mark_as_read(profile, up_to=up_to)
 
 
 class NotificationStatus(models.Model):
@@ -71,8 +256,13 @@ class NotificationStatus(models.Model):
     was_read_in_app = models.BooleanField(default=False)
     email_was_sent = models.BooleanField(default=False)
 
+    objects = NotificationStatusManager()
+
     class Meta:
         unique_together = ('recipient', 'notification')
+        # serves a profile's unread notifications newest first, page by page
+        indexes = [models.Index(
+            fields=['recipient', 'was_read_in_app', '-notification'])]
 
     def set_in_app_notification_as_read(self):
         self.was_read_in_app = True
@@ -85,12 +275,66 @@ class NotificationStatus(models.Model):
 
 class NotificationSettings(models.Model):
     """
-    The notification settings for a particular user
+    The notification settings for a particular user.
+    Emails are sent as notifications come in, or collected into one hourly
+    or daily digest
     """
+    IMMEDIATE = 'immediate'
+    HOURLY = 'hourly'
+    DAILY = 'daily'
+    EMAIL_DELIVERIES = (
+        (IMMEDIATE, 'immediate'),
+        (HOURLY, 'hourly'),
+        (DAILY, 'daily'),
+    )
+
     profile = models.OneToOneField(to=Profile, on_delete=CASCADE)
     allow_in_app_notifications = models.BooleanField(default=True)
     allow_email_notifications = models.BooleanField(default=True)
+    email_delivery = models.CharField(max_length=10, choices=EMAIL_DELIVERIES,
+                                      default=IMMEDIATE)
+
+    class Meta:
+        # finds the users due a digest, batch by batch
+        indexes = [models.Index(fields=['email_delivery', 'profile'])]
+
+    def save(self, *args, **kwargs):
+        """
+        a change to whether or how a user is emailed starts their emails
+        afresh: what was waiting under the old settings, e.g. everything that
+        came in while emails were off, is not emailed, so that the first
+        digest after the change does not reach months back
+        """
+        before = (True, self.IMMEDIATE)
+        if self.pk is not None:
+            before = NotificationSettings.objects.filter(
+                pk=self.pk).values_list('allow_email_notifications',
+                                        'email_delivery').first() or before
+        super().save(*args, **kwargs)
+        if before != (self.allow_email_notifications, self.email_delivery):
+            NotificationStatus.objects.discard_pending_emails(
+                self.profile_id)
 
     def toggle_email_notifications(self, status):
         self.allow_email_notifications = status
         self.save()
+
+
+class NotificationCounter(models.Model):
+    """
+    How many unread notifications a profile has, kept in step as
+    notifications fan out and are read so that the bell icon never counts
+    """
+    profile = models.OneToOneField(to=Profile, on_delete=CASCADE,
+                                   primary_key=True,
+                                   related_name='notification_counter')
+    unread = models.IntegerField(default=0)
+
+    @staticmethod
+    def unread_of(user):
+        """
+        :param user: the user whose unread notifications we're counting
+        :return: the number of unread notifications, 0 without a counter
+        """
+        return NotificationCounter.objects.filter(
+            profile__user=user).values_list('unread', flat=True).first() or 0
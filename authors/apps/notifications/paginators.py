@@ -0,0 +1,13 @@
+from ..core.pagination import OptInCursorPagination
+
+
+class NotificationCursorPagination(OptInCursorPagination):
+    """
+    The unread feed is always paged by cursor, newest notification first,
+    years of notifications are too many to be returned whole
+    """
+    page_size = 20
+    ordering = ('-notification_id',)
+
+    def wants_cursor(self, request):
+        return True
@@ -1,7 +1,8 @@
-from rest_framework.serializers import ModelSerializer
+from rest_framework.serializers import CharField, IntegerField, \
+    ListField, ModelSerializer, Serializer, ValidationError
 
 from authors.apps.notifications.models import NotificationSettings, \
-    Notification
+    Notification, NotificationStatus
 
 
 class NotificationSettingsSerializer(ModelSerializer):
@@ -10,6 +11,7 @@ class NotificationSettingsSerializer(ModelSerializer):
         fields = (
             'allow_in_app_notifications',
             'allow_email_notifications',
+            'email_delivery',
         )
 
 
@@ -21,3 +23,36 @@ class NotificationSerializer(ModelSerializer):
             'title',
             'body',
         )
+
+
+class UnreadNotificationSerializer(ModelSerializer):
+    """
+    An unread notification as the feed lists it, from its status row
+    """
+    pk = IntegerField(source='notification_id', read_only=True)
+    title = CharField(source='notification.title', read_only=True)
+    body = CharField(source='notification.body', read_only=True)
+
+    class Meta:
+        model = NotificationStatus
+        fields = (
+            'pk',
+            'title',
+            'body',
+        )
+
+
+class MarkAsReadSerializer(Serializer):
+    """
+    Validates which notifications to mark as read: the given ids, every one
+    up to a read watermark, or, when neither is given, all of them
+    """
+    notifications = ListField(child=IntegerField(min_value=1),
+                              max_length=1000, required=False)
+    up_to = IntegerField(min_value=1, required=False)
+
+    def validate(self, data):
+        if 'notifications' in data and 'up_to' in data:
+            raise ValidationError(
+                "Give either the notifications or up_to, not both")
+        return data
@@ -1,6 +1,8 @@
 """
 Register signal handlers from other apps that trigger notifications
 """
+from django.db import transaction
+from django.db.models.signals import m2m_changed
 from django.dispatch import receiver
 from django.shortcuts import get_object_or_404
 
@@ -11,7 +13,9 @@ from authors.apps.comments.signals import (
     comment_published_signal,
     CommentsSignalSender,
     comment_liked_signal)
-from authors.apps.notifications.models import Notification
+from authors.apps.notifications.models import Notification, \
+    NotificationStatus
+from authors.apps.notifications.tasks import notify_followers
 from authors.apps.notifications.utils.messages import (
     article_published,
     comment_published,
@@ -22,18 +26,34 @@ from authors.apps.profiles.signals import (
     ProfilesSignalSender)
 
 
+@receiver(m2m_changed, sender=Notification.recipients.through)
+def on_recipients_added(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    when recipients are added to a notification, their unread statuses are
+    created together and their unread counters moved in the same statement
+    """
+    if action != 'post_add':
+        return
+    if reverse:
+        pairs = [(instance.pk, pk) for pk in pk_set]
+    else:
+        pairs = [(pk, instance.pk) for pk in pk_set]
+    NotificationStatus.objects.fan_out(pairs)
+
+
 @receiver(article_published_signal, sender=ArticlesSignalSender)
 def on_article_published(sender, **kwargs):
     """
     when an article is published, we want to create a notification for this
-    and up queue the emails
+    and hand it to a background task that adds the author's followers and
+    queues their emails in batches, however many followers there are
     """
     article = kwargs['article']
     notification = Notification(title="New Article for You",
                                 body=article_published.format(article=article))
     notification.save()
-    notification.recipients.add(*article.author.followed_by.all())
-    notification.queue_notification_emails()
+    transaction.on_commit(lambda: notify_followers.delay(
+        notification.pk, article.author_id))
 
 
 @receiver(comment_liked_signal, sender=CommentsSignalSender)
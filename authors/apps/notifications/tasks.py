@@ -1,9 +1,63 @@
 from celery import shared_task
-from django.core.mail import get_connection, EmailMultiAlternatives, send_mail
 from django.conf import settings
 
+from authors.apps.notifications.models import Notification, \
+    NotificationStatus
+from authors.apps.notifications.utils.mailer import BatchMailer, \
+    email_message
+
+
+@shared_task(bind=True, max_retries=settings.EMAIL_SEND_MAX_RETRIES,
+             default_retry_delay=settings.EMAIL_SEND_RETRY_DELAY)
+def send_emails(self, messages):
+    """
+    sends a batch of emails, made by `email_message`, over one connection
+    and tries the ones that failed again later
+    """
+    failed = BatchMailer().send(messages)
+    if failed:
+        raise self.retry(args=[failed])
+    return len(messages)
+
+
+@shared_task
+def notify_followers(notification_id, profile_id):
+    """
+    adds the followers of a profile to a notification and queues their
+    emails, one batch of followers at a time
+    """
+    from authors.apps.notifications.utils import notification_utils
+    notification_utils.fan_out_to_followers(
+        Notification.objects.get(pk=notification_id), profile_id)
+
+
+@shared_task(bind=True, max_retries=settings.EMAIL_SEND_MAX_RETRIES,
+             default_retry_delay=settings.EMAIL_SEND_RETRY_DELAY)
+def email_notification(self, notification_id, recipient_ids):
+    """
+    emails a notification to a batch of its recipients that are still
+    waiting for it over one connection, records the emails that went out in
+    one UPDATE and tries the recipients it failed to reach again later
+    """
+    notification = Notification.objects.get(pk=notification_id)
+    recipients = dict(NotificationStatus.objects.pending_emails(
+        notification, recipient_ids).values_list('recipient__user__email',
+                                                 'recipient_id'))
+    failed = BatchMailer().send([
+        email_message(notification.title, notification.body, [email])
+        for email in recipients])
+    failed = {recipients[message['to'][0]] for message in failed}
+    NotificationStatus.objects.mark_emails_sent(
+        notification, set(recipients.values()) - failed)
+    if failed:
+        raise self.retry(args=[notification_id, sorted(failed)])
+
 
 @shared_task
-def send_email(subject, message, to, from_email=settings.DEFAULT_FROM_EMAIL,
-               html_message=None):
-    send_mail(subject, message, from_email, to, html_message=html_message)
+def send_email_digests(delivery):
+    """
+    emails every user on `delivery` ('hourly' or 'daily') digests one email
+    with the notifications that came in since their last one
+    """
+    from authors.apps.notifications.utils import digests
+    return digests.send_digests(delivery)
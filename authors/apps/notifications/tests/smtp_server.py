@@ -0,0 +1,74 @@
+import socketserver
+import threading
+
+
+class SMTPStandIn(socketserver.ThreadingTCPServer):
+    """
+    A local SMTP server that speaks just enough of the protocol for
+    Django's SMTP backend. It records each email it accepts, counts the
+    connections made to it, refuses the addresses in `refused` and hangs
+    up after `hang_up_after` emails on a connection when that is set
+    """
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, refused=(), hang_up_after=None):
+        super().__init__(('127.0.0.1', 0), SMTPSession)
+        self.refused = set(refused)
+        self.hang_up_after = hang_up_after
+        self.connections = 0
+        self.received = []
+        self.thread = threading.Thread(target=self.serve_forever,
+                                       daemon=True)
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+        self.server_close()
+
+
+class SMTPSession(socketserver.StreamRequestHandler):
+    def reply(self, line):
+        self.wfile.write(line.encode() + b'\r\n')
+
+    def handle(self):
+        self.server.connections += 1
+        accepted, recipients = 0, []
+        self.reply('220 stand-in ready')
+        for line in self.rfile:
+            command = line.decode().strip()
+            verb = command[:4].upper()
+            if verb in ('HELO', 'EHLO'):
+                self.reply('250 stand-in')
+            elif verb == 'MAIL':
+                recipients = []
+                self.reply('250 OK')
+            elif verb == 'RCPT':
+                address = command.split(':', 1)[1].strip(' <>')
+                if address in self.server.refused:
+                    self.reply('550 No such user')
+                else:
+                    recipients.append(address)
+                    self.reply('250 OK')
+            elif verb == 'DATA':
+                self.reply('354 Go ahead')
+                for data in self.rfile:
+                    if data.rstrip(b'\r\n') == b'.':
+                        break
+                self.server.received.append(recipients)
+                accepted += 1
+                self.reply('250 Queued')
+                if accepted == self.server.hang_up_after:
+                    return
+            elif verb == 'QUIT':
+                self.reply('221 Bye')
+                return
+            else:
+                self.reply('250 OK')
@@ -11,3 +11,7 @@ email = {
 email_notifications_off = {
     'allow_email_notifications': False
 }
+
+hourly_digest = {
+    'email_delivery': 'hourly'
+}
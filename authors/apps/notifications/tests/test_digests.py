@@ -0,0 +1,120 @@
+from django.core import mail
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from authors.apps.authentication.models import User
+from authors.apps.notifications.models import Notification, \
+    NotificationSettings, NotificationStatus
+from authors.apps.notifications.tests.base import BaseTest
+from authors.apps.notifications.utils.digests import render_digest, \
+    send_digests
+
+
+class TestDigests(BaseTest):
+    """
+    Tests collecting pending notifications into one email per user
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.user = self.activated_user()
+        self.other = self.create_another_user_in_db()
+
+    def deliver(self, user, delivery, **kwargs):
+        return NotificationSettings.objects.create(
+            profile=user.profile, email_delivery=delivery, **kwargs)
+
+    def notify(self, user, total):
+        return [self.create_test_notification(user) for _ in range(total)]
+
+    def test_digest_users_are_not_emailed_right_away(self):
+        self.deliver(self.user, NotificationSettings.HOURLY)
+        notification = self.create_test_notification(self.user)
+        notification.recipients.add(self.other.profile)
+        self.assertEqual(list(NotificationStatus.objects.pending_emails(
+            notification).values_list('recipient_id', flat=True)),
+            [self.other.profile.pk])
+
+    def test_one_email_per_user_with_every_pending_notification(self):
+        self.deliver(self.user, NotificationSettings.HOURLY)
+        self.deliver(self.other, NotificationSettings.HOURLY)
+        self.notify(self.user, 3)
+        self.notify(self.other, 1)
+        self.assertEqual(send_digests(NotificationSettings.HOURLY), 2)
+        self.assertEqual(sorted(message.to[0] for message in mail.outbox),
+                         sorted([self.user.email, self.other.email]))
+        digest = next(message for message in mail.outbox
+                      if message.to == [self.user.email])
+        self.assertIn('3 new notification(s)', digest.subject)
+        self.assertEqual(digest.body.count('Test Title'), 3)
+        self.assertFalse(NotificationStatus.objects.filter(
+            email_was_sent=False).exists())
+        self.assertEqual(send_digests(NotificationSettings.HOURLY), 0)
+        self.assertEqual(len(mail.outbox), 2)
+
+    def test_only_users_on_that_digest_who_want_emails_get_one(self):
+        self.deliver(self.user, NotificationSettings.DAILY)
+        self.deliver(self.other, NotificationSettings.HOURLY,
+                     allow_email_notifications=False)
+        self.notify(self.user, 1)
+        self.notify(self.other, 1)
+        self.assertEqual(send_digests(NotificationSettings.HOURLY), 0)
+        self.assertEqual(send_digests(NotificationSettings.DAILY), 1)
+        self.assertEqual([message.to for message in mail.outbox],
+                         [[self.user.email]])
+
+    def test_switching_settings_leaves_what_came_in_before_unsent(self):
+        settings = self.deliver(self.user, NotificationSettings.IMMEDIATE,
+                                allow_email_notifications=False)
+        self.notify(self.user, 3)
+        settings.allow_email_notifications = True
+        settings.email_delivery = NotificationSettings.DAILY
+        settings.save()
+        self.notify(self.user, 1)
+        self.assertEqual(send_digests(NotificationSettings.DAILY), 1)
+        self.assertIn('1 new notification(s)', mail.outbox[0].subject)
+
+    def test_saving_unchanged_settings_keeps_pending_notifications(self):
+        settings = self.deliver(self.user, NotificationSettings.DAILY)
+        self.notify(self.user, 2)
+        settings.allow_in_app_notifications = False
+        settings.save()
+        self.assertEqual(send_digests(NotificationSettings.DAILY), 1)
+        self.assertIn('2 new notification(s)', mail.outbox[0].subject)
+
+    def test_users_are_processed_in_batches(self):
+        users = [User.objects.create_user(
+            username=f'reader{index}', email=f'reader{index}@mail.com',
+            password='ia83naJS') for index in range(4)]
+        for user in users:
+            self.deliver(user, NotificationSettings.HOURLY)
+        notification = Notification.objects.create(title='hi', body='there')
+        notification.recipients.add(*[user.profile for user in users])
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(
+                send_digests(NotificationSettings.HOURLY, batch_size=2), 4)
+        # per batch: the users, their notifications and the update, then
+        # one query finds no more users
+        self.assertEqual(len(queries.captured_queries), 7)
+
+    @override_settings(NOTIFICATION_DIGEST_MAX_ITEMS=2)
+    def test_long_digests_list_the_newest_and_count_the_rest(self):
+        self.deliver(self.user, NotificationSettings.DAILY)
+        notifications = self.notify(self.user, 4)
+        Notification.objects.filter(pk=notifications[-1].pk).update(
+            title='newest')
+        self.assertEqual(send_digests(NotificationSettings.DAILY), 1)
+        digest = mail.outbox[0]
+        self.assertIn('4 new notification(s)', digest.subject)
+        self.assertTrue(digest.body.startswith('newest'))
+        self.assertEqual(digest.body.count('Test Title'), 1)
+        self.assertIn('2 more', digest.body)
+        self.assertFalse(NotificationStatus.objects.filter(
+            email_was_sent=False).exists())
+
+    def test_render_digest(self):
+        subject, body = render_digest([('second', 'b'), ('first', 'a')],
+                                      total=2)
+        self.assertIn('2 new notification(s)', subject)
+        self.assertEqual(body, 'second\nb\n\nfirst\na')
@@ -0,0 +1,69 @@
+from django.core.mail import get_connection
+from django.test import SimpleTestCase
+
+from authors.apps.notifications.tests.smtp_server import SMTPStandIn
+from authors.apps.notifications.utils.mailer import BatchMailer, \
+    email_message
+
+
+def messages(*addresses):
+    return [email_message('Hello', 'There', [address],
+                          from_email='ah@mail.com')
+            for address in addresses]
+
+
+class TestBatchMailer(SimpleTestCase):
+    """
+    Tests sending batches of emails against a local SMTP server
+    """
+
+    def mailer(self, server, **kwargs):
+        connection = get_connection(
+            'django.core.mail.backends.smtp.EmailBackend',
+            host='127.0.0.1', port=server.port, username='', password='',
+            use_tls=False, timeout=5)
+        return BatchMailer(connection=connection, **kwargs)
+
+    def test_a_batch_goes_out_over_one_connection(self):
+        with SMTPStandIn() as server:
+            failed = self.mailer(server, rate=0).send(
+                messages('a@mail.com', 'b@mail.com', 'c@mail.com'))
+        self.assertEqual(failed, [])
+        self.assertEqual(server.connections, 1)
+        self.assertEqual(server.received,
+                         [['a@mail.com'], ['b@mail.com'], ['c@mail.com']])
+
+    def test_refused_emails_are_reported_and_the_rest_still_sent(self):
+        batch = messages('a@mail.com', 'gone@mail.com', 'c@mail.com')
+        with SMTPStandIn(refused={'gone@mail.com'}) as server:
+            failed = self.mailer(server, rate=0).send(batch)
+        self.assertEqual(failed, [batch[1]])
+        self.assertEqual(server.received, [['a@mail.com'], ['c@mail.com']])
+
+    def test_the_batch_carries_on_when_the_server_hangs_up(self):
+        with SMTPStandIn(hang_up_after=2) as server:
+            failed = self.mailer(server, rate=0).send(
+                messages('a@mail.com', 'b@mail.com', 'c@mail.com'))
+        self.assertEqual(failed, [])
+        self.assertEqual(len(server.received), 3)
+        self.assertEqual(server.connections, 2)
+
+    def test_the_whole_batch_fails_when_the_server_is_down(self):
+        with SMTPStandIn() as server:
+            mailer = self.mailer(server, rate=0)
+        batch = messages('a@mail.com', 'b@mail.com')
+        self.assertEqual(mailer.send(batch), batch)
+
+    def test_emails_go_out_no_faster_than_the_rate(self):
+        now, waits = [0.0], []
+
+        def sleep(seconds):
+            waits.append(seconds)
+            now[0] += seconds
+
+        with SMTPStandIn() as server:
+            self.mailer(server, rate=4, clock=lambda: now[0],
+                        sleep=sleep).send(
+                messages('a@mail.com', 'b@mail.com', 'c@mail.com'))
+        self.assertEqual(waits, [0.25, 0.25])
+        self.assertEqual(len(server.received), 3)
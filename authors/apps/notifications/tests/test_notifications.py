@@ -1,27 +1,50 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 from django.core import mail
 
+from authors.apps.authentication.models import User
 from authors.apps.notifications.signals import Notification
 from authors.apps.notifications.models import NotificationSettings, \
     NotificationStatus
-from authors.apps.notifications.tasks import send_email
+from authors.apps.notifications.tasks import email_notification, \
+    send_emails
 from authors.apps.notifications.tests.base import BaseTest
+from authors.apps.notifications.utils.mailer import email_message
 from authors.apps.notifications.utils.notification_utils import \
-    send_notification_emails
+    fan_out_to_followers, follower_id_batches, send_notification_emails
 from . import test_data
 
 
+def queue_email_tasks():
+    """
+    runs the on-commit callbacks that queue email tasks at once, as tests
+    never commit, and records the tasks instead of queueing them
+    """
+    on_commit = patch('authors.apps.notifications.utils.notification_utils.'
+                      'transaction.on_commit', lambda callback: callback())
+    email_notification = patch('authors.apps.notifications.utils.'
+                               'notification_utils.email_notification')
+    return on_commit, email_notification
+
+
 class UtilTests(BaseTest):
-    def test_send_notification_emails_properly_calls_send_email(self):
-        send_email_delay_mock = MagicMock()
-        send_email.delay = send_email_delay_mock
+    def send_notification_emails(self, notification, **kwargs):
+        on_commit, email_notification = queue_email_tasks()
+        with on_commit, email_notification as task:
+            self.assertTrue(send_notification_emails(notification, **kwargs))
+        return task.delay
 
-        notification = self.create_test_notification(self.activated_user())
+    def test_send_notification_emails_queues_one_task_per_batch(self):
+        user = self.activated_user()
+        other = self.create_another_user_in_db()
+        notification = self.create_test_notification(user)
+        notification.recipients.add(other.profile)
 
-        self.assertTrue(send_notification_emails(notification))
-        self.assertEqual(send_email_delay_mock.call_count,
-                         notification.recipients.count())
+        delay = self.send_notification_emails(notification)
+        delay.assert_called_once_with(
+            notification.pk, sorted([user.profile.pk, other.profile.pk]))
+        delay = self.send_notification_emails(notification, batch_size=1)
+        self.assertEqual(delay.call_count, 2)
 
     def test_send_notification_emails_sends_to_only_those_who_opt_in(self):
         user = self.activated_user()
@@ -29,11 +52,8 @@ class UtilTests(BaseTest):
             profile=user.profile)
         notification_settings.toggle_email_notifications(False)
         notification = self.create_test_notification(user)
-        send_email_delay_mock = MagicMock()
-        send_email.delay = send_email_delay_mock
 
-        self.assertTrue(send_notification_emails(notification))
-        send_email_delay_mock.assert_not_called()
+        self.send_notification_emails(notification).assert_not_called()
 
     def test_send_notification_emails_sends_only_unsent_emails(self):
         user = self.activated_user()
@@ -41,21 +61,71 @@ class UtilTests(BaseTest):
         notification_status, _ = NotificationStatus.objects.get_or_create(
             recipient=user.profile, notification=notification)
         notification_status.set_email_status_as_sent()
-        send_email_delay_mock = MagicMock()
-        send_email.delay = send_email_delay_mock
 
-        self.assertTrue(send_notification_emails(notification))
-        send_email_delay_mock.assert_not_called()
+        self.send_notification_emails(notification).assert_not_called()
+
+    def test_fan_out_adds_followers_in_batches(self):
+        author = self.activated_user().profile
+        followers = [User.objects.create_user(
+            username=f'fan{index}', email=f'fan{index}@mail.com',
+            password='ia83naJS').profile for index in range(5)]
+        for follower in followers:
+            follower.follow(author)
+        NotificationSettings.objects.create(
+            profile=followers[1], allow_email_notifications=False)
+        notification = Notification.objects.create(title='hi', body='there')
+
+        on_commit, email_notification = queue_email_tasks()
+        with on_commit, email_notification as task:
+            fan_out_to_followers(notification, author.pk, batch_size=2)
+        self.assertEqual(
+            set(notification.recipients.values_list('pk', flat=True)),
+            {follower.pk for follower in followers})
+        self.assertEqual(NotificationStatus.objects.filter(
+            notification=notification).count(), 5)
+        self.assertEqual(
+            [call[0][1] for call in task.delay.call_args_list],
+            [[followers[0].pk], [followers[2].pk, followers[3].pk],
+             [followers[4].pk]])
+
+    def test_follower_batches_are_read_in_id_order(self):
+        author = self.activated_user().profile
+        fans = [User.objects.create_user(
+            username=f'fan{index}', email=f'fan{index}@mail.com',
+            password='ia83naJS').profile for index in range(3)]
+        for fan in reversed(fans):
+            fan.follow(author)
+        self.assertEqual(list(follower_id_batches(author.pk, 2)),
+                         [[fans[0].pk, fans[1].pk], [fans[2].pk]])
 
 
 class TaskTests(BaseTest):
-    def test_send_email(self):
+    def test_send_emails(self):
         self.assertEqual(len(mail.outbox), 0)
-        send_email(test_data.email['subject'], test_data.email['message'],
-                   to=[self.activated_user()])
+        send_emails([email_message(
+            test_data.email['subject'], test_data.email['message'],
+            [self.activated_user().email])])
         self.assertEqual(len(mail.outbox), 1)
         self.assertEqual(mail.outbox[0].subject, test_data.email['subject'])
 
+    def test_email_notification_sends_a_batch_and_records_it(self):
+        user = self.activated_user()
+        other = self.create_another_user_in_db()
+        notification = self.create_test_notification(user)
+        notification.recipients.add(other.profile)
+
+        email_notification(notification.pk, [user.profile.pk])
+        self.assertEqual([message.to for message in mail.outbox],
+                         [[user.email]])
+        self.assertEqual(list(NotificationStatus.objects.filter(
+            notification=notification, email_was_sent=True).values_list(
+                'recipient_id', flat=True)), [user.profile.pk])
+
+        email_notification(notification.pk, [user.profile.pk,
+                                             other.profile.pk])
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertEqual(mail.outbox[1].to, [other.email])
+
 
 class ModelTests(BaseTest):
     def test_notification_settings_are_both_true_by_default(self):
@@ -27,3 +27,17 @@ class NotificationViewsTests(BaseTest):
         notification_settings = NotificationSettings.objects.get(
             profile=user.profile)
         self.assertFalse(notification_settings.allow_email_notifications)
+
+    def test_user_can_switch_to_digests(self):
+        user = self.activated_user()
+        self.client.force_authenticate(user)
+        response = self.client.patch(self.notification_settings_url,
+                                     format='json',
+                                     data=test_data.hourly_digest)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(NotificationSettings.objects.get(
+            profile=user.profile).email_delivery, NotificationSettings.HOURLY)
+        response = self.client.patch(self.notification_settings_url,
+                                     format='json',
+                                     data={'email_delivery': 'weekly'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,135 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from authors.apps.notifications.models import Notification, \
+    NotificationCounter, NotificationStatus
+from authors.apps.notifications.tests.base import BaseTest
+
+
+class TestUnreadFeed(BaseTest):
+    """
+    Tests the unread notification feed and the unread counter
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.user = self.activated_user()
+        self.other = self.create_another_user_in_db()
+        self.unread_count_url = reverse('notifications:unread-count')
+        self.client.force_authenticate(self.user)
+
+    def notify(self, total):
+        return [self.create_test_notification(self.user)
+                for _ in range(total)]
+
+    def unread_count(self):
+        response = self.client.get(self.unread_count_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data['unread_count']
+
+    def test_fan_out_creates_statuses_and_counts_them(self):
+        notification = Notification.objects.create(title='hi', body='there')
+        with CaptureQueriesContext(connection) as queries:
+            notification.recipients.add(self.user.profile,
+                                        self.other.profile)
+        self.assertEqual(len([query for query in queries.captured_queries
+                              if 'notificationstatus' in query['sql']]), 1)
+        self.other.profile.notifications.add(
+            Notification.objects.create(title='hi', body='again'))
+        self.assertEqual(NotificationStatus.objects.filter(
+            notification=notification, was_read_in_app=False).count(), 2)
+        self.assertEqual(NotificationCounter.unread_of(self.user), 1)
+        self.assertEqual(NotificationCounter.unread_of(self.other), 2)
+
+    def test_feed_is_paged_newest_first(self):
+        notifications = self.notify(3)
+        response = self.client.get(self.get_notifications_url, {'limit': 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([item['pk'] for item in
+                          response.data['notifications']],
+                         [notifications[2].pk, notifications[1].pk])
+        self.assertEqual(response.data['notifications'][0]['title'],
+                         notifications[2].title)
+        response = self.client.get(response.data['next'])
+        self.assertEqual([item['pk'] for item in
+                          response.data['notifications']],
+                         [notifications[0].pk])
+        self.assertIsNone(response.data['next'])
+
+    def test_reading_the_feed_writes_nothing_whatever_the_history(self):
+        self.notify(2)
+        with CaptureQueriesContext(connection) as small:
+            self.client.get(self.get_notifications_url)
+        self.notify(30)
+        with CaptureQueriesContext(connection) as large:
+            response = self.client.get(self.get_notifications_url)
+        self.assertEqual(len(large.captured_queries),
+                         len(small.captured_queries))
+        self.assertFalse([query for query in large.captured_queries
+                          if not query['sql'].startswith('SELECT')])
+        self.assertEqual(len(response.data['notifications']), 20)
+
+    def test_unread_count_follows_fan_out_and_reading(self):
+        self.assertEqual(self.unread_count(), 0)
+        self.notify(3)
+        self.assertEqual(self.unread_count(), 3)
+        self.client.post(self.mark_notifications_as_read_url)
+        self.assertEqual(self.unread_count(), 0)
+        self.notify(1)
+        self.assertEqual(self.unread_count(), 1)
+
+    def test_unread_count_needs_authentication(self):
+        self.client.force_authenticate(None)
+        response = self.client.get(self.unread_count_url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_marking_all_as_read_is_one_statement(self):
+        self.notify(5)
+        profile = self.user.profile
+        with CaptureQueriesContext(connection) as queries:
+            marked = NotificationStatus.objects.mark_all_as_read(profile)
+        self.assertEqual(len(queries.captured_queries), 1)
+        self.assertEqual(marked, 5)
+        self.assertEqual(self.unread_count(), 0)
+        self.assertEqual(
+            NotificationStatus.objects.mark_all_as_read(profile), 0)
+        self.assertEqual(self.unread_count(), 0)
+
+    def test_mark_listed_notifications_as_read(self):
+        notifications = self.notify(3)
+        others = self.create_test_notification(self.other)
+        response = self.client.post(
+            self.mark_notifications_as_read_url,
+            {'notifications': [notifications[0].pk, notifications[2].pk,
+                               others.pk]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['marked'], 2)
+        self.assertEqual(self.unread_count(), 1)
+        self.assertEqual(NotificationCounter.unread_of(self.other), 1)
+        response = self.client.get(self.get_notifications_url)
+        self.assertEqual([item['pk'] for item in
+                          response.data['notifications']],
+                         [notifications[1].pk])
+
+    def test_mark_as_read_up_to_a_watermark(self):
+        seen = self.notify(2)
+        newer = self.notify(1)
+        response = self.client.post(self.mark_notifications_as_read_url,
+                                    {'up_to': seen[-1].pk}, format='json')
+        self.assertEqual(response.data['message'], "Marked all as read")
+        self.assertEqual(response.data['marked'], 2)
+        self.assertEqual(self.unread_count(), 1)
+        response = self.client.get(self.get_notifications_url)
+        self.assertEqual([item['pk'] for item in
+                          response.data['notifications']], [newer[0].pk])
+
+    def test_mark_as_read_rejects_ids_and_watermark_together(self):
+        notifications = self.notify(1)
+        response = self.client.post(
+            self.mark_notifications_as_read_url,
+            {'notifications': [notifications[0].pk],
+             'up_to': notifications[0].pk}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.unread_count(), 1)
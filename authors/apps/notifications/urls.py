@@ -1,5 +1,6 @@
 from django.urls import path
-from .views import NotificationSettingsAPIView, NotificationAPIView
+from .views import NotificationSettingsAPIView, NotificationAPIView, \
+    UnreadNotificationCountAPIView
 
 app_name = "profiles"
 
@@ -7,5 +8,7 @@ urlpatterns = [
     path("settings", NotificationSettingsAPIView.as_view(),
          name="settings"),
     path("read", NotificationAPIView.as_view(), name="read"),
+    path("unread-count", UnreadNotificationCountAPIView.as_view(),
+         name="unread-count"),
     path('', NotificationAPIView.as_view(), name="notifications"),
 ]
@@ -0,0 +1,79 @@
+from itertools import groupby
+
+from django.conf import settings
+
+from authors.apps.notifications.models import NotificationSettings, \
+    NotificationStatus
+from authors.apps.notifications.utils.mailer import BatchMailer, \
+    email_message
+from authors.apps.notifications.utils.messages import digest_item, \
+    digest_more, digest_subject
+
+
+def digest_recipient_batches(delivery, batch_size):
+    """
+    yields the (profile id, email) of the users that get their emails as
+    `delivery` digests, in profile order, `batch_size` at a time
+    """
+    recipients = NotificationSettings.objects.filter(
+        email_delivery=delivery, allow_email_notifications=True)
+    last_id = 0
+    while True:
+        batch = list(recipients.filter(profile_id__gt=last_id).order_by(
+            'profile_id').values_list('profile_id',
+                                      'profile__user__email')[:batch_size])
+        if not batch:
+            return
+        yield batch
+        last_id = batch[-1][0]
+
+
+def render_digest(notifications, total):
+    """
+    renders the newest of a user's pending notifications into the subject
+    and body of a single email
+    :param notifications: the (title, body) of those listed, newest first
+    :param total: how many notifications are pending in all
+    """
+    body = '\n\n'.join(digest_item.format(title=title, body=body)
+                       for title, body in notifications)
+    if total > len(notifications):
+        body += '\n\n' + digest_more.format(
+            count=total - len(notifications))
+    return digest_subject.format(count=total), body
+
+
+def send_digests(delivery, batch_size=None):
+    """
+    send_digests emails every user on `delivery` digests one email with
+    the notifications waiting for them, a batch of users at a time.
+    Each batch reads the newest NOTIFICATION_DIGEST_MAX_ITEMS notifications
+    of each user and how many they have in one query, goes out over one
+    connection and has its notifications recorded as emailed in one
+    UPDATE. The notifications of users that could not be emailed wait for
+    the next digest
+    :return: how many digests were sent
+    """
+    batch_size = batch_size or settings.NOTIFICATION_FAN_OUT_BATCH_SIZE
+    sent = 0
+    for recipients in digest_recipient_batches(delivery, batch_size):
+        emails = dict(recipients)
+        pending = groupby(NotificationStatus.objects.pending_digests(
+            list(emails), settings.NOTIFICATION_DIGEST_MAX_ITEMS),
+            key=lambda row: row[0])
+        digests, newest = [], {}
+        for recipient_id, rows in pending:
+            rows = list(rows)
+            subject, body = render_digest(
+                [(title, body) for _, _, title, body, _ in rows],
+                total=rows[0][4])
+            digests.append(email_message(subject, body,
+                                         [emails[recipient_id]]))
+            newest[recipient_id] = rows[0][1]
+        failed = {message['to'][0] for message in BatchMailer().send(digests)}
+        NotificationStatus.objects.mark_digests_sent({
+            recipient_id: newest_id
+            for recipient_id, newest_id in newest.items()
+            if emails[recipient_id] not in failed})
+        sent += len(digests) - len(failed)
+    return sent
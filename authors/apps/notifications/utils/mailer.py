@@ -0,0 +1,86 @@
+import smtplib
+import time
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+
+
+def email_message(subject, body, to, from_email=None, html_message=None):
+    """
+    describes an email as a plain dict, so that it can be handed to a task
+    """
+    return {'subject': subject, 'body': body, 'to': list(to),
+            'from_email': from_email or settings.DEFAULT_FROM_EMAIL,
+            'html_message': html_message}
+
+
+def build_message(message, connection):
+    """builds the email a dict made by `email_message` describes"""
+    email = EmailMultiAlternatives(message['subject'], message['body'],
+                                   message['from_email'], message['to'],
+                                   connection=connection)
+    if message.get('html_message'):
+        email.attach_alternative(message['html_message'], 'text/html')
+    return email
+
+
+class BatchMailer:
+    """
+    BatchMailer sends a batch of emails over a single SMTP connection, so the
+    connection and its TLS handshake are paid for once per batch instead of
+    once per email. Emails are handed to the server one at a time: one it
+    refuses is reported as failed and the rest still go out. A connection
+    the server drops mid-batch is opened again. At most `rate` emails go
+    out a second, none when `rate` is 0.
+    """
+
+    def __init__(self, connection=None, rate=None, clock=time.monotonic,
+                 sleep=time.sleep):
+        self.connection = connection or get_connection()
+        self.rate = settings.EMAIL_SEND_RATE if rate is None else rate
+        self.clock = clock
+        self.sleep = sleep
+        self.next_send_at = None
+
+    def send(self, messages):
+        """
+        send sends every message of a batch
+        :return: the messages that could not be sent
+        """
+        try:
+            self.connection.open()
+        except (smtplib.SMTPException, OSError):
+            return list(messages)
+        failed = []
+        try:
+            for message in messages:
+                self.wait_for_turn()
+                try:
+                    self.deliver(build_message(message, self.connection))
+                except (smtplib.SMTPException, OSError):
+                    failed.append(message)
+        finally:
+            self.connection.close()
+        return failed
+
+    def deliver(self, email):
+        try:
+            sent = self.connection.send_messages([email])
+        except smtplib.SMTPServerDisconnected:
+            # servers may hang up after a number of emails, the rest of the
+            # batch carries on over a new connection
+            self.connection.close()
+            self.connection.open()
+            sent = self.connection.send_messages([email])
+        if not sent:
+            raise smtplib.SMTPException("The email was not sent")
+
+    def wait_for_turn(self):
+        """waits until the next email may go out without exceeding `rate`"""
+        if not self.rate:
+            return
+        now = self.clock()
+        if self.next_send_at is not None and now < self.next_send_at:
+            self.sleep(self.next_send_at - now)
+            now = self.next_send_at
+        self.next_send_at = now + 1 / self.rate
@@ -6,3 +6,9 @@ comment_liked = "{user.username} liked your comment '{comment.body}'"
 comment_published = """{comment.body}\nYou can read it at {comment.url}"""
 
 user_followed_message = "{username}({link_to_profile}) followed you"
+
+digest_subject = "You have {count} new notification(s) on Authors Haven"
+
+digest_item = "{title}\n{body}"
+
+digest_more = "...and {count} more, read them all on Authors Haven"
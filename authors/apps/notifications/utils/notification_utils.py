@@ -1,21 +1,59 @@
-from authors.apps.notifications.models import NotificationStatus, \
-    NotificationSettings
-from authors.apps.notifications.tasks import send_email
+from itertools import islice
 
+from django.conf import settings
+from django.db import transaction
 
-def send_notification_emails(notification):
-    for recipient in notification.recipients.all():
-        notification_status, _ = NotificationStatus.objects.get_or_create(
-            recipient=recipient, notification=notification)
+from authors.apps.notifications.models import NotificationStatus
+from authors.apps.notifications.tasks import email_notification
+from authors.apps.profiles.models import Profile
 
-        notification_settings, _ = NotificationSettings.objects.get_or_create(
-            profile=recipient)
 
-        if not notification_status.email_was_sent and \
-                notification_settings.allow_email_notifications:
-            send_email.delay(subject=notification.title,
-                             message=notification.body,
-                             to=[recipient.user.email]).then(
-                lambda: notification_status.set_email_status_as_sent())
+def follower_id_batches(profile_id, batch_size):
+    """
+    yields the ids of the followers of a profile in id order, `batch_size`
+    at a time, each batch read from where the last one ended
+    """
+    follows = Profile.follows.through.objects.filter(to_profile_id=profile_id)
+    last_id = 0
+    while True:
+        batch = list(follows.filter(from_profile_id__gt=last_id).order_by(
+            'from_profile_id').values_list('from_profile_id',
+                                           flat=True)[:batch_size])
+        if not batch:
+            return
+        yield batch
+        last_id = batch[-1]
 
+
+def fan_out_to_followers(notification, profile_id, batch_size=None):
+    """
+    adds every follower of a profile to a notification's recipients and
+    queues their emails, a batch at a time, so that no single statement or
+    task has to deal with all of them
+    """
+    batch_size = batch_size or settings.NOTIFICATION_FAN_OUT_BATCH_SIZE
+    for recipient_ids in follower_id_batches(profile_id, batch_size):
+        notification.recipients.add(*recipient_ids)
+        send_notification_emails(notification, recipient_ids, batch_size)
+
+
+def send_notification_emails(notification, recipient_ids=None,
+                             batch_size=None):
+    """
+    queues one email task per batch of the recipients of a notification that
+    still need its email and accept emails. The tasks are queued once the
+    statuses they read are committed
+    :param recipient_ids: only consider these recipients
+    """
+    batch_size = batch_size or settings.NOTIFICATION_FAN_OUT_BATCH_SIZE
+    pending = NotificationStatus.objects.pending_emails(
+        notification, recipient_ids).values_list('recipient_id', flat=True)
+    pending = iter(pending)
+    while True:
+        batch = list(islice(pending, batch_size))
+        if not batch:
+            break
+        transaction.on_commit(
+            lambda batch=batch: email_notification.delay(notification.pk,
+                                                         batch))
     return True
@@ -3,11 +3,14 @@ from rest_framework.generics import GenericAPIView
 from rest_framework.response import Response
 
 from authors.apps.notifications.models import NotificationSettings, \
-    Notification
+    Notification, NotificationCounter, NotificationStatus
+from authors.apps.notifications.paginators import \
+    NotificationCursorPagination
 from authors.apps.notifications.renderers import NotificationSettingsRenderer,\
     NotificationsRenderer
 from authors.apps.notifications.serializers import \
-    NotificationSettingsSerializer, NotificationSerializer
+    MarkAsReadSerializer, NotificationSettingsSerializer, \
+    UnreadNotificationSerializer
 
 
 class NotificationSettingsAPIView(GenericAPIView):
@@ -59,29 +62,55 @@ class NotificationSettingsAPIView(GenericAPIView):
 
 
 class NotificationAPIView(GenericAPIView):
-    serializer_class = NotificationSerializer
+    serializer_class = UnreadNotificationSerializer
     permission_classes = (permissions.IsAuthenticated,)
     renderer_classes = (NotificationsRenderer,)
+    pagination_class = NotificationCursorPagination
 
     def get(self, request):
         """
-        Get all of a user's unread in-app notifications
+        Get a page of a user's unread in-app notifications, newest first
         :return: The response containing these notifications
         """
-        notifications = Notification.get_unread_in_app_notifications(
-            request.user.profile)
-        serializer = self.serializer_class(notifications, many=True,
+        page = self.paginate_queryset(
+            NotificationStatus.objects.unread_feed(request.user.profile))
+        serializer = self.serializer_class(page, many=True,
                                            context={
                                                'request': request})
-        return Response({'notifications': serializer.data},
+        return Response({'notifications': serializer.data,
+                         'next': self.paginator.get_next_link(),
+                         'previous': self.paginator.get_previous_link()},
                         status=status.HTTP_200_OK)
 
     def post(self, request):
         """
-        Mark a user's in-appp notifications as read
+        Mark a user's in-app notifications as read, all of them, those up to
+        `up_to` or only the ids listed in `notifications`
         :return: Whether or not the action was successful
         """
-        Notification.mark_all_unread_as_read(
-            request.user.profile)
-        message = "Marked all as read"
-        return Response({'message': message}, status=status.HTTP_200_OK)
+        serializer = MarkAsReadSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        notification_ids = serializer.validated_data.get('notifications')
+        if notification_ids is None:
+            marked = Notification.mark_all_unread_as_read(
+                request.user.profile,
+                up_to=serializer.validated_data.get('up_to'))
+            message = "Marked all as read"
+        else:
+            marked = NotificationStatus.objects.mark_as_read(
+                request.user.profile, notification_ids=notification_ids)
+            message = "Marked {} as read".format(marked)
+        return Response({'message': message, 'marked': marked},
+                        status=status.HTTP_200_OK)
+
+
+class UnreadNotificationCountAPIView(GenericAPIView):
+    permission_classes = (permissions.IsAuthenticated,)
+
+    def get(self, request):
+        """
+        Get how many unread in-app notifications a user has
+        :return: The response containing the count
+        """
+        return Response({'unread_count': NotificationCounter.unread_of(
+            request.user)}, status=status.HTTP_200_OK)
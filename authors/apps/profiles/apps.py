@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+
+class ProfilesConfig(AppConfig):
+    name = 'authors.apps.profiles'
+    verbose_name = 'Profiles'
+
+    def ready(self):
+        from . import signals
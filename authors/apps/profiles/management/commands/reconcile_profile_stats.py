@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from authors.apps.profiles.models import ProfileStats
+
+
+class Command(BaseCommand):
+    """
+    Recounts the followers, followings, articles and article likes stored
+    on every profile from the tables they summarise and rewrites the ones
+    that drifted. Useful after loading data behind the application's back,
+    e.g. deleting accounts, whose follows go without signals.
+    """
+    help = "Reconcile the statistics stored on profiles"
+
+    def handle(self, *args, **options):
+        reconciled = ProfileStats.objects.reconcile()
+        self.stdout.write(self.style.SUCCESS(
+            f"Reconciled the stats of {reconciled} profile(s)"))
@@ -0,0 +1,48 @@
+# Generated by Django 2.1.5 on 2026-10-18 14:46
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+# counts the followers, followings, articles and article likes of every
+# existing profile
+FILL_PROFILE_STATS_SQL = """
+INSERT INTO profiles_profilestats
+    (profile_id, followers_count, following_count, articles_count,
+     likes_received)
+SELECT profile.id,
+    (SELECT count(*) FROM profiles_profile_follows follow
+     WHERE follow.to_profile_id = profile.id),
+    (SELECT count(*) FROM profiles_profile_follows follow
+     WHERE follow.from_profile_id = profile.id),
+    (SELECT count(*) FROM articles_article article
+     WHERE article.author_id = profile.id),
+    (SELECT count(*) FROM reactions_reaction reaction
+     JOIN articles_article article ON article.id = reaction.object_id
+     JOIN django_content_type type ON type.id = reaction.content_type_id
+     WHERE type.app_label = 'articles' AND type.model = 'article'
+         AND reaction.reaction = 1 AND article.author_id = profile.id)
+FROM profiles_profile profile;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0003_merge_20190214_1334'),
+        ('articles', '0019_report_unique_reporter'),
+        ('reactions', '0002_move_likes_and_dislikes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProfileStats',
+            fields=[
+                ('profile', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to='profiles.Profile')),
+                ('followers_count', models.IntegerField(default=0)),
+                ('following_count', models.IntegerField(default=0)),
+                ('articles_count', models.IntegerField(default=0)),
+                ('likes_received', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.RunSQL(FILL_PROFILE_STATS_SQL, migrations.RunSQL.noop),
+    ]
@@ -1,9 +1,45 @@
-from django.db import models
-from django.db.models.signals import post_save
+from collections import Counter, defaultdict
+
+from django.apps import apps
 from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db import connections, models
+from django.db.models import Exists, OuterRef, Value
+from django.db.models.signals import post_save
+from psycopg2.extras import execute_values
 from rest_framework.reverse import reverse
 
 
+class ProfileManager(models.Manager):
+    """
+    ProfileManager class is a custom Profile model manager
+    """
+
+    def follow_summaries(self, user, profile_ids):
+        """
+        follow_summaries returns, in one query, the follower and following
+        counts of the given profiles and whether `user` follows each of them,
+        keyed by profile id
+        """
+        if not profile_ids:
+            return {}
+        if user is None or user.is_anonymous:
+            viewer_follows = Value(False, output_field=models.BooleanField())
+        else:
+            viewer_follows = Exists(Profile.follows.through.objects.filter(
+                from_profile__user=user, to_profile=OuterRef('pk')))
+        summaries = self.filter(pk__in=profile_ids)\
+            .annotate(viewer_follows=viewer_follows).values_list(
+                'pk', 'stats__followers_count', 'stats__following_count',
+                'viewer_follows')
+        # profiles nothing has happened to yet have no stats row
+        return {
+            pk: {'followers_count': followers or 0,
+                 'following_count': following or 0,
+                 'following': is_following}
+            for pk, followers, following, is_following in summaries}
+
+
 class Profile(models.Model):
     user = models.OneToOneField(settings.AUTH_USER_MODEL,
                                 on_delete=models.CASCADE)
@@ -18,6 +54,8 @@ class Profile(models.Model):
                                      symmetrical=False)
     date_of_birth = models.DateField(null=True, blank=True)
 
+    objects = ProfileManager()
+
     def __str__(self):
         return self.username
 
@@ -46,6 +84,128 @@ class Profile(models.Model):
         return self.username
 
 
+class ProfileStatsManager(models.Manager):
+    """
+    ProfileStatsManager keeps the denormalized profile statistics in step.
+    Changes are applied as deltas in the database, so concurrent writers
+    cannot overwrite each other's counts
+    """
+    counters = ('followers_count', 'following_count', 'articles_count',
+                'likes_received')
+    # adds deltas to the stats rows of several profiles in one statement,
+    # creating the rows of profiles that have none yet
+    adjust_sql = """
+        INSERT INTO {table} AS stats (profile_id, {counters}) VALUES %s
+        ON CONFLICT (profile_id) DO UPDATE SET {changes}
+    """
+    # recounts every profile's stats from the tables they summarise and
+    # rewrites the rows that drifted
+    reconcile_sql = """
+        INSERT INTO {table} AS stats (profile_id, {counters})
+        SELECT profile.id,
+            (SELECT count(*) FROM {follows} follow
+             WHERE follow.to_profile_id = profile.id),
+            (SELECT count(*) FROM {follows} follow
+             WHERE follow.from_profile_id = profile.id),
+            (SELECT count(*) FROM {articles} article
+             WHERE article.author_id = profile.id),
+            (SELECT count(*) FROM {reactions} reaction
+             JOIN {articles} article ON article.id = reaction.object_id
+             WHERE reaction.content_type_id = %s AND reaction.reaction = %s
+                 AND article.author_id = profile.id)
+        FROM {profiles} profile
+        ON CONFLICT (profile_id) DO UPDATE SET {replacements}
+        WHERE ({current}) IS DISTINCT FROM ({recounted})
+    """
+
+    def adjust(self, profile_id, **deltas):
+        """
+        adjust moves the given counters of a profile by the given amounts
+        """
+        self.adjust_many({profile_id: deltas})
+
+    def adjust_many(self, deltas_by_profile):
+        """
+        adjust_many moves the counters of several profiles at once, given as
+        a mapping of profile id to {counter: amount}. Rows are written in
+        profile order so that concurrent adjustments cannot deadlock
+        """
+        rows = [(profile_id, *(deltas.get(counter, 0)
+                               for counter in self.counters))
+                for profile_id, deltas in sorted(deltas_by_profile.items())
+                if profile_id is not None and any(deltas.values())]
+        if not rows:
+            return
+        sql = self.adjust_sql.format(
+            table=self.model._meta.db_table,
+            counters=', '.join(self.counters),
+            changes=', '.join(f'{counter} = stats.{counter} + '
+                              f'EXCLUDED.{counter}'
+                              for counter in self.counters))
+        with connections[self.db].cursor() as cursor:
+            execute_values(cursor, sql, rows)
+
+    def record_follows(self, follows, delta):
+        """
+        record_follows counts each (follower id, followed id) pair as a
+        follower of the one and a following of the other, `delta` times
+        """
+        deltas_by_profile = defaultdict(Counter)
+        for follower_id, followed_id in follows:
+            deltas_by_profile[followed_id]['followers_count'] += delta
+            deltas_by_profile[follower_id]['following_count'] += delta
+        self.adjust_many(deltas_by_profile)
+
+    def reconcile(self):
+        """
+        reconcile recomputes the stats of every profile and returns the
+        number of rows that were missing or wrong
+        """
+        article = apps.get_model('articles', 'Article')
+        reaction = apps.get_model('reactions', 'Reaction')
+        sql = self.reconcile_sql.format(
+            table=self.model._meta.db_table,
+            counters=', '.join(self.counters),
+            follows=Profile.follows.through._meta.db_table,
+            articles=article._meta.db_table,
+            reactions=reaction._meta.db_table,
+            profiles=Profile._meta.db_table,
+            replacements=', '.join(f'{counter} = EXCLUDED.{counter}'
+                                   for counter in self.counters),
+            current=', '.join(f'stats.{counter}'
+                              for counter in self.counters),
+            recounted=', '.join(f'EXCLUDED.{counter}'
+                                for counter in self.counters))
+        with connections[self.db].cursor() as cursor:
+            cursor.execute(sql, [
+                ContentType.objects.get_for_model(article).pk,
+                reaction.LIKE])
+            return cursor.rowcount
+
+
+class ProfileStats(models.Model):
+    """
+    The counts shown on a profile and on its author summaries, maintained as
+    follows, articles and article likes come and go so that reading them
+    needs no aggregate query. Profiles get a row on their first change
+    """
+    profile = models.OneToOneField(Profile, on_delete=models.CASCADE,
+                                   primary_key=True, related_name='stats')
+    followers_count = models.IntegerField(default=0)
+    following_count = models.IntegerField(default=0)
+    articles_count = models.IntegerField(default=0)
+    likes_received = models.IntegerField(default=0)
+
+    objects = ProfileStatsManager()
+
+    @classmethod
+    def of(cls, profile):
+        """
+        of returns the stats of a profile, all zero if it has no row yet
+        """
+        return getattr(profile, 'stats', None) or cls(profile=profile)
+
+
 def user_post_save_reciever(*args, **kwargs):
     # Creates a profile after user has been registered
     created = kwargs.get("created")
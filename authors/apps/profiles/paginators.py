@@ -0,0 +1,13 @@
+from ..core.pagination import OptInCursorPagination
+
+
+class FollowCursorPagination(OptInCursorPagination):
+    """
+    Follower and following lists are always paged by cursor, newest follow
+    first, a popular author's are too long to be returned whole
+    """
+    page_size = 20
+    ordering = ('-id',)
+
+    def wants_cursor(self, request):
+        return True
@@ -1,20 +1,101 @@
+from django.db.models import Manager
 from rest_framework import serializers
-from .models import Profile
+from .models import Profile, ProfileStats
 from authors.apps.articles.models import Article
 
 
+def resolve_author_summaries(context, profiles):
+    """
+    resolve_author_summaries fetches the follow counts and viewer follow
+    state of the given profiles that the serializer context does not hold
+    yet, in one query
+    """
+    summaries = context.setdefault('author_summaries', {})
+    missing = {profile.pk for profile in profiles
+               if profile is not None} - set(summaries)
+    if missing:
+        request = context.get('request')
+        summaries.update(Profile.objects.follow_summaries(
+            getattr(request, 'user', None), missing))
+    return summaries
+
+
+def embedded_authors(serializer, instance):
+    """
+    embedded_authors returns the profiles `serializer` renders as author
+    summaries for `instance`, looking into its nested serializers
+    """
+    if isinstance(serializer, AuthorSummarySerializer):
+        return [instance]
+    authors = []
+    for field in serializer.fields.values():
+        if isinstance(field, serializers.Serializer):
+            value = field.get_attribute(instance)
+            if value is not None:
+                authors.extend(embedded_authors(field, value))
+    return authors
+
+
+class AuthorSummaryListSerializer(serializers.ListSerializer):
+    """
+    AuthorSummaryListSerializer resolves the summaries of every author
+    embedded in the page in one query before serializing the items. It
+    serves lists of profiles as well as lists of objects with
+    AuthorSummarySerializer fields
+    """
+
+    def to_representation(self, data):
+        items = list(data.all() if isinstance(data, Manager) else data)
+        resolve_author_summaries(self.context, [
+            author for item in items for author in self.authors_of(item)])
+        return super().to_representation(items)
+
+    def authors_of(self, item):
+        return embedded_authors(self.child, item)
+
+
+class AuthorSummarySerializer(serializers.ModelSerializer):
+    """
+    The compact profile embedded in articles, comments, replies and reports:
+    who the author is, how many follow them and whether the viewer does.
+    Their followers are paged through the profile's followers endpoint
+    """
+    followers_count = serializers.SerializerMethodField()
+    following_count = serializers.SerializerMethodField()
+    following = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Profile
+        fields = ("username", "first_name", "last_name", "image",
+                  "followers_count", "following_count", "following")
+        list_serializer_class = AuthorSummaryListSerializer
+
+    def get_summary(self, instance):
+        return resolve_author_summaries(self.context, [instance])[instance.pk]
+
+    def get_followers_count(self, instance):
+        return self.get_summary(instance)['followers_count']
+
+    def get_following_count(self, instance):
+        return self.get_summary(instance)['following_count']
+
+    def get_following(self, instance):
+        return self.get_summary(instance)['following']
+
+
 class ProfileSerializer(serializers.ModelSerializer):
     following = serializers.SerializerMethodField()
-    followers = serializers.SerializerMethodField()
-    followings = serializers.SerializerMethodField()
     number_of_followers = serializers.SerializerMethodField()
-    number_of_following = serializers.SerializerMethodField() 
+    number_of_following = serializers.SerializerMethodField()
+    number_of_articles = serializers.SerializerMethodField()
+    likes_received = serializers.SerializerMethodField()
 
     class Meta:
         model = Profile
         fields = ("username", "first_name", "last_name", "bio", "image",
-                  "following", "date_of_birth", "followers", "followings", 
-                  "number_of_followers", "number_of_following")
+                  "following", "date_of_birth",
+                  "number_of_followers", "number_of_following",
+                  "number_of_articles", "likes_received")
 
     def get_following(self, instance):
         """
@@ -26,25 +107,23 @@ class ProfileSerializer(serializers.ModelSerializer):
             return False
         if request.user.is_anonymous:
             return False
+        if hasattr(instance, 'viewer_follows'):
+            return bool(instance.viewer_follows)
         follower = request.user.profile
         followee = instance
         return follower.is_following(followee)
 
-    def get_followers(self, instance):
-        queryset = instance.followed_by.all()
-        followers = [follower.username for follower in queryset]
-        return followers
-
-    def get_followings(self, instance):
-        queryset = instance.follows.all()
-        followings = [following.username for following in queryset]
-        return followings
-
     def get_number_of_following(self, instance):
-        return len(instance.follows.all())
+        return ProfileStats.of(instance).following_count
 
     def get_number_of_followers(self, instance):
-        return len(instance.followed_by.all())
+        return ProfileStats.of(instance).followers_count
+
+    def get_number_of_articles(self, instance):
+        return ProfileStats.of(instance).articles_count
+
+    def get_likes_received(self, instance):
+        return ProfileStats.of(instance).likes_received
 
     def validate(self, data):
         """
@@ -1,7 +1,7 @@
 from django.db.models.signals import m2m_changed
 from django.dispatch import Signal, receiver
 
-from authors.apps.profiles.models import Profile
+from authors.apps.profiles.models import Profile, ProfileStats
 
 # custom signal we shall send when a new follow action happens
 # the rationale for this custom signal is discussed in the articles app
@@ -22,3 +22,37 @@ def on_new_follower_added(sender, **kwargs):
                                           who_was_followed=Profile.objects.get(
                                               pk=person_i_have_followed),
                                           who_followed=kwargs['instance'])
+
+
+def follow_pairs(instance, reverse, pk_set):
+    """
+    follow_pairs turns the arguments of an m2m_changed signal into the
+    (follower id, followed id) pairs it is about
+    """
+    if reverse:
+        return [(pk, instance.pk) for pk in pk_set]
+    return [(instance.pk, pk) for pk in pk_set]
+
+
+@receiver(m2m_changed, sender=Profile.follows.through)
+def on_follows_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    keeps the follow counts of both sides of each follow in step. Django
+    only narrows pk_set down to the rows that change on an add, so the rows
+    about to be removed are locked and read beforehand
+    """
+    if action == 'post_add':
+        ProfileStats.objects.record_follows(
+            follow_pairs(instance, reverse, pk_set), 1)
+    elif action in ('pre_remove', 'pre_clear'):
+        side = 'to_profile' if reverse else 'from_profile'
+        follows = sender.objects.filter(**{side: instance})
+        if action == 'pre_remove':
+            other_side = 'from_profile' if reverse else 'to_profile'
+            follows = follows.filter(**{f'{other_side}__in': pk_set})
+        instance._removed_follows = list(follows.select_for_update()
+                                         .values_list('from_profile_id',
+                                                      'to_profile_id'))
+    elif action in ('post_remove', 'post_clear'):
+        ProfileStats.objects.record_follows(
+            instance.__dict__.pop('_removed_follows', []), -1)
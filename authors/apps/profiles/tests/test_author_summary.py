@@ -0,0 +1,89 @@
+from django.contrib.auth.models import AnonymousUser
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from authors.apps.authentication.models import User
+from authors.apps.profiles.models import Profile
+
+
+class TestAuthorSummary(APITestCase):
+    """
+    Tests the compact author summaries and the paged follow lists
+    """
+
+    def setUp(self):
+        self.author, self.viewer, *self.fans = [
+            User.objects.create_user(username=f'user{index}',
+                                     email=f'user{index}@mail.com',
+                                     password='ia83naJS').profile
+            for index in range(5)]
+        for fan in self.fans:
+            fan.follow(self.author)
+        self.viewer.follow(self.fans[0])
+        self.author.follow(self.fans[1])
+        self.client.force_authenticate(user=self.viewer.user)
+
+    def followers_url(self, profile):
+        return reverse('profiles:profile-followers',
+                       kwargs={'username': profile.username})
+
+    def test_summaries_are_resolved_in_one_query(self):
+        profile_ids = [profile.pk for profile in [self.author] + self.fans]
+        with self.assertNumQueries(1):
+            summaries = Profile.objects.follow_summaries(self.viewer.user,
+                                                         profile_ids)
+        self.assertEqual(summaries[self.author.pk], {
+            'followers_count': 3, 'following_count': 1, 'following': False})
+        self.assertEqual(summaries[self.fans[0].pk], {
+            'followers_count': 1, 'following_count': 1, 'following': True})
+
+    def test_anonymous_viewer_follows_nobody(self):
+        summaries = Profile.objects.follow_summaries(AnonymousUser(),
+                                                     [self.fans[0].pk])
+        self.assertFalse(summaries[self.fans[0].pk]['following'])
+
+    def test_followers_are_paged_newest_first(self):
+        response = self.client.get(self.followers_url(self.author),
+                                   {'limit': 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([fan['username'] for fan in
+                          response.data['followers']], ['user4', 'user3'])
+        self.assertTrue(response.data['followers'][0].keys() >= {
+            'followers_count', 'following_count', 'following'})
+        response = self.client.get(response.data['next'])
+        self.assertEqual([fan['following'] for fan in
+                          response.data['followers']], [True])
+        self.assertIsNone(response.data['next'])
+
+    def test_follower_pages_cost_the_same_whatever_their_size(self):
+        with self.assertNumQueries(3):
+            # the profile, the page and the summaries
+            self.client.get(self.followers_url(self.author))
+        self.viewer.follow(self.author)
+        self.fans[0].follow(self.fans[1])
+        with self.assertNumQueries(3):
+            response = self.client.get(self.followers_url(self.author))
+        self.assertEqual(len(response.data['followers']), 4)
+
+    def test_following_lists_whom_a_user_follows(self):
+        response = self.client.get(reverse(
+            'profiles:profile-following',
+            kwargs={'username': self.author.username}))
+        self.assertEqual([profile['username'] for profile in
+                          response.data['following']], ['user3'])
+
+    def test_follow_lists_of_a_missing_profile(self):
+        response = self.client.get(reverse(
+            'profiles:profile-followers', kwargs={'username': 'missing'}))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_profile_carries_counts_not_follower_lists(self):
+        response = self.client.get(reverse(
+            'profiles:profile-detail-update',
+            kwargs={'username': self.author.username}))
+        profile = response.data['profile']
+        self.assertEqual(profile['number_of_followers'], 3)
+        self.assertEqual(profile['number_of_following'], 1)
+        self.assertNotIn('followers', profile)
+        self.assertNotIn('followings', profile)
@@ -0,0 +1,95 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from authors.apps.articles.models import Article
+from authors.apps.authentication.models import User
+from authors.apps.profiles.models import ProfileStats
+
+
+class TestProfileStats(APITestCase):
+    """
+    Tests keeping the denormalized profile statistics in step
+    """
+
+    def setUp(self):
+        self.author, self.fan, self.other = [
+            User.objects.create_user(username=f'user{index}',
+                                     email=f'user{index}@mail.com',
+                                     password='ia83naJS').profile
+            for index in range(3)]
+
+    def stats(self, profile):
+        stats = ProfileStats.of(type(profile).objects.get(pk=profile.pk))
+        return (stats.followers_count, stats.following_count,
+                stats.articles_count, stats.likes_received)
+
+    def write_article(self):
+        return Article.objects.create(author=self.author, title='whale',
+                                      description='fish', body='In water')
+
+    def test_follows_are_counted_on_both_sides(self):
+        self.fan.follow(self.author)
+        self.other.follow(self.author)
+        self.fan.follow(self.author)
+        self.assertEqual(self.stats(self.author)[:2], (2, 0))
+        self.assertEqual(self.stats(self.fan)[:2], (0, 1))
+        self.author.followed_by.remove(self.fan, self.author)
+        self.fan.unfollow(self.author)
+        self.assertEqual(self.stats(self.author)[:2], (1, 0))
+        self.assertEqual(self.stats(self.fan)[:2], (0, 0))
+        self.author.followed_by.clear()
+        self.assertEqual(self.stats(self.author)[:2], (0, 0))
+        self.assertEqual(self.stats(self.other)[:2], (0, 0))
+
+    def test_articles_and_their_likes_are_counted(self):
+        article = self.write_article()
+        self.write_article()
+        Article.objects.add_reaction(self.fan.user, article, 'like')
+        Article.objects.add_reaction(self.other.user, article, 'like')
+        Article.objects.add_reaction(self.other.user, article, 'dislike')
+        self.assertEqual(self.stats(self.author)[2:], (2, 1))
+        Article.objects.remove_reaction(self.fan.user, article, 'like')
+        Article.objects.add_reaction(self.other.user, article, 'like')
+        self.assertEqual(self.stats(self.author)[2:], (2, 1))
+        article.delete()
+        self.assertEqual(self.stats(self.author)[2:], (1, 0))
+
+    def test_deleting_an_author_with_articles(self):
+        self.write_article()
+        self.author.user.delete()
+        self.assertFalse(ProfileStats.objects.filter(
+            pk=self.author.pk).exists())
+
+    def test_reconcile_command_repairs_drifted_stats(self):
+        self.fan.follow(self.author)
+        self.write_article()
+        ProfileStats.objects.filter(pk=self.author.pk).update(
+            followers_count=7, articles_count=0)
+        ProfileStats.objects.filter(pk=self.fan.pk).delete()
+        out = StringIO()
+        call_command('reconcile_profile_stats', stdout=out)
+        self.assertIn('Reconciled the stats of 3 profile(s)', out.getvalue())
+        self.assertEqual(self.stats(self.author), (1, 0, 1, 0))
+        self.assertEqual(self.stats(self.fan), (0, 1, 0, 0))
+        self.assertEqual(ProfileStats.objects.reconcile(), 0)
+
+    def test_profile_page_reads_the_stats_without_counting(self):
+        self.fan.follow(self.author)
+        self.write_article()
+        self.client.force_authenticate(user=self.fan.user)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse(
+                'profiles:profile-detail-update',
+                kwargs={'username': self.author.username}))
+        self.assertFalse([query for query in queries.captured_queries
+                          if 'COUNT(' in query['sql'].upper()])
+        profile = response.data['profile']
+        self.assertEqual(profile['number_of_followers'], 1)
+        self.assertEqual(profile['number_of_articles'], 1)
+        self.assertEqual(profile['likes_received'], 0)
+        self.assertTrue(profile['following'])
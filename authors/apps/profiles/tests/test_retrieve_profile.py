@@ -1,3 +1,4 @@
+import json
 from rest_framework import status
 from django.urls import reverse
 from .base_test import BaseTest
@@ -50,5 +51,6 @@ class TestRetrieveProfile(BaseTest):
             reverse("profiles:profile-list"),
             HTTP_AUTHORIZATION=f"Bearer {self.token}"
         )
-        self.assertIn("username", response.data["profiles"][0])
+        profiles = json.loads(b''.join(response.streaming_content))
+        self.assertIn("username", profiles["profiles"][0])
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -1,11 +1,26 @@
 import json
+import shutil
+import tempfile
+
 from rest_framework import status
+from django.test import override_settings
 from django.urls import reverse
 from .test_data.profile_data import *
 from .base_test import BaseTest
 
+# uploaded profile images go here, not into the project's media folder
+MEDIA_ROOT = tempfile.mkdtemp()
+
 
+@override_settings(
+    MEDIA_ROOT=MEDIA_ROOT,
+    DEFAULT_FILE_STORAGE='django.core.files.storage.FileSystemStorage')
 class TestUpdateProfile(BaseTest):
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+        super().tearDownClass()
+
     def test_patch_profile_successfully(self):
         response = self.client.put(self.url,
                                    data=json.dumps(valid_partial_profile_data),
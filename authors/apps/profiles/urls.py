@@ -4,6 +4,8 @@ from .views import (
     ProfileFollowAPIView,
     ProfileFollowersAPIView,
     ProfileFollowingAPIView,
+    ProfileFollowersListAPIView,
+    ProfileFollowingListAPIView,
     UserProfileListAPIView,
     ReadStatsView
 )
@@ -19,6 +21,10 @@ urlpatterns = [
          name="following"),
     path("follow/followers", ProfileFollowersAPIView.as_view(),
          name="followers"),
+    path("<username>/followers", ProfileFollowersListAPIView.as_view(),
+         name="profile-followers"),
+    path("<username>/following", ProfileFollowingListAPIView.as_view(),
+         name="profile-following"),
     path("", UserProfileListAPIView.as_view(),
          name="profile-list"),
     path('user/readstats', ReadStatsView.as_view(),
@@ -1,3 +1,4 @@
+from django.db.models import Prefetch
 from django.shortcuts import get_object_or_404
 from rest_framework import generics, status, permissions
 from rest_framework.response import Response
@@ -5,12 +6,14 @@ from rest_framework.permissions import IsAuthenticated, AllowAny
 
 from authors.apps.authentication.models import User
 from authors.apps.profiles.exceptions import ProfileDoesNotExist
-from .serializers import ProfileSerializer
+from .serializers import AuthorSummarySerializer, ProfileSerializer
 from .models import Profile
+from .paginators import FollowCursorPagination
 from .permissions import IsObjectOwner
 from .renderers import ReadStatsJsonRenderer
 from authors.apps.articles.models import ReadStats
 from authors.apps.articles.serializers import ReadStatsSerializer
+from authors.apps.core.streaming import StreamingJSONListResponse
 
 
 class ProfileRetrieveUpdateView(generics.GenericAPIView):
@@ -19,7 +22,8 @@ class ProfileRetrieveUpdateView(generics.GenericAPIView):
 
     def get_object(self, username):
         try:
-            profile = Profile.objects.get(username=username)
+            profile = Profile.objects.select_related('stats').get(
+                username=username)
         except Profile.DoesNotExist:
             profile = None
         return profile
@@ -144,14 +148,8 @@ class ProfileFollowingAPIView(generics.GenericAPIView):
     def get(self, request):
         user = self.request.user
         profile = user.profile
-        queryset = Profile.objects.get(user__email=user.email).follows.all()
-
-        following = []
-        for followee in queryset:
-            followee_name = User.objects.get(username=followee)
-            followee_username = followee_name.username
-            following.append(followee_username)
-        if following is None or following == []:
+        following = list(profile.follows.values_list('username', flat=True))
+        if not following:
             msg = {
                 'message': 'You are not following anyone.',
                 'status': status.HTTP_204_NO_CONTENT}
@@ -169,14 +167,9 @@ class ProfileFollowersAPIView(generics.GenericAPIView):
     def get(self, request):
         user = self.request.user
         profile = user.profile
-        queryset = Profile.objects.get(user__email=user.email).followed_by.all()
-
-        followers = []
-        for follower in queryset:
-            follower_name = User.objects.get(username=follower)
-            follower_username = follower_name.username
-            followers.append(follower_username)
-        if followers is None or followers == []:
+        followers = list(
+            profile.followed_by.values_list('username', flat=True))
+        if not followers:
             msg = {
                 'message': 'You have no followers.',
                 'status': status.HTTP_204_NO_CONTENT}
@@ -187,6 +180,50 @@ class ProfileFollowersAPIView(generics.GenericAPIView):
         return Response(data=msg, status=status.HTTP_200_OK)
 
 
+class ProfileFollowListAPIView(generics.GenericAPIView):
+    """
+    Pages through the profiles following, or followed by, a user, newest
+    follow first. Each profile is the summary embedded in articles, resolved
+    for the whole page in one query
+    """
+    permission_classes = (permissions.IsAuthenticated,)
+    serializer_class = AuthorSummarySerializer
+    pagination_class = FollowCursorPagination
+    # the side of the follow row the user is on, and the side that is listed
+    user_side = None
+    listed_side = None
+    key = None
+
+    def get(self, request, username):
+        profile = get_object_or_404(Profile.objects.only('pk'),
+                                    username=username)
+        follows = Profile.follows.through.objects.filter(
+            **{self.user_side: profile}).select_related(self.listed_side)
+        page = self.paginate_queryset(follows)
+        serializer = self.serializer_class(
+            [getattr(follow, self.listed_side) for follow in page],
+            many=True, context={'request': request})
+        return Response({
+            self.key: serializer.data,
+            "next": self.paginator.get_next_link(),
+            "previous": self.paginator.get_previous_link(),
+            "status": status.HTTP_200_OK}, status=status.HTTP_200_OK)
+
+
+class ProfileFollowersListAPIView(ProfileFollowListAPIView):
+    # This class pages through the profiles following a user.
+    user_side = 'to_profile'
+    listed_side = 'from_profile'
+    key = 'followers'
+
+
+class ProfileFollowingListAPIView(ProfileFollowListAPIView):
+    # This class pages through the profiles a user follows.
+    user_side = 'from_profile'
+    listed_side = 'to_profile'
+    key = 'following'
+
+
 class UserProfileListAPIView(generics.ListAPIView):
     """
     This class return all user profiles in the available in the database
@@ -195,15 +232,16 @@ class UserProfileListAPIView(generics.ListAPIView):
     serializer_class = ProfileSerializer
 
     def get(self, request):
-        profiles = Profile.objects.all()
-        serializer = self.serializer_class(profiles, many=True,
-                                           context={
-                                               'request': request})
-        response_data = {
-            "profiles": serializer.data,
-            "message": "Successfully returned all users profiles"
-        }
-        return Response(response_data, status=status.HTTP_200_OK)
+        profiles = Profile.objects.select_related('stats').order_by('id')\
+            .prefetch_related(
+                Prefetch('followed_by',
+                         queryset=Profile.objects.filter(
+                             user=request.user),
+                         to_attr='viewer_follows'))
+        return StreamingJSONListResponse(
+            profiles, self.serializer_class, 'profiles',
+            context={'request': request},
+            extra={"message": "Successfully returned all users profiles"})
 
 
 class ReadStatsView(generics.ListAPIView):
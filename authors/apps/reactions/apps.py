@@ -0,0 +1,6 @@
+from django.apps import AppConfig
+
+
+class ReactionsConfig(AppConfig):
+    name = 'authors.apps.reactions'
+    verbose_name = 'Reactions'
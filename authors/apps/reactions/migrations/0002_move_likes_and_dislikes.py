@@ -0,0 +1,85 @@
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+LIKE = 1
+DISLIKE = -1
+
+# the models whose like and dislike M2M tables move into reactions
+TARGETS = (('articles', 'article'), ('comments', 'comment'))
+RELATIONS = (('liked_by', LIKE), ('disliked_by', DISLIKE))
+
+# likes are moved first, so a user found in both tables keeps their like
+MOVE_SQL = """
+    INSERT INTO reactions_reaction (user_id, content_type_id, object_id,
+                                    reaction, reacted_at)
+    SELECT user_id, %s, {target}, %s, now() FROM {table}
+    ON CONFLICT (user_id, content_type_id, object_id) DO NOTHING
+"""
+
+RESTORE_SQL = """
+    INSERT INTO {table} ({target}, user_id)
+    SELECT object_id, user_id FROM reactions_reaction
+    WHERE content_type_id = %s AND reaction = %s
+"""
+
+
+def relation_tables(apps):
+    """yields each M2M table to move with its target column and reaction"""
+    ContentType = apps.get_model('contenttypes', 'ContentType')
+    for app_label, model_name in TARGETS:
+        model = apps.get_model(app_label, model_name)
+        content_type, _ = ContentType.objects.get_or_create(
+            app_label=app_label, model=model_name)
+        for relation, reaction in RELATIONS:
+            through = model._meta.get_field(relation).remote_field.through
+            yield (model, content_type, through._meta.db_table,
+                   through._meta.get_field(model_name).column, reaction)
+
+
+def move_reactions(apps, schema_editor):
+    """copy every like and dislike into reactions and recount the targets"""
+    Reaction = apps.get_model('reactions', 'Reaction')
+    with schema_editor.connection.cursor() as cursor:
+        for model, content_type, table, target, reaction in \
+                relation_tables(apps):
+            cursor.execute(MOVE_SQL.format(table=table, target=target),
+                           [content_type.pk, reaction])
+
+    def total(content_type, reaction):
+        return Coalesce(Subquery(
+            Reaction.objects.filter(
+                content_type=content_type, object_id=OuterRef('pk'),
+                reaction=reaction).order_by()
+            .values('object_id').annotate(total=Count('pk')).values('total'),
+            output_field=models.IntegerField()), 0)
+
+    ContentType = apps.get_model('contenttypes', 'ContentType')
+    for app_label, model_name in TARGETS:
+        content_type = ContentType.objects.get(app_label=app_label,
+                                               model=model_name)
+        apps.get_model(app_label, model_name).objects.update(
+            like_count=total(content_type, LIKE),
+            dislike_count=total(content_type, DISLIKE))
+
+
+def restore_reactions(apps, schema_editor):
+    """copy reactions back into the like and dislike M2M tables"""
+    with schema_editor.connection.cursor() as cursor:
+        for model, content_type, table, target, reaction in \
+                relation_tables(apps):
+            cursor.execute(RESTORE_SQL.format(table=table, target=target),
+                           [content_type.pk, reaction])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reactions', '0001_initial'),
+        ('articles', '0014_article_body_summary'),
+        ('comments', '0007_comment_reaction_counters'),
+    ]
+
+    operations = [
+        migrations.RunPython(move_reactions, restore_reactions),
+    ]
@@ -0,0 +1,158 @@
+from django.conf import settings
+from django.contrib.contenttypes.fields import GenericForeignKey
+from django.contrib.contenttypes.models import ContentType
+from django.db import connections, models, transaction
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from .signals import reaction_added_signal
+
+
+class ReactionManager(models.Manager):
+    """
+    ReactionManager is the reactions service. It records, undoes and looks up
+    a user's reaction to any target, keeping the target's like and dislike
+    counters in step through the target manager's adjust_counters
+    """
+    # inserts the reaction, or switches an existing one to it, in a single
+    # statement. No row comes back when the user already had this reaction;
+    # xmax is 0 only on rows the statement inserted rather than updated
+    upsert_sql = """
+        INSERT INTO {table} (user_id, content_type_id, object_id, reaction,
+                             reacted_at)
+        VALUES (%s, %s, %s, %s, now())
+        ON CONFLICT (user_id, content_type_id, object_id) DO UPDATE
+            SET reaction = EXCLUDED.reaction, reacted_at = EXCLUDED.reacted_at
+            WHERE {table}.reaction <> EXCLUDED.reaction
+        RETURNING xmax = 0
+    """
+
+    def for_model(self, model):
+        """
+        for_model returns the reactions to any instance of the given model
+        """
+        return self.filter(
+            content_type=ContentType.objects.get_for_model(model))
+
+    def for_target(self, target):
+        """
+        for_target returns the reactions to a single article or comment
+        """
+        return self.for_model(target).filter(object_id=target.pk)
+
+    def react(self, user, target, reaction):
+        """
+        react records a user's reaction to a target and returns the reaction
+        it replaced: None for a new reaction, the same reaction when the user
+        had already reacted that way, or the opposite one on a switch
+        """
+        content_type = ContentType.objects.get_for_model(target)
+        with transaction.atomic(using=self.db), \
+                connections[self.db].cursor() as cursor:
+            cursor.execute(
+                self.upsert_sql.format(table=self.model._meta.db_table),
+                [user.pk, content_type.pk, target.pk, reaction])
+            row = cursor.fetchone()
+            if row is None:
+                return reaction
+            # there are two reaction types, so an updated row held the other
+            previous = None if row[0] else self.model.opposite(reaction)
+            deltas = {self.model.counters[reaction]: 1}
+            if previous is not None:
+                deltas[self.model.counters[previous]] = -1
+            type(target).objects.adjust_counters(target.pk, **deltas)
+        reaction_added_signal.send(sender=type(target), target=target,
+                                   user=user, reaction=reaction)
+        return previous
+
+    def unreact(self, user, target, reaction):
+        """
+        unreact removes a user's reaction to a target if it is the given one
+        and returns whether there was anything to remove
+        """
+        with transaction.atomic(using=self.db):
+            deleted, _ = self.for_target(target).filter(
+                user=user, reaction=reaction).delete()
+            if deleted:
+                type(target).objects.adjust_counters(
+                    target.pk, **{self.model.counters[reaction]: -deleted})
+        return bool(deleted)
+
+    def reaction_of(self, user, target):
+        """
+        reaction_of returns the user's reaction to a target, or None
+        """
+        if user.is_anonymous:
+            return None
+        return self.for_target(target).filter(user=user).values_list(
+            'reaction', flat=True).first()
+
+    def reactions_of(self, user, model, object_ids):
+        """
+        reactions_of maps each of the given instances of `model` to the
+        user's reaction to it, or None, in a single query
+        """
+        reactions = dict.fromkeys(object_ids)
+        if user.is_anonymous or not reactions:
+            return reactions
+        reactions.update(self.for_model(model).filter(
+            user=user, object_id__in=list(reactions)).values_list(
+                'object_id', 'reaction'))
+        return reactions
+
+    def total_per_target(self, model, reaction):
+        """
+        total_per_target builds a correlated COUNT of the given reaction to
+        the outer row of `model`, for rebuilding its counters
+        """
+        return Coalesce(Subquery(
+            self.for_model(model).filter(
+                object_id=OuterRef('pk'), reaction=reaction).order_by()
+            .values('object_id').annotate(total=Count('pk')).values('total'),
+            output_field=models.IntegerField()), 0)
+
+
+class Reaction(models.Model):
+    """
+    A user's reaction to an article or a comment. A user holds at most one
+    reaction per target, so switching from a like to a dislike rewrites the
+    row instead of moving it between tables
+    """
+    LIKE = 1
+    DISLIKE = -1
+    TYPES = (
+        (LIKE, 'like'),
+        (DISLIKE, 'dislike'),
+    )
+    # the counter column each reaction drives on its target
+    counters = {
+        LIKE: 'like_count',
+        DISLIKE: 'dislike_count',
+    }
+
+    user = models.ForeignKey(settings.AUTH_USER_MODEL,
+                             on_delete=models.CASCADE,
+                             related_name='reactions')
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.PositiveIntegerField()
+    target = GenericForeignKey()
+    reaction = models.SmallIntegerField(choices=TYPES)
+    reacted_at = models.DateTimeField(auto_now=True)
+
+    objects = ReactionManager()
+
+    class Meta:
+        unique_together = ('user', 'content_type', 'object_id')
+        indexes = [models.Index(fields=['content_type', 'object_id'])]
+
+    def __str__(self):
+        return f'{self.user} {self.get_reaction_display()}s {self.target}'
+
+    @classmethod
+    def named(cls, name):
+        """named maps 'like' or 'dislike' to its reaction type"""
+        return {label: value for value, label in cls.TYPES}[name]
+
+    @classmethod
+    def opposite(cls, reaction):
+        return cls.DISLIKE if reaction == cls.LIKE else cls.LIKE
@@ -0,0 +1,7 @@
+"""Signals sent by the reactions module"""
+from django.dispatch import Signal
+
+# sent with the target's model class as sender whenever a user's reaction to
+# a target is added or switched, so apps can act on reactions to their own
+# models without the reactions app knowing about them
+reaction_added_signal = Signal(providing_args=["target", "user", "reaction"])
@@ -0,0 +1,88 @@
+from django.db import IntegrityError, connection
+from django.test.utils import CaptureQueriesContext
+
+from authors.apps.articles.models import Article
+from authors.apps.articles.tests import base_class
+from authors.apps.comments.models import Comment
+from authors.apps.notifications.models import Notification
+from authors.apps.reactions.models import Reaction
+
+
+class TestReactions(base_class.BaseTest):
+    """
+    Tests the reactions service shared by articles and comments
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.author, self.article = \
+            self.create_article_and_authenticate_test_user()
+        self.reader = self.create_another_user_in_db()
+        self.comment = Comment.objects.create(
+            body="Test comment", author=self.author.profile,
+            article=self.article)
+
+    def counters(self, target):
+        target.refresh_from_db(fields=['like_count', 'dislike_count'])
+        return target.like_count, target.dislike_count
+
+    def test_react_reports_the_reaction_it_replaced(self):
+        self.assertIsNone(
+            Reaction.objects.react(self.reader, self.article, Reaction.LIKE))
+        self.assertEqual(
+            Reaction.objects.react(self.reader, self.article, Reaction.LIKE),
+            Reaction.LIKE)
+        self.assertEqual(
+            Reaction.objects.react(self.reader, self.article,
+                                   Reaction.DISLIKE),
+            Reaction.LIKE)
+        self.assertEqual(Reaction.objects.for_target(self.article).count(), 1)
+        self.assertEqual(
+            Reaction.objects.reaction_of(self.reader, self.article),
+            Reaction.DISLIKE)
+
+    def test_counters_follow_reactions_on_every_target(self):
+        for target in (self.article, self.comment):
+            Reaction.objects.react(self.reader, target, Reaction.LIKE)
+            self.assertEqual(self.counters(target), (1, 0))
+            Reaction.objects.react(self.reader, target, Reaction.DISLIKE)
+            self.assertEqual(self.counters(target), (0, 1))
+            self.assertFalse(
+                Reaction.objects.unreact(self.reader, target, Reaction.LIKE))
+            self.assertTrue(Reaction.objects.unreact(
+                self.reader, target, Reaction.DISLIKE))
+            self.assertEqual(self.counters(target), (0, 0))
+
+    def test_switching_a_reaction_is_one_statement(self):
+        Reaction.objects.react(self.reader, self.comment, Reaction.DISLIKE)
+        with CaptureQueriesContext(connection) as queries:
+            Reaction.objects.react(self.reader, self.comment, Reaction.LIKE)
+        statements = [query['sql'] for query in queries.captured_queries
+                      if 'reactions_reaction' in query['sql']]
+        self.assertEqual(len(statements), 1)
+        self.assertIn('ON CONFLICT', statements[0])
+
+    def test_a_user_holds_one_reaction_per_target(self):
+        Reaction.objects.react(self.reader, self.comment, Reaction.LIKE)
+        with self.assertRaises(IntegrityError):
+            Reaction.objects.for_target(self.comment).create(
+                user=self.reader, object_id=self.comment.pk,
+                reaction=Reaction.DISLIKE)
+
+    def test_liking_a_comment_notifies_its_author(self):
+        Reaction.objects.react(self.reader, self.comment, Reaction.DISLIKE)
+        Reaction.objects.react(self.reader, self.comment, Reaction.LIKE)
+        Reaction.objects.react(self.reader, self.comment, Reaction.LIKE)
+        self.assertEqual(
+            Notification.objects.filter(title="Comment Liked").count(), 1)
+
+    def test_rebuilding_counters_recounts_reactions(self):
+        Reaction.objects.react(self.reader, self.article, Reaction.LIKE)
+        Article.objects.filter(pk=self.article.pk).update(like_count=10)
+        Article.objects.rebuild_counters()
+        self.assertEqual(self.counters(self.article), (1, 0))
+
+    def test_deleting_a_target_deletes_its_reactions(self):
+        Reaction.objects.react(self.reader, self.comment, Reaction.LIKE)
+        self.comment.delete()
+        self.assertFalse(Reaction.objects.exists())
@@ -12,6 +12,8 @@ https://docs.djangoproject.com/en/1.11/ref/settings/
 
 import os
 
+from celery.schedules import crontab
+
 # Build paths inside the project like this: os.path.join(BASE_DIR, ...)
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
@@ -37,6 +39,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
 
     'cloudinary_storage',
     'cloudinary',
@@ -55,6 +58,7 @@ INSTALLED_APPS = [
     'authors.apps.articles',
     'authors.apps.comments',
     'authors.apps.notifications',
+    'authors.apps.reactions',
 ]
 
 MIDDLEWARE = [
@@ -154,6 +158,42 @@ REST_FRAMEWORK = {
     ),
 }
 
+# Cache backend, e.g. django_redis.cache.RedisCache with a redis:// location
+# in production. Defaults to a per-process in-memory cache, on which anonymous
+# article responses are not cached (see ARTICLE_RESPONSE_CACHE_ALLOW_LOCAL).
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get(
+            'CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.environ.get('CACHE_LOCATION', 'authors-haven'),
+    }
+}
+
+# how long (in seconds) anonymous article list/detail responses are cached
+ARTICLE_RESPONSE_CACHE_TIMEOUT = int(
+    os.environ.get('ARTICLE_RESPONSE_CACHE_TIMEOUT', 60 * 5))
+
+# anonymous article responses are only cached on a backend all processes
+# share, since a per-process cache keeps serving responses another process
+# retired. Set to True to cache them on a per-process backend anyway, e.g.
+# in tests or with a single process
+ARTICLE_RESPONSE_CACHE_ALLOW_LOCAL = os.environ.get(
+    'ARTICLE_RESPONSE_CACHE_ALLOW_LOCAL', 'False') == 'True'
+
+# article reads are buffered in each process and recorded in batches of up to
+# READ_EVENTS_BATCH_SIZE, at most READ_EVENTS_FLUSH_INTERVAL seconds late
+READ_EVENTS_BATCH_SIZE = int(os.environ.get('READ_EVENTS_BATCH_SIZE', 500))
+READ_EVENTS_FLUSH_INTERVAL = float(
+    os.environ.get('READ_EVENTS_FLUSH_INTERVAL', 5))
+
+# followers are added to a notification and emailed in batches of this many
+NOTIFICATION_FAN_OUT_BATCH_SIZE = int(
+    os.environ.get('NOTIFICATION_FAN_OUT_BATCH_SIZE', 1000))
+
+# a notification digest lists at most this many notifications in full
+NOTIFICATION_DIGEST_MAX_ITEMS = int(
+    os.environ.get('NOTIFICATION_DIGEST_MAX_ITEMS', 20))
+
 # endpoint to hit for media files
 MEDIA_URL = '/media/'
 
@@ -165,6 +205,12 @@ EMAIL_HOST_PASSWORD = os.environ.get('USER_PASSWORD')
 EMAIL_PORT = 587
 EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
 DEFAULT_FROM_EMAIL = EMAIL_HOST_USER
+# emails go out in batches over one connection, at most EMAIL_SEND_RATE a
+# second (0 for no limit). Those that fail are tried again up to
+# EMAIL_SEND_MAX_RETRIES times, EMAIL_SEND_RETRY_DELAY seconds apart
+EMAIL_SEND_RATE = float(os.environ.get('EMAIL_SEND_RATE', 0))
+EMAIL_SEND_MAX_RETRIES = int(os.environ.get('EMAIL_SEND_MAX_RETRIES', 3))
+EMAIL_SEND_RETRY_DELAY = int(os.environ.get('EMAIL_SEND_RETRY_DELAY', 60))
 
 # celery settings
 
@@ -179,3 +225,17 @@ CELERY_BROKER_TRANSPORT_OPTIONS = {
     'interval_step': 0.5,
     'interval_max': 5,
 }
+# users on hourly digests get theirs on the hour, those on daily digests
+# every morning
+CELERY_BEAT_SCHEDULE = {
+    'hourly-notification-digests': {
+        'task': 'authors.apps.notifications.tasks.send_email_digests',
+        'schedule': crontab(minute=0),
+        'args': ('hourly',),
+    },
+    'daily-notification-digests': {
+        'task': 'authors.apps.notifications.tasks.send_email_digests',
+        'schedule': crontab(minute=0, hour=7),
+        'args': ('daily',),
+    },
+}
@@ -34,5 +34,7 @@ urlpatterns = [
                                           namespace='notifications')),
     path('api/v1/bookmarks', views.BookmarkAPIView.as_view(),
          name='bookmarks'),
+    path('api/v1/bookmarks/sync', views.BookmarkSyncAPIView.as_view(),
+         name='bookmarks-sync'),
     path('', schema_view.with_ui('swagger'), name='schema-swagger-ui')
 ] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)